@@ -36,25 +36,29 @@ OPTIMIZATION_LEVEL = Configuration.options["qiskit"]["optimization_level"]
 class TestWorkoutAbstractHamiltonians(WorkoutAbstractHamiltonians):
     @pytest.mark.parametrize("circ_and_topo", HAM_TOPO, ids=HAM_TOPO_NAMES)
     def test_hamiltonians(self, benchmark, circ_and_topo):
-        circuit = generate_hamiltonian_circuit(
-            circ_and_topo[0].pop("ham_hamlib_hamiltonian"), benchmark
-        )
+        circuit = generate_hamiltonian_circuit(circ_and_topo[0].operator(), benchmark)
         input_circuit_properties(circuit, benchmark)
         BACKEND = BqskitFlexibleBackend(circuit.num_qudits, circ_and_topo[1])
         TWO_Q_GATE = BACKEND.two_q_gate_type
         compiler = Compiler()
 
         @benchmark
-        def result():
-            new_circ = compile(
+        def compiled():
+            return compile(
                 circuit,
                 model=BACKEND,
                 optimization_level=OPTIMIZATION_LEVEL,
                 compiler=compiler,
+                with_mapping=True,
             )
-            return new_circ
 
         compiler.close()
+        result, initial_mapping, final_mapping = compiled
         benchmark.extra_info.update(circ_and_topo[0])
         output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        assert circuit_validator(
+            result,
+            BACKEND,
+            input_circuit=circuit,
+            layout=(initial_mapping, final_mapping),
+        )
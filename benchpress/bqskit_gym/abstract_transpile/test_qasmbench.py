@@ -15,7 +15,10 @@ import pytest
 
 from bqskit import compile
 from bqskit.compiler import Compiler
-from benchpress.utilities.io import qasm_circuit_loader, output_circuit_properties
+from benchpress.utilities.io import (
+    cached_qasm_circuit_loader,
+    output_circuit_properties,
+)
 from benchpress.utilities.validation import circuit_validator
 from benchpress.workouts.validation import benchpress_test_validation
 from benchpress.config import Configuration
@@ -42,66 +45,84 @@ OPTIMIZATION_LEVEL = Configuration.options["bqskit"]["optimization_level"]
 class TestWorkoutAbstractQasmBenchSmall(WorkoutAbstractQasmBenchSmall):
     @pytest.mark.parametrize("circ_and_topo", SMALL_CIRC_TOPO, ids=SMALL_NAMES)
     def test_QASMBench_small(self, benchmark, circ_and_topo):
-        circuit = qasm_circuit_loader(circ_and_topo[0], benchmark)
+        circuit = cached_qasm_circuit_loader(circ_and_topo[0], benchmark)
         BACKEND = BqskitFlexibleBackend(circuit.num_qudits, circ_and_topo[1])
         compiler = Compiler()
 
         @benchmark
-        def result():
-            new_circ = compile(
+        def compiled():
+            return compile(
                 circuit,
                 model=BACKEND,
                 optimization_level=OPTIMIZATION_LEVEL,
                 compiler=compiler,
+                with_mapping=True,
             )
-            return new_circ
 
         compiler.close()
+        result, initial_mapping, final_mapping = compiled
         output_circuit_properties(result, BACKEND.two_q_gate_type, benchmark)
-        assert circuit_validator(result, BACKEND)
+        assert circuit_validator(
+            result,
+            BACKEND,
+            input_circuit=circuit,
+            layout=(initial_mapping, final_mapping),
+        )
 
 
 @benchpress_test_validation
 class TestWorkoutAbstractQasmBenchMedium(WorkoutAbstractQasmBenchMedium):
     @pytest.mark.parametrize("circ_and_topo", MEDIUM_CIRC_TOPO, ids=MEDIUM_NAMES)
     def test_QASMBench_medium(self, benchmark, circ_and_topo):
-        circuit = qasm_circuit_loader(circ_and_topo[0], benchmark)
+        circuit = cached_qasm_circuit_loader(circ_and_topo[0], benchmark)
         BACKEND = BqskitFlexibleBackend(circuit.num_qudits, circ_and_topo[1])
         compiler = Compiler()
 
         @benchmark
-        def result():
-            new_circ = compile(
+        def compiled():
+            return compile(
                 circuit,
                 model=BACKEND,
                 optimization_level=OPTIMIZATION_LEVEL,
                 compiler=compiler,
+                with_mapping=True,
             )
-            return new_circ
 
         compiler.close()
+        result, initial_mapping, final_mapping = compiled
         output_circuit_properties(result, BACKEND.two_q_gate_type, benchmark)
-        assert circuit_validator(result, BACKEND)
+        assert circuit_validator(
+            result,
+            BACKEND,
+            input_circuit=circuit,
+            layout=(initial_mapping, final_mapping),
+        )
 
 
 @benchpress_test_validation
 class TestWorkoutAbstractQasmBenchLarge(WorkoutAbstractQasmBenchLarge):
     @pytest.mark.parametrize("circ_and_topo", LARGE_CIRC_TOPO, ids=LARGE_NAMES)
     def test_QASMBench_large(self, benchmark, circ_and_topo):
-        circuit = qasm_circuit_loader(circ_and_topo[0], benchmark)
+        circuit = cached_qasm_circuit_loader(circ_and_topo[0], benchmark)
         BACKEND = BqskitFlexibleBackend(circuit.num_qudits, circ_and_topo[1])
         compiler = Compiler()
 
         @benchmark
-        def result():
-            new_circ = compile(
+        def compiled():
+            return compile(
                 circuit,
                 model=BACKEND,
                 optimization_level=OPTIMIZATION_LEVEL,
                 compiler=compiler,
+                with_mapping=True,
             )
-            return new_circ
 
         compiler.close()
+        result, initial_mapping, final_mapping = compiled
         output_circuit_properties(result, BACKEND.two_q_gate_type, benchmark)
-        assert circuit_validator(result, BACKEND)
+        assert circuit_validator(
+            result,
+            BACKEND,
+            input_circuit=circuit,
+            layout=(initial_mapping, final_mapping),
+        )
@@ -10,51 +10,58 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 """Test transpilation against a device"""
-import os
 import pytest
 from bqskit import compile
 from bqskit.compiler import Compiler
 
-from benchpress.utilities.io import qasm_circuit_loader, output_circuit_properties
+from benchpress.utilities.io import (
+    cached_qasm_circuit_loader,
+    output_circuit_properties,
+)
 from benchpress.utilities.validation import circuit_validator
 from benchpress.config import Configuration
 from benchpress.workouts.validation import benchpress_test_validation
-from benchpress.workouts.device_transpile import WorkoutDeviceFeynman
+from benchpress.workouts.device_transpile import (
+    WorkoutDeviceFeynman,
+    feynman_parameters,
+)
 
 
-BACKEND = Configuration.backend()
-TWO_Q_GATE = BACKEND.two_q_gate_type
 OPTIMIZATION_LEVEL = Configuration.options["bqskit"]["optimization_level"]
 
 
 def pytest_generate_tests(metafunc):
-    directory = Configuration.get_qasm_dir("feynman")
-    file_list = [x for x in os.listdir(directory) if x.endswith(".qasm")]
-    metafunc.parametrize("filename", file_list)
+    metafunc.parametrize("filename", feynman_parameters())
 
 
 @benchpress_test_validation
 class TestWorkoutDeviceFeynman(WorkoutDeviceFeynman):
 
-    def test_feynman_transpile(self, benchmark, filename):
+    def test_feynman_transpile(self, benchmark, filename, backend):
         """Transpile a feynman benchmark qasm file against a target device"""
-        circuit = qasm_circuit_loader(
+        circuit = cached_qasm_circuit_loader(
             f"{Configuration.get_qasm_dir('feynman')}{filename}", benchmark
         )
-        if circuit.num_qudits > BACKEND.num_qudits:
+        if circuit.num_qudits > backend.num_qudits:
             pytest.skip("Circuit too large for given backend.")
         compiler = Compiler()
 
         @benchmark
-        def result():
-            new_circ = compile(
+        def compiled():
+            return compile(
                 circuit,
-                model=BACKEND,
+                model=backend,
                 optimization_level=OPTIMIZATION_LEVEL,
                 compiler=compiler,
+                with_mapping=True,
             )
-            return new_circ
 
         compiler.close()
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        result, initial_mapping, final_mapping = compiled
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(
+            result,
+            backend,
+            input_circuit=circuit,
+            layout=(initial_mapping, final_mapping),
+        )
@@ -22,7 +22,7 @@ from benchpress.bqskit_gym.circuits import (
 )
 from benchpress.config import Configuration
 from benchpress.utilities.io import (
-    qasm_circuit_loader,
+    cached_qasm_circuit_loader,
     input_circuit_properties,
     output_circuit_properties,
 )
@@ -31,116 +31,144 @@ from benchpress.workouts.validation import benchpress_test_validation
 from benchpress.workouts.device_transpile import WorkoutDeviceTranspile100Q
 
 
-BACKEND = Configuration.backend()
-TWO_Q_GATE = BACKEND.two_q_gate_type
 OPTIMIZATION_LEVEL = Configuration.options["bqskit"]["optimization_level"]
 
 
 @benchpress_test_validation
 class TestWorkoutDeviceTranspile100Q(WorkoutDeviceTranspile100Q):
-    def test_QFT_100_transpile(self, benchmark):
+    def test_QFT_100_transpile(self, benchmark, backend):
         """Compile 100Q QFT circuit against target backend"""
-        circuit = qasm_circuit_loader(
+        circuit = cached_qasm_circuit_loader(
             Configuration.get_qasm_dir("qft") + "qft_N100.qasm", benchmark
         )
         compiler = Compiler()
 
         @benchmark
-        def result():
-            new_circ = compile(
+        def compiled():
+            return compile(
                 circuit,
-                model=BACKEND,
+                model=backend,
                 optimization_level=OPTIMIZATION_LEVEL,
                 compiler=compiler,
+                with_mapping=True,
             )
-            return new_circ
 
         compiler.close()
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        result, initial_mapping, final_mapping = compiled
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(
+            result,
+            backend,
+            input_circuit=circuit,
+            layout=(initial_mapping, final_mapping),
+        )
 
-    def test_QV_100_transpile(self, benchmark):
+    def test_QV_100_transpile(self, benchmark, backend):
         """Compile 10Q QV circuit against target backend"""
         circuit = bqskit_QV(100, 100, seed=12345)
         compiler = Compiler()
 
         @benchmark
-        def result():
-            new_circ = compile(
+        def compiled():
+            return compile(
                 circuit,
-                model=BACKEND,
+                model=backend,
                 optimization_level=OPTIMIZATION_LEVEL,
                 compiler=compiler,
+                with_mapping=True,
             )
-            return new_circ
 
         compiler.close()
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        result, initial_mapping, final_mapping = compiled
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(
+            result,
+            backend,
+            input_circuit=circuit,
+            layout=(initial_mapping, final_mapping),
+        )
 
-    def test_circSU2_89_transpile(self, benchmark):
+    def test_circSU2_89_transpile(self, benchmark, backend):
         """Compile 89Q circSU2 circuit against target backend"""
         circuit = bqskit_circSU2(89, 3)
         input_circuit_properties(circuit, benchmark)
         compiler = Compiler()
 
         @benchmark
-        def result():
-            new_circ = compile(
+        def compiled():
+            return compile(
                 circuit,
-                model=BACKEND,
+                model=backend,
                 optimization_level=OPTIMIZATION_LEVEL,
                 compiler=compiler,
+                with_mapping=True,
             )
-            return new_circ
 
         compiler.close()
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        result, initial_mapping, final_mapping = compiled
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(
+            result,
+            backend,
+            input_circuit=circuit,
+            layout=(initial_mapping, final_mapping),
+        )
 
-    def test_circSU2_100_transpile(self, benchmark):
+    def test_circSU2_100_transpile(self, benchmark, backend):
         """Compile 100Q circSU2 circuit against target backend"""
         circuit = bqskit_circSU2(100, 3)
         input_circuit_properties(circuit, benchmark)
         compiler = Compiler()
 
         @benchmark
-        def result():
-            new_circ = compile(
+        def compiled():
+            return compile(
                 circuit,
-                model=BACKEND,
+                model=backend,
                 optimization_level=OPTIMIZATION_LEVEL,
                 compiler=compiler,
+                with_mapping=True,
             )
-            return new_circ
 
         compiler.close()
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        result, initial_mapping, final_mapping = compiled
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(
+            result,
+            backend,
+            input_circuit=circuit,
+            layout=(initial_mapping, final_mapping),
+        )
 
-    def test_BV_100_transpile(self, benchmark):
+    def test_BV_100_transpile(self, benchmark, backend):
         """Compile 100Q BV circuit against target backend"""
         circuit = bqskit_bv_all_ones(100)
         input_circuit_properties(circuit, benchmark)
         compiler = Compiler()
 
         @benchmark
-        def result():
-            new_circ = compile(
+        def compiled():
+            return compile(
                 circuit,
-                model=BACKEND,
+                model=backend,
                 optimization_level=OPTIMIZATION_LEVEL,
                 compiler=compiler,
+                with_mapping=True,
             )
-            return new_circ
 
         compiler.close()
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        result, initial_mapping, final_mapping = compiled
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(
+            result,
+            backend,
+            input_circuit=circuit,
+            layout=(initial_mapping, final_mapping),
+        )
 
-    def test_square_heisenberg_100_transpile(self, benchmark):
+    def test_square_heisenberg_100_transpile(self, benchmark, backend):
         """Compile 100Q square-Heisenberg circuit against target backend"""
-        circuit = qasm_circuit_loader(
+        circuit = cached_qasm_circuit_loader(
             Configuration.get_qasm_dir("square-heisenberg")
             + "square_heisenberg_N100.qasm",
             benchmark,
@@ -148,42 +176,54 @@ class TestWorkoutDeviceTranspile100Q(WorkoutDeviceTranspile100Q):
         compiler = Compiler()
 
         @benchmark
-        def result():
-            new_circ = compile(
+        def compiled():
+            return compile(
                 circuit,
-                model=BACKEND,
+                model=backend,
                 optimization_level=OPTIMIZATION_LEVEL,
                 compiler=compiler,
+                with_mapping=True,
             )
-            return new_circ
 
         compiler.close()
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        result, initial_mapping, final_mapping = compiled
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(
+            result,
+            backend,
+            input_circuit=circuit,
+            layout=(initial_mapping, final_mapping),
+        )
 
-    def test_QAOA_100_transpile(self, benchmark):
+    def test_QAOA_100_transpile(self, benchmark, backend):
         """Compile 100Q QAOA circuit against target backend"""
-        circuit = qasm_circuit_loader(
+        circuit = cached_qasm_circuit_loader(
             Configuration.get_qasm_dir("qaoa") + "qaoa_barabasi_albert_N100_3reps.qasm",
             benchmark,
         )
         compiler = Compiler()
 
         @benchmark
-        def result():
-            new_circ = compile(
+        def compiled():
+            return compile(
                 circuit,
-                model=BACKEND,
+                model=backend,
                 optimization_level=OPTIMIZATION_LEVEL,
                 compiler=compiler,
                 seed=0,
+                with_mapping=True,
             )
-            return new_circ
 
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        result, initial_mapping, final_mapping = compiled
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(
+            result,
+            backend,
+            input_circuit=circuit,
+            layout=(initial_mapping, final_mapping),
+        )
 
-    def test_BVlike_simplification_transpile(self, benchmark):
+    def test_BVlike_simplification_transpile(self, benchmark, backend):
         """Transpile a BV-like circuit that should collapse down
         into a single X and Z gate on a target device
         """
@@ -192,38 +232,50 @@ class TestWorkoutDeviceTranspile100Q(WorkoutDeviceTranspile100Q):
         compiler = Compiler()
 
         @benchmark
-        def result():
-            new_circ = compile(
+        def compiled():
+            return compile(
                 circuit,
-                model=BACKEND,
+                model=backend,
                 optimization_level=OPTIMIZATION_LEVEL,
                 compiler=compiler,
                 seed=0,
+                with_mapping=True,
             )
-            return new_circ
 
         compiler.close()
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        result, initial_mapping, final_mapping = compiled
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(
+            result,
+            backend,
+            input_circuit=circuit,
+            layout=(initial_mapping, final_mapping),
+        )
 
-    def test_clifford_100_transpile(self, benchmark):
+    def test_clifford_100_transpile(self, benchmark, backend):
         """Compile 100Q Clifford circuit against target backend"""
-        circuit = qasm_circuit_loader(
+        circuit = cached_qasm_circuit_loader(
             Configuration.get_qasm_dir("clifford") + "clifford_100_12345.qasm",
             benchmark,
         )
         compiler = Compiler()
 
         @benchmark
-        def result():
-            new_circ = compile(
+        def compiled():
+            return compile(
                 circuit,
-                model=BACKEND,
+                model=backend,
                 optimization_level=OPTIMIZATION_LEVEL,
                 compiler=compiler,
+                with_mapping=True,
             )
-            return new_circ
 
         compiler.close()
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        result, initial_mapping, final_mapping = compiled
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(
+            result,
+            backend,
+            input_circuit=circuit,
+            layout=(initial_mapping, final_mapping),
+        )
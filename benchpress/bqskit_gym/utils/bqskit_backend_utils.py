@@ -19,12 +19,8 @@ from bqskit.ir.gates.qubitgate import QubitGate
 from bqskit.qis.unitary.unitarymatrix import UnitaryMatrix
 
 from benchpress.config import POSSIBLE_2Q_GATES
-from benchpress.utilities.backends.flexible_backend import FlexibleBackend
-from benchpress.qiskit_gym.utils.qiskit_backend_utils import (
-    STR_TO_IBM_FAKE_BACKEND,
-    extend_ibm_fake_backend,
-    get_qiskit_bench_backend,
-)
+from benchpress.utilities.backends import get_backend_snapshot
+from benchpress.utilities.backends.flexible_backend import get_flexible_backend
 
 
 class ECRGate(ConstantGate, QubitGate):
@@ -68,7 +64,9 @@ def BqskitFlexibleBackend(min_qubits, layout="square", basis_gates=None):
     Returns:
         MachineModel: Mode representing flexible backend in Bqskit
     """
-    flex_backend = FlexibleBackend(min_qubits, layout=layout, basis_gates=basis_gates)
+    flex_backend = get_flexible_backend(
+        min_qubits, layout=layout, basis_gates=basis_gates
+    )
     model = _get_bqskit_machine_model(flex_backend)
     possible_gates = _basis_gate_str_to_bqskit_gate(POSSIBLE_2Q_GATES)
     twoq_gates = list(model.gate_set.intersection(possible_gates))
@@ -83,15 +81,18 @@ def BqskitFlexibleBackend(min_qubits, layout="square", basis_gates=None):
 def _get_bqskit_machine_model(backend):
     """Create a machine model for a IBM Backend."""
     config = backend.configuration()
-    num_qudits = config.n_qubits
-    basis_gates = config.basis_gates
-    gate_set = _basis_gate_str_to_bqskit_gate(basis_gates=basis_gates)
-    if "ecr" in basis_gates:
-        gate_set.add(ECRGate())
     if config.coupling_map:
         coupling_map = list({tuple(sorted(e)) for e in config.coupling_map})
     else:
         coupling_map = None
+    return _bqskit_machine_model(config.n_qubits, config.basis_gates, coupling_map)
+
+
+def _bqskit_machine_model(num_qudits, basis_gates, coupling_map):
+    """Create a machine model from a qubit count, basis and coupling map."""
+    gate_set = _basis_gate_str_to_bqskit_gate(basis_gates=basis_gates)
+    if "ecr" in basis_gates:
+        gate_set.add(ECRGate())
     model = MachineModel(num_qudits, coupling_map, gate_set)  # type: ignore
     possible_gates = _basis_gate_str_to_bqskit_gate(POSSIBLE_2Q_GATES)
     twoq_gates = list(model.gate_set.intersection(possible_gates))
@@ -108,18 +109,21 @@ def get_bqskit_bench_backend(backend_name: str):
     It takes a Qiskit backend name, either a fake backend name
     (e.g., `"fake_sherbrooke"`) or real hardware name (e.g., `"ibm_sherbrooke"`).
 
+    The model is built from the cached backend snapshot, so the Qiskit
+    backend only has to be constructed the first time a device is seen.
+
     Parameters:
         backend_name (str): Name of the backend.
 
     Returns:
         A backend (Model) of `MachineModel` object compatible with BQSKIT.
     """
-    if "fake" in backend_name:
-        ibm_fake_backend = STR_TO_IBM_FAKE_BACKEND[backend_name]()
-        backend = extend_ibm_fake_backend(ibm_fake_backend)
-    elif "ibm" in backend_name:
-        backend = get_qiskit_bench_backend(backend_name)
-    else:
+    if "fake" not in backend_name and "ibm" not in backend_name:
         raise ValueError(f"Backend name {backend_name} not recognized.")
-
-    return _get_bqskit_machine_model(backend=backend)
+    snapshot = get_backend_snapshot(backend_name)
+    coupling_map = list(
+        {tuple(sorted(int(q) for q in edge)) for edge in snapshot["edges"]}
+    )
+    return _bqskit_machine_model(
+        snapshot["num_qubits"], snapshot["basis_gates"], coupling_map
+    )
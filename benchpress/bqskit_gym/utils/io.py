@@ -9,12 +9,19 @@
 # Any modifications or derivative works of this code must retain this
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
+import pickle
 from time import perf_counter
 from math import pi
 
 from bqskit import Circuit
 from bqskit.ext import qiskit_to_bqskit
+from bqskit.ir.lang.qasm2 import OPENQASM2Language
 from benchpress.qiskit_gym.utils.io import qiskit_hamiltonian_circuit
+from benchpress.utilities.io.qasm_files import is_compressed_qasm, read_qasm
+from benchpress.utilities.metrics import (
+    circuit_arrays_from_operations,
+    record_output_metrics,
+)
 
 
 def bqskit_qasm_loader(qasm_file, benchmark):
@@ -28,13 +35,40 @@ def bqskit_qasm_loader(qasm_file, benchmark):
         Circuit: A BQSKit circuit instance
     """
     start = perf_counter()
-    circuit = Circuit.from_file(qasm_file)
+    if is_compressed_qasm(qasm_file):
+        circuit = OPENQASM2Language().decode(read_qasm(qasm_file))
+    else:
+        circuit = Circuit.from_file(qasm_file)
     stop = perf_counter()
     benchmark.extra_info["qasm_load_time"] = stop - start
     benchmark.extra_info["input_num_qubits"] = circuit.num_qudits
     return circuit
 
 
+def bqskit_circuit_dump(circuit, filename):
+    """Serialize a circuit with pickle
+
+    Parameters:
+        circuit (Circuit): A BQSKit circuit instance
+        filename (str): Output file name
+    """
+    with open(filename, "wb") as fd:
+        pickle.dump(circuit, fd, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def bqskit_circuit_load(filename):
+    """Load a circuit written by `bqskit_circuit_dump`
+
+    Parameters:
+        filename (str): Input file name
+
+    Returns:
+        Circuit: A BQSKit circuit instance
+    """
+    with open(filename, "rb") as fd:
+        return pickle.load(fd)
+
+
 def bqskit_hamiltonian_circuit(sparse_op, label=None, evo_time=1):
     # BQSKit uses qiskit to construct a Trotter circuit, see https://github.com/BQSKit/bqskit-tutorial/blob/d04b4c40180c26ef81a8927663679fa085efc053/hubbard/hubbard.py#L135
     # hence we also use it here. Note that we must decompose the returned circuit here because BQSKit
@@ -48,16 +82,14 @@ def bqskit_input_circuit_properties(circuit, benchmark):
     benchmark.extra_info["input_num_qubits"] = circuit.num_qudits
 
 
-def bqskit_output_circuit_properties(circuit, two_qubit_gate, benchmark):
-    ops = {}
-    for op in circuit.operations():
-        if op.gate.name in ops:
-            ops[op.gate.name] += 1
-        else:
-            ops[op.gate.name] = 1
-    benchmark.extra_info["output_num_qubits"] = circuit.num_qudits
-    benchmark.extra_info["output_circuit_operations"] = ops
-    benchmark.extra_info["output_gate_count_2q"] = circuit.gate_counts.get(
-        two_qubit_gate, 0
+def bqskit_circuit_arrays(circuit):
+    return circuit_arrays_from_operations(
+        circuit.num_qudits,
+        ((op.gate.name, list(op.location)) for op in circuit.operations()),
     )
-    benchmark.extra_info["output_depth_2q"] = circuit.multi_qudit_depth
+
+
+def bqskit_output_circuit_properties(circuit, two_qubit_gate, benchmark):
+    arrays = bqskit_circuit_arrays(circuit)
+    record_output_metrics(arrays, two_qubit_gate.name, benchmark)
+    return arrays
@@ -11,6 +11,16 @@
 # that they have been altered from the originals.
 """Basic circuit validation"""
 
+from math import isclose, pi
+
+import numpy as np
+
+from benchpress.bqskit_gym.utils.io import bqskit_circuit_arrays
+from benchpress.utilities.validation.topology import (
+    get_adjacency,
+    validate_circuit_arrays,
+)
+
 
 def bqskit_circuit_validation(circuit, backend):
     """Validate that input circuit matches gate set
@@ -20,18 +30,147 @@ def bqskit_circuit_validation(circuit, backend):
         circuit (QuantumCircuit): Input circuit
         backend (MachineModel): Target backend
     """
-    circuit_ops = set(item.name for item in circuit.gate_counts.keys())
     backend_ops = set(item.name for item in backend.gate_set)
     # Add barrier to backend ops
     backend_ops.add("barrier")
     backend_ops.add("measurement")
-    diff_set = set(circuit_ops).difference(backend_ops)
-    if diff_set:
-        raise Exception(f"Circuit has gates outside backend basis set {diff_set}")
-
-    edges = backend.coupling_graph
-    for item in circuit.operations():
-        if item.gate == backend.two_q_gate_type:
-            if item.location not in edges and item.location[::-1] not in edges:
-                raise Exception(f"2Q gate edge {item.location} not in backend topology")
+    return validate_circuit_arrays(
+        bqskit_circuit_arrays(circuit),
+        backend_ops,
+        backend.two_q_gate_type.name,
+        get_adjacency(backend, bqskit_backend_edges),
+    )
+
+
+def bqskit_backend_edges(backend):
+    """Undirected coupling edges of a machine model, for `get_adjacency`"""
+    return backend.num_qudits, list(backend.coupling_graph), True
+
+
+# Gates that are Clifford whatever their parameters, and rotations that are
+# Clifford at multiples of pi / 2
+CLIFFORD_GATES = {
+    "IdentityGate",
+    "XGate",
+    "YGate",
+    "ZGate",
+    "HGate",
+    "SGate",
+    "SdgGate",
+    "SXGate",
+    "SqrtXGate",
+    "CNOTGate",
+    "CXGate",
+    "CYGate",
+    "CZGate",
+    "SwapGate",
+    "ISwapGate",
+    "barrier",
+    "measurement",
+}
+CLIFFORD_ROTATIONS = {"RXGate", "RYGate", "RZGate", "U1Gate"}
+
+
+def bqskit_is_clifford(circuit):
+    """Return whether a circuit only has Clifford gates, judged by gate
+    name and angle
+
+    Parameters:
+        circuit (Circuit): The circuit
+
+    Returns:
+        bool: True for Clifford circuits
+    """
+    for op in circuit.operations():
+        name = op.gate.name
+        if name in CLIFFORD_GATES:
+            continue
+        if name not in CLIFFORD_ROTATIONS:
+            return False
+        quarter_turns = 2 * op.params[0] / pi
+        if not isclose(quarter_turns, round(quarter_turns), abs_tol=1e-9):
+            return False
     return True
+
+
+def bqskit_equivalence_problem(input_circuit, output_circuit, layout=None):
+    """Arguments of `check_equivalence` for a compiled circuit
+
+    Parameters:
+        input_circuit (Circuit): Circuit given to the compiler
+        output_circuit (Circuit): Circuit returned by the compiler
+        layout (tuple): Initial and final mappings returned by
+                        `compile(..., with_mapping=True)`; without them the
+                        qudits are taken to be unmoved
+
+    Returns:
+        dict: input_ops, output_ops, num_qubits, initial_layout and
+              final_layout
+
+    Raises:
+        ValueError: A circuit has non-unitary operations other than final
+                    measurements
+    """
+    if layout is None:
+        initial_layout = final_layout = list(range(input_circuit.num_qudits))
+    else:
+        initial_layout, final_layout = (list(mapping) for mapping in layout)
+    return {
+        "input_ops": bqskit_unitary_instructions(input_circuit),
+        "output_ops": bqskit_unitary_instructions(output_circuit),
+        "num_qubits": output_circuit.num_qudits,
+        "initial_layout": initial_layout,
+        "final_layout": final_layout,
+    }
+
+
+def bqskit_unitary_instructions(circuit):
+    """Unroll a circuit to (matrix, qubits) pairs of one- and two-qubit
+    unitaries
+
+    Barriers and final measurements are dropped.  BQSKit matrices are
+    big-endian, so the qudits of two-qudit gates are reversed to give
+    Qiskit's little-endian order.  Circuits with wider gates are converted
+    to Qiskit, which expands them through their definitions.
+
+    Parameters:
+        circuit (Circuit): The circuit
+
+    Returns:
+        list: (matrix, qubit indices) of every unitary in circuit order
+
+    Raises:
+        ValueError: The circuit has other non-unitary operations or
+                    qudits that are not qubits
+    """
+    if any(radix != 2 for radix in circuit.radixes):
+        raise ValueError("Circuit has qudits that are not qubits")
+    if any(op.num_qudits > 2 for op in circuit.operations()):
+        from bqskit.ext import bqskit_to_qiskit
+
+        from benchpress.qiskit_gym.utils.validation import (
+            qiskit_unitary_instructions,
+        )
+
+        return qiskit_unitary_instructions(bqskit_to_qiskit(circuit))
+    ops = []
+    measured = set()
+    matrices = {}
+    for op in circuit.operations():
+        name = op.gate.name
+        qubits = list(op.location)
+        if name == "barrier":
+            continue
+        if name == "measurement":
+            measured.update(qubits)
+            continue
+        if measured.intersection(qubits):
+            raise ValueError(f"Operation {name} after a measurement")
+        # Gates of the same name and parameters share a matrix
+        key = (name, len(qubits), tuple(op.params))
+        matrix = matrices.get(key)
+        if matrix is None:
+            matrix = np.asarray(op.get_unitary())
+            matrices[key] = matrix
+        ops.append((matrix, qubits[::-1]))
+    return ops
@@ -12,6 +12,12 @@
 from time import perf_counter
 from braket.circuits import Circuit
 
+from benchpress.utilities.io.qasm_files import read_qasm
+from benchpress.utilities.metrics import (
+    circuit_arrays_from_operations,
+    record_output_metrics,
+)
+
 
 def braket_qasm_loader(qasm_file, benchmark):
     """Loads a QASM file and measures the import time
@@ -26,8 +32,7 @@ def braket_qasm_loader(qasm_file, benchmark):
         Circuit: A Braket circuit instance
     """
     start = perf_counter()
-    with open(qasm_file, "r") as file:
-        data = file.read()
+    data = read_qasm(qasm_file)
     circuit = Circuit.from_ir(data)
     stop = perf_counter()
     benchmark.extra_info["qasm_load_time"] = stop - start
@@ -45,6 +50,17 @@ def braket_input_circuit_properties(circuit, benchmark):
     benchmark.extra_info["input_num_qubits"] = circuit.qubit_count
 
 
+def braket_circuit_arrays(circuit):
+    indices = {int(qubit): idx for idx, qubit in enumerate(sorted(circuit.qubits))}
+    return circuit_arrays_from_operations(
+        circuit.qubit_count,
+        (
+            (item.operator.name, [indices[int(qubit)] for qubit in item.target])
+            for item in circuit.instructions
+        ),
+    )
+
+
 def braket_output_circuit_properties(circuit, two_qubit_gate, benchmark):
     """Get cirq output circuit statistics
 
@@ -53,14 +69,6 @@ def braket_output_circuit_properties(circuit, two_qubit_gate, benchmark):
         two_qubit_gate: A 2Q gate name, e.g.
         benchmark : The benchmark object
     """
-    count_ops = {}
-    for item in circuit.instructions:
-        name = item.operator.name
-        if name in count_ops:
-            count_ops[name] += 1
-        else:
-            count_ops[name] = 1
-    benchmark.extra_info["output_num_qubits"] = circuit.qubit_count
-    benchmark.extra_info["output_circuit_operations"] = count_ops
-    benchmark.extra_info["output_gate_count_2q"] = count_ops.get(two_qubit_gate, 0)
-    benchmark.extra_info["output_depth_2q"] = None
+    arrays = braket_circuit_arrays(circuit)
+    record_output_metrics(arrays, two_qubit_gate, benchmark)
+    return arrays
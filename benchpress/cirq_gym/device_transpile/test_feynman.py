@@ -10,19 +10,18 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 """Test transpilation against a device"""
-import os
 import pytest
 
 
-from benchpress.config import Configuration
 from benchpress.workouts.validation import benchpress_test_validation
-from benchpress.workouts.device_transpile import WorkoutDeviceFeynman
+from benchpress.workouts.device_transpile import (
+    WorkoutDeviceFeynman,
+    feynman_parameters,
+)
 
 
 def pytest_generate_tests(metafunc):
-    directory = Configuration.get_qasm_dir("feynman")
-    file_list = [x for x in os.listdir(directory) if x.endswith(".qasm")]
-    metafunc.parametrize("filename", file_list)
+    metafunc.parametrize("filename", feynman_parameters())
 
 
 @benchpress_test_validation
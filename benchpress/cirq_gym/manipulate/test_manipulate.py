@@ -18,7 +18,7 @@ from cirq.transformers.analytical_decompositions import two_qubit_to_cz
 from cirq.transformers.target_gatesets import compilation_target_gateset
 from typing import Any, Dict, Sequence, Type, Union
 
-from benchpress.utilities.io import qasm_circuit_loader
+from benchpress.utilities.io import cached_qasm_circuit_loader
 from benchpress.config import Configuration
 from benchpress.utilities.io import output_circuit_properties
 from benchpress.workouts.validation import benchpress_test_validation
@@ -147,7 +147,7 @@ class TestWorkoutCircuitManipulate(WorkoutCircuitManipulate):
         """Perform Pauli-twirling on a 100Q QV
         circuit
         """
-        circuit = qasm_circuit_loader(
+        circuit = cached_qasm_circuit_loader(
             Configuration.get_qasm_dir("dtc") + "dtc_100_cx_12345.qasm", benchmark
         )
 
@@ -162,7 +162,7 @@ class TestWorkoutCircuitManipulate(WorkoutCircuitManipulate):
         """Change a QV100 circuit basis from [rx, ry, rz, cx]
         to [sx, x, rz, cz]
         """
-        circ = qasm_circuit_loader(
+        circ = cached_qasm_circuit_loader(
             Configuration.get_qasm_dir("qv") + "qv_N100_12345.qasm", benchmark
         )
 
@@ -197,7 +197,7 @@ class TestWorkoutCircuitManipulate(WorkoutCircuitManipulate):
         """Decompose a random clifford into
         basis [rz, sx, x, cz]
         """
-        circuit = qasm_circuit_loader(
+        circuit = cached_qasm_circuit_loader(
             Configuration.get_qasm_dir("clifford") + "clifford_20_12345.qasm", benchmark
         )
 
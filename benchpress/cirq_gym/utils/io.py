@@ -13,6 +13,12 @@ from time import perf_counter
 import cirq
 from cirq.contrib.qasm_import import circuit_from_qasm
 
+from benchpress.utilities.io.qasm_files import read_qasm
+from benchpress.utilities.metrics import (
+    circuit_arrays_from_operations,
+    record_output_metrics,
+)
+
 
 def cirq_qasm_loader(qasm_file, benchmark):
     """Loads a QASM file and measures the import time
@@ -25,8 +31,7 @@ def cirq_qasm_loader(qasm_file, benchmark):
         Circuit: A Cirq circuit instance
     """
     start = perf_counter()
-    with open(qasm_file, "r") as f:
-        qasm_str = "".join(f.readlines())
+    qasm_str = read_qasm(qasm_file)
     circuit = circuit_from_qasm(qasm_str)
     stop = perf_counter()
     benchmark.extra_info["qasm_load_time"] = stop - start
@@ -34,6 +39,28 @@ def cirq_qasm_loader(qasm_file, benchmark):
     return circuit
 
 
+def cirq_circuit_dump(circuit, filename):
+    """Serialize a circuit to Cirq JSON
+
+    Parameters:
+        circuit (Circuit): A Cirq circuit instance
+        filename (str): Output file name
+    """
+    cirq.to_json(circuit, filename)
+
+
+def cirq_circuit_load(filename):
+    """Load a circuit written by `cirq_circuit_dump`
+
+    Parameters:
+        filename (str): Input file name
+
+    Returns:
+        Circuit: A Cirq circuit instance
+    """
+    return cirq.read_json(filename)
+
+
 def cirq_input_circuit_properties(circuit, benchmark):
     """Get cirq output circuit statistics
 
@@ -44,6 +71,19 @@ def cirq_input_circuit_properties(circuit, benchmark):
     benchmark.extra_info["input_num_qubits"] = cirq.num_qubits(circuit)
 
 
+def cirq_circuit_arrays(circuit):
+    """Convert a Cirq circuit to circuit arrays, naming operations by the
+    type of their gate"""
+    indices = {qubit: idx for idx, qubit in enumerate(sorted(circuit.all_qubits()))}
+    return circuit_arrays_from_operations(
+        len(indices),
+        (
+            (type(op.gate).__name__, [indices[qubit] for qubit in op.qubits])
+            for op in circuit.all_operations()
+        ),
+    )
+
+
 def cirq_output_circuit_properties(circuit, two_qubit_gate, benchmark):
     """Get cirq output circuit statistics
 
@@ -52,21 +92,6 @@ def cirq_output_circuit_properties(circuit, two_qubit_gate, benchmark):
         two_qubit_gate: A 2Q gate , e.g. 'CXPowGate', 'MatrixGate', or 'CZPowGate'
         benchmark : The benchmark object
     """
-
-    twoq_gates = []
-    count_ops = {}
-
-    for item in circuit.all_operations():
-        item_name = type(item.gate).__name__
-        if item_name == two_qubit_gate:
-            twoq_gates.append(item)
-        if item_name in count_ops:
-            count_ops[item_name] += 1
-        else:
-            count_ops[item_name] = 1
-
-    benchmark.extra_info["output_num_qubits"] = cirq.num_qubits(circuit)
-    benchmark.extra_info["output_circuit_operations"] = count_ops
-    benchmark.extra_info["output_gate_count_2q"] = len(twoq_gates)
-    # https://quantumcomputing.stackexchange.com/questions/9302/computing-circuit-depth-in-cirq
-    benchmark.extra_info["output_depth_2q"] = len(cirq.Circuit(twoq_gates))
+    arrays = cirq_circuit_arrays(circuit)
+    record_output_metrics(arrays, two_qubit_gate, benchmark)
+    return arrays
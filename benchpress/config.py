@@ -21,6 +21,10 @@ DEFAULT_FILENAME = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "..", "default.conf")
 )
 
+DEFAULT_CACHE_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", ".benchpress_cache")
+)
+
 POSSIBLE_2Q_GATES = set(["cx", "cz", "ecr"])
 
 
@@ -47,6 +51,7 @@ class BenchpressConfig:
             self.filename = filename
         self.options = {}
         self._gym_name = None
+        self._backends = {}
         self.config_parser = configparser.ConfigParser()
         self.qasm_dir = os.path.dirname(os.path.abspath(__file__)) + os.sep + "qasm"
         self.hamiltonian_dir = (
@@ -58,6 +63,10 @@ class BenchpressConfig:
             self.options[sec] = {}
             for item in list(self.config_parser.items(sec)):
                 self.options[sec][item[0]] = literal_eval(item[1])
+        self.cache_dir = os.environ.get(
+            "BENCHPRESS_CACHE_DIR",
+            self.options.get("general", {}).get("cache_dir", DEFAULT_CACHE_DIR),
+        )
 
     @property
     def gym_name(self):
@@ -84,27 +93,48 @@ class BenchpressConfig:
         ham_dir = self.hamiltonian_dir
         return ham_dir + os.sep + sub_dir + os.sep
 
+    def get_cache_dir(self, sub_dir=None):
+        """Return (and create) a directory for on-disk caches
+
+        The location defaults to `.benchpress_cache` next to the config file
+        and can be changed with `cache_dir` in the [general] section or the
+        `BENCHPRESS_CACHE_DIR` environment variable.
+        """
+        cache_dir = self.cache_dir
+        if sub_dir is not None:
+            cache_dir = cache_dir + os.sep + sub_dir
+        os.makedirs(cache_dir, exist_ok=True)
+        return cache_dir + os.sep
+
     def backend(self):
+        """Return the target backend for the current gym
+
+        The backend is only constructed on first request and then memoized
+        so that every module (and fixture) in a session shares one instance.
+        """
         from benchpress.utilities.backends import get_backend
 
         if self.gym_name is None:
             raise ValueError("gym_name not set")
 
-        if self.gym_name in [
+        if self.gym_name not in [
             "qiskit",
             "tket",
             "bqskit",
             "qiskit-ibm-transpiler",
             "staq",
-            "qpanda"
+            "qpanda",
         ]:
-            backend = get_backend(
-                backend_name=self.options["general"]["backend_name"],
+            raise ValueError(f"{self.gym_name} does not support backends")
+
+        backend_name = self.options["general"]["backend_name"]
+        key = (self.gym_name, backend_name)
+        if key not in self._backends:
+            self._backends[key] = get_backend(
+                backend_name=backend_name,
                 gym_name=self.gym_name,
             )
-            return backend
-        else:
-            raise ValueError(f"{self.gym_name} does not support backends")
+        return self._backends[key]
 
 
 Configuration = BenchpressConfig()
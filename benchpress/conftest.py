@@ -10,10 +10,279 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 # conftest.py
+import os
 import time
 import numpy
+import pytest
 import scipy
 
+from benchpress.config import Configuration
+
+# Gyms whose abstract-topology tests are built on FlexibleBackend
+FLEXIBLE_BACKEND_GYMS = [
+    "qiskit",
+    "qiskit-ibm-transpiler",
+    "tket",
+    "bqskit",
+    "staq",
+    "qpanda",
+]
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchpress")
+    group.addoption(
+        "--max-qubits",
+        type=int,
+        default=None,
+        help="Deselect tests whose input circuit has more qubits than this",
+    )
+    group.addoption(
+        "--max-gates",
+        type=int,
+        default=None,
+        help="Deselect tests whose input circuit has more operations than this",
+    )
+    group.addoption(
+        "--max-2q-gates",
+        type=int,
+        default=None,
+        help="Deselect tests whose input circuit has more 2Q gates than this",
+    )
+    group.addoption(
+        "--isolate",
+        action="store_true",
+        default=False,
+        help="Run each test body in a forked child process",
+    )
+    group.addoption(
+        "--isolate-timeout",
+        type=float,
+        default=None,
+        help="Fail isolated tests that run longer than this many seconds",
+    )
+    group.addoption(
+        "--isolate-memory",
+        type=int,
+        default=None,
+        help="XFAIL isolated tests that use more than this many MB",
+    )
+    group.addoption(
+        "--timeout-skip-list",
+        type=float,
+        default=None,
+        metavar="SECS",
+        help="Kill tests that run longer than SECS, skip tests known to exceed "
+        "it, and list them in skipfile.txt",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "circuit(**metadata): precomputed statistics of the input circuit"
+    )
+    from benchpress.utilities.runner.skiplist import SKIPFILE, TimeoutSkipList
+
+    config.pluginmanager.register(
+        TimeoutSkipList(
+            config.getoption("timeout_skip_list"),
+            str(config.invocation_params.dir / SKIPFILE),
+        ),
+        "benchpress-timeout-skip-list",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """Run the test body in a forked child when isolation is requested
+
+    Setting a timeout (including `--timeout-skip-list`) or memory limit
+    implies `--isolate`.
+    """
+    from benchpress.utilities.runner.isolation import in_isolated_child, run_isolated
+
+    config = pyfuncitem.config
+    timeouts = [
+        timeout
+        for timeout in (
+            config.getoption("isolate_timeout"),
+            config.getoption("timeout_skip_list"),
+        )
+        if timeout
+    ]
+    timeout = min(timeouts, default=None)
+    memory = config.getoption("isolate_memory")
+    if not (config.getoption("isolate") or timeout or memory) or in_isolated_child():
+        return None
+    run_isolated(pyfuncitem, timeout=timeout, memory=memory)
+    return True
+
+
+@pytest.fixture(scope="session")
+def backend():
+    """Target device backend for the active gym
+
+    Resolved lazily on first use and shared by every test in the session,
+    so collection and suites that do not need a device never build one.
+    """
+    return Configuration.backend()
+
+
+@pytest.fixture(autouse=True)
+def record_backend_name(request):
+    """Record the device targeted by tests that use the `backend` fixture
+
+    `output_circuit_properties` uses it to score outputs against the
+    device calibration data.
+    """
+    if "backend" in request.fixturenames and "benchmark" in request.fixturenames:
+        benchmark = request.getfixturevalue("benchmark")
+        benchmark.extra_info["backend_name"] = Configuration.options["general"][
+            "backend_name"
+        ]
+
+
+@pytest.fixture(autouse=True)
+def record_cpu_placement(request):
+    """Record the worker and cores of tests run by the parallel runner"""
+    from benchpress.utilities.runner.placement import WORKER_ENV
+
+    if WORKER_ENV not in os.environ or "benchmark" not in request.fixturenames:
+        return
+    benchmark = request.getfixturevalue("benchmark")
+    benchmark.extra_info["runner_worker"] = int(os.environ[WORKER_ENV])
+    benchmark.extra_info["cpu_affinity"] = sorted(os.sched_getaffinity(0))
+
+
+@pytest.fixture(autouse=True)
+def record_routing_swap_estimate(request):
+    """Record an SDK independent SWAP estimate for abstract-topology QASM tests
+
+    The estimate is computed from the QASM file and the cached distance
+    matrix of the topology before the test body runs, so it never lands in
+    the benchmarked region.  Nothing is loaded for all-to-all topologies or
+    circuits without 2Q gates, whose estimate is always 0.
+    """
+    callspec = getattr(request.node, "callspec", None)
+    if callspec is None or "benchmark" not in request.fixturenames:
+        return
+    circ, layout = callspec.params.get("circ_and_topo", (None, None))
+    if not isinstance(circ, str):
+        return
+    from benchpress.utilities.runner.predict import CIRCUIT_METADATA
+
+    benchmark = request.getfixturevalue("benchmark")
+    metadata = request.node.stash.get(CIRCUIT_METADATA, None) or {}
+    # Every pair is adjacent on all-to-all, so nothing needs to be loaded
+    if layout == "all-to-all" or metadata.get("gate_count_2q") == 0:
+        benchmark.extra_info["routing_swap_estimate"] = 0
+        return
+    from benchpress.utilities.backends import (
+        get_topology_distances,
+        routing_swap_estimate,
+    )
+    from benchpress.utilities.io import qasm_two_qubit_interactions
+
+    num_qubits, pairs = qasm_two_qubit_interactions(circ)
+    distances = get_topology_distances(num_qubits, layout)
+    if distances is not None:
+        benchmark.extra_info["routing_swap_estimate"] = routing_swap_estimate(
+            pairs, distances
+        )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Deselect tests whose input circuit exceeds the command line limits
+    or the target device
+
+    Decisions are made from precomputed circuit metadata (the corpus
+    manifest and Hamiltonian records), so no circuit is parsed or built.
+    """
+    from benchpress.utilities.runner.predict import CIRCUIT_METADATA
+
+    limits = {
+        "num_qubits": config.getoption("max_qubits"),
+        "size": config.getoption("max_gates"),
+        "gate_count_2q": config.getoption("max_2q_gates"),
+    }
+    device_qubits = None
+    selected = []
+    deselected = []
+    for item in items:
+        metadata = _circuit_metadata(item)
+        if metadata is not None:
+            item.stash[CIRCUIT_METADATA] = metadata
+            if any(
+                limit is not None and metadata.get(key, 0) > limit
+                for key, limit in limits.items()
+            ):
+                deselected.append(item)
+                continue
+            if "backend" in item.fixturenames:
+                if device_qubits is None:
+                    device_qubits = _device_num_qubits()
+                if device_qubits and metadata["num_qubits"] > device_qubits:
+                    deselected.append(item)
+                    continue
+        selected.append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def pytest_collection_finish(session):
+    """Pre-build the abstract-topology backends used by the selected tests"""
+    if session.config.option.collectonly:
+        return
+    if Configuration.gym_name not in FLEXIBLE_BACKEND_GYMS:
+        return
+    from benchpress.utilities.backends.flexible_backend import (
+        prewarm_flexible_backends,
+    )
+
+    specs = []
+    for item in session.items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is None or "circ_and_topo" not in callspec.params:
+            continue
+        metadata = _circuit_metadata(item)
+        if metadata is not None:
+            specs.append((metadata["num_qubits"], callspec.params["circ_and_topo"][1]))
+    prewarm_flexible_backends(specs)
+
+
+def _circuit_metadata(item):
+    """Return the precomputed statistics of a test's input circuit, if known"""
+    marker = item.get_closest_marker("circuit")
+    if marker is not None:
+        return marker.kwargs
+    callspec = getattr(item, "callspec", None)
+    if callspec is None:
+        return None
+    if "circ_and_topo" in callspec.params:
+        circ = callspec.params["circ_and_topo"][0]
+    elif "hamiltonian_info" in callspec.params:
+        circ = callspec.params["hamiltonian_info"]
+    else:
+        return None
+    if isinstance(circ, dict):
+        return {"num_qubits": circ["ham_qubits"]}
+    from benchpress.utilities.io import qasm_file_metadata
+
+    return qasm_file_metadata(circ)
+
+
+def _device_num_qubits():
+    """Number of qubits of the configured device, or 0 if unavailable"""
+    from benchpress.utilities.backends import get_backend_snapshot
+
+    try:
+        backend_name = Configuration.options["general"]["backend_name"]
+        snapshot = get_backend_snapshot(backend_name)
+    except Exception:
+        return 0
+    return snapshot["num_qubits"]
+
 
 def pytest_benchmark_update_json(config, benchmarks, output_json):
     """Adds custom sections to the pytest-benchmark report"""
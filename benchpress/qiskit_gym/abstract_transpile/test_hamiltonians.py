@@ -19,7 +19,7 @@ from benchpress.utilities.io import input_circuit_properties, output_circuit_pro
 from benchpress.utilities.io.hamiltonians import generate_hamiltonian_circuit
 from benchpress.workouts.validation import benchpress_test_validation
 from benchpress.config import Configuration
-from benchpress.utilities.backends import FlexibleBackend
+from benchpress.utilities.backends import get_flexible_backend
 from benchpress.utilities.validation import circuit_validator
 
 
@@ -36,11 +36,9 @@ OPTIMIZATION_LEVEL = Configuration.options["qiskit"]["optimization_level"]
 class TestWorkoutAbstractHamiltonians(WorkoutAbstractHamiltonians):
     @pytest.mark.parametrize("circ_and_topo", HAM_TOPO, ids=HAM_TOPO_NAMES)
     def test_hamiltonians(self, benchmark, circ_and_topo):
-        circuit = generate_hamiltonian_circuit(
-            circ_and_topo[0].pop("ham_hamlib_hamiltonian"), benchmark
-        )
+        circuit = generate_hamiltonian_circuit(circ_and_topo[0].operator(), benchmark)
         input_circuit_properties(circuit, benchmark)
-        backend = FlexibleBackend(circuit.num_qubits, circ_and_topo[1])
+        backend = get_flexible_backend(circuit.num_qubits, circ_and_topo[1])
         TWO_Q_GATE = backend.two_q_gate_type
         pm = generate_preset_pass_manager(
             optimization_level=OPTIMIZATION_LEVEL, backend=backend
@@ -53,4 +51,4 @@ class TestWorkoutAbstractHamiltonians(WorkoutAbstractHamiltonians):
 
         benchmark.extra_info.update(circ_and_topo[0])
         output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, backend)
+        assert circuit_validator(result, backend, input_circuit=circuit)
@@ -17,8 +17,11 @@ from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
 
 from benchpress.workouts.validation import benchpress_test_validation
 from benchpress.config import Configuration
-from benchpress.utilities.backends import FlexibleBackend
-from benchpress.utilities.io import qasm_circuit_loader, output_circuit_properties
+from benchpress.utilities.backends import get_flexible_backend
+from benchpress.utilities.io import (
+    cached_qasm_circuit_loader,
+    output_circuit_properties,
+)
 from benchpress.utilities.validation import circuit_validator
 
 from benchpress.workouts.abstract_transpile import (
@@ -42,8 +45,8 @@ OPTIMIZATION_LEVEL = Configuration.options["qiskit"]["optimization_level"]
 class TestWorkoutAbstractQasmBenchSmall(WorkoutAbstractQasmBenchSmall):
     @pytest.mark.parametrize("circ_and_topo", SMALL_CIRC_TOPO, ids=SMALL_NAMES)
     def test_QASMBench_small(self, benchmark, circ_and_topo):
-        circuit = qasm_circuit_loader(circ_and_topo[0], benchmark)
-        backend = FlexibleBackend(circuit.num_qubits, circ_and_topo[1])
+        circuit = cached_qasm_circuit_loader(circ_and_topo[0], benchmark)
+        backend = get_flexible_backend(circuit.num_qubits, circ_and_topo[1])
         pm = generate_preset_pass_manager(
             optimization_level=OPTIMIZATION_LEVEL, backend=backend
         )
@@ -54,15 +57,15 @@ class TestWorkoutAbstractQasmBenchSmall(WorkoutAbstractQasmBenchSmall):
             return trans_qc
 
         output_circuit_properties(result, backend.two_q_gate_type, benchmark)
-        assert circuit_validator(result, backend)
+        assert circuit_validator(result, backend, input_circuit=circuit)
 
 
 @benchpress_test_validation
 class TestWorkoutAbstractQasmBenchMedium(WorkoutAbstractQasmBenchMedium):
     @pytest.mark.parametrize("circ_and_topo", MEDIUM_CIRC_TOPO, ids=MEDIUM_NAMES)
     def test_QASMBench_medium(self, benchmark, circ_and_topo):
-        circuit = qasm_circuit_loader(circ_and_topo[0], benchmark)
-        backend = FlexibleBackend(circuit.num_qubits, circ_and_topo[1])
+        circuit = cached_qasm_circuit_loader(circ_and_topo[0], benchmark)
+        backend = get_flexible_backend(circuit.num_qubits, circ_and_topo[1])
         pm = generate_preset_pass_manager(
             optimization_level=OPTIMIZATION_LEVEL, backend=backend
         )
@@ -73,15 +76,15 @@ class TestWorkoutAbstractQasmBenchMedium(WorkoutAbstractQasmBenchMedium):
             return trans_qc
 
         output_circuit_properties(result, backend.two_q_gate_type, benchmark)
-        assert circuit_validator(result, backend)
+        assert circuit_validator(result, backend, input_circuit=circuit)
 
 
 @benchpress_test_validation
 class TestWorkoutAbstractQasmBenchLarge(WorkoutAbstractQasmBenchLarge):
     @pytest.mark.parametrize("circ_and_topo", LARGE_CIRC_TOPO, ids=LARGE_NAMES)
     def test_QASMBench_large(self, benchmark, circ_and_topo):
-        circuit = qasm_circuit_loader(circ_and_topo[0], benchmark)
-        backend = FlexibleBackend(circuit.num_qubits, circ_and_topo[1])
+        circuit = cached_qasm_circuit_loader(circ_and_topo[0], benchmark)
+        backend = get_flexible_backend(circuit.num_qubits, circ_and_topo[1])
         pm = generate_preset_pass_manager(
             optimization_level=OPTIMIZATION_LEVEL, backend=backend
         )
@@ -92,4 +95,4 @@ class TestWorkoutAbstractQasmBenchLarge(WorkoutAbstractQasmBenchLarge):
             return trans_qc
 
         output_circuit_properties(result, backend.two_q_gate_type, benchmark)
-        assert circuit_validator(result, backend)
+        assert circuit_validator(result, backend, input_circuit=circuit)
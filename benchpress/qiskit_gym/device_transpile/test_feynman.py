@@ -10,44 +10,45 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 """Test transpilation against a device"""
-import os
 import pytest
 
 from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
 
 from benchpress.config import Configuration
 from benchpress.workouts.validation import benchpress_test_validation
-from benchpress.workouts.device_transpile import WorkoutDeviceFeynman
-from benchpress.utilities.io import qasm_circuit_loader, output_circuit_properties
+from benchpress.workouts.device_transpile import (
+    WorkoutDeviceFeynman,
+    feynman_parameters,
+)
+from benchpress.utilities.io import (
+    cached_qasm_circuit_loader,
+    output_circuit_properties,
+)
 from benchpress.utilities.validation import circuit_validator
 
-BACKEND = Configuration.backend()
-TWO_Q_GATE = BACKEND.two_q_gate_type
 OPTIMIZATION_LEVEL = Configuration.options["qiskit"]["optimization_level"]
 
 
 def pytest_generate_tests(metafunc):
-    directory = Configuration.get_qasm_dir("feynman")
-    file_list = [x for x in os.listdir(directory) if x.endswith(".qasm")]
-    metafunc.parametrize("filename", file_list)
+    metafunc.parametrize("filename", feynman_parameters())
 
 
 @benchpress_test_validation
 class TestWorkoutDeviceFeynman(WorkoutDeviceFeynman):
 
-    def test_feynman_transpile(self, benchmark, filename):
+    def test_feynman_transpile(self, benchmark, filename, backend):
         """Transpile a feynman benchmark qasm file against a target device"""
-        circuit = qasm_circuit_loader(
+        circuit = cached_qasm_circuit_loader(
             f"{Configuration.get_qasm_dir('feynman')}{filename}", benchmark
         )
-        if circuit.num_qubits > BACKEND.num_qubits:
+        if circuit.num_qubits > backend.num_qubits:
             pytest.skip("Circuit too large for given backend.")
-        pm = generate_preset_pass_manager(OPTIMIZATION_LEVEL, BACKEND)
+        pm = generate_preset_pass_manager(OPTIMIZATION_LEVEL, backend)
 
         @benchmark
         def result():
             trans_qc = pm.run(circuit)
             return trans_qc
 
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend, input_circuit=circuit)
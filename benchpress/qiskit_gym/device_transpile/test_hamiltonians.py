@@ -10,9 +10,7 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 """Test transpilation against a device"""
-import json
 import pytest
-from qiskit.quantum_info import SparsePauliOp
 
 from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
 
@@ -20,38 +18,30 @@ from benchpress.config import Configuration
 from benchpress.utilities.io import input_circuit_properties, output_circuit_properties
 from benchpress.utilities.io.hamiltonians import generate_hamiltonian_circuit
 from benchpress.workouts.validation import benchpress_test_validation
-from benchpress.workouts.device_transpile import WorkoutDeviceHamlibHamiltonians
+from benchpress.workouts.device_transpile import (
+    WorkoutDeviceHamlibHamiltonians,
+    hamlib_parameters,
+)
 from benchpress.utilities.validation import circuit_validator
 
-BACKEND = Configuration.backend()
-TWO_Q_GATE = BACKEND.two_q_gate_type
 OPTIMIZATION_LEVEL = Configuration.options["qiskit"]["optimization_level"]
 
 
 def pytest_generate_tests(metafunc):
-    directory = Configuration.get_hamiltonian_dir("hamlib")
-    ham_records = json.load(open(directory + "100_representative.json", "r"))
-    for h in ham_records:
-        terms = h.pop("ham_hamlib_hamiltonian_terms")
-        coefficients = h.pop("ham_hamlib_hamiltonian_coefficients")
-        h["ham_hamlib_hamiltonian"] = SparsePauliOp(terms, coefficients)
-    metafunc.parametrize(
-        "hamiltonian_info", ham_records, ids=lambda x: "ham_" + x["ham_instance"][1:-1]
-    )
+    ham_records, test_ids = hamlib_parameters()
+    metafunc.parametrize("hamiltonian_info", ham_records, ids=test_ids)
 
 
 @benchpress_test_validation
 class TestWorkoutDeviceHamlibHamiltonians(WorkoutDeviceHamlibHamiltonians):
 
-    def test_hamlib_hamiltonians_transpile(self, benchmark, hamiltonian_info):
+    def test_hamlib_hamiltonians_transpile(self, benchmark, hamiltonian_info, backend):
         """Transpile a Hamiltonian against a target device"""
-        if hamiltonian_info["ham_qubits"] > BACKEND.num_qubits:
+        if hamiltonian_info["ham_qubits"] > backend.num_qubits:
             pytest.skip("Circuit too large for given backend.")
-        pm = generate_preset_pass_manager(OPTIMIZATION_LEVEL, BACKEND)
+        pm = generate_preset_pass_manager(OPTIMIZATION_LEVEL, backend)
 
-        circuit = generate_hamiltonian_circuit(
-            hamiltonian_info.pop("ham_hamlib_hamiltonian"), benchmark
-        )
+        circuit = generate_hamiltonian_circuit(hamiltonian_info.operator(), benchmark)
         input_circuit_properties(circuit, benchmark)
 
         @benchmark
@@ -60,5 +50,5 @@ class TestWorkoutDeviceHamlibHamiltonians(WorkoutDeviceHamlibHamiltonians):
             return trans_qc
 
         benchmark.extra_info.update(hamiltonian_info)
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend, input_circuit=circuit)
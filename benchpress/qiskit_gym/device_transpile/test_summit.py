@@ -6,7 +6,7 @@ from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
 
 from benchpress.config import Configuration
 from benchpress.utilities.io import (
-    qasm_circuit_loader,
+    cached_qasm_circuit_loader,
     input_circuit_properties,
     output_circuit_properties,
 )
@@ -17,147 +17,145 @@ from benchpress.workouts.validation import benchpress_test_validation
 from benchpress.workouts.device_transpile import WorkoutDeviceTranspile100Q
 from benchpress.qiskit_gym.circuits import trivial_bvlike_circuit
 
-BACKEND = Configuration.backend()
-TWO_Q_GATE = BACKEND.two_q_gate_type
 OPTIMIZATION_LEVEL = Configuration.options["qiskit"]["optimization_level"]
 
 
 @benchpress_test_validation
 class TestWorkoutDeviceTranspile100Q(WorkoutDeviceTranspile100Q):
-    def test_QFT_100_transpile(self, benchmark):
+    def test_QFT_100_transpile(self, benchmark, backend):
         """Compile 100Q QFT circuit against target backend"""
 
-        circuit = qasm_circuit_loader(
+        circuit = cached_qasm_circuit_loader(
             Configuration.get_qasm_dir("qft") + "qft_N100.qasm", benchmark
         )
 
-        pm = generate_preset_pass_manager(OPTIMIZATION_LEVEL, BACKEND)
+        pm = generate_preset_pass_manager(OPTIMIZATION_LEVEL, backend)
 
         @benchmark
         def result():
             trans_qc = pm.run(circuit)
             return trans_qc
 
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend, input_circuit=circuit)
 
-    def test_QV_100_transpile(self, benchmark):
+    def test_QV_100_transpile(self, benchmark, backend):
         """Compile 10Q QV circuit against target backend"""
         circuit = QuantumVolume(100, 100, seed=12345)
-        pm = generate_preset_pass_manager(OPTIMIZATION_LEVEL, BACKEND)
+        pm = generate_preset_pass_manager(OPTIMIZATION_LEVEL, backend)
 
         @benchmark
         def result():
             trans_qc = pm.run(circuit)
             return trans_qc
 
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend, input_circuit=circuit)
 
-    def test_circSU2_89_transpile(self, benchmark):
+    def test_circSU2_89_transpile(self, benchmark, backend):
         """Compile 89Q circSU2 circuit against target backend"""
         circuit = EfficientSU2(89, reps=3, entanglement="circular")
         input_circuit_properties(circuit, benchmark)
-        pm = generate_preset_pass_manager(OPTIMIZATION_LEVEL, BACKEND)
+        pm = generate_preset_pass_manager(OPTIMIZATION_LEVEL, backend)
 
         @benchmark
         def result():
             trans_qc = pm.run(circuit)
             return trans_qc
 
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend, input_circuit=circuit)
 
-    def test_circSU2_100_transpile(self, benchmark):
+    def test_circSU2_100_transpile(self, benchmark, backend):
         """Compile 100Q circSU2 circuit against target backend"""
         circuit = EfficientSU2(100, reps=3, entanglement="circular")
         input_circuit_properties(circuit, benchmark)
-        pm = generate_preset_pass_manager(OPTIMIZATION_LEVEL, BACKEND)
+        pm = generate_preset_pass_manager(OPTIMIZATION_LEVEL, backend)
 
         @benchmark
         def result():
             trans_qc = pm.run(circuit)
             return trans_qc
 
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend, input_circuit=circuit)
 
-    def test_BV_100_transpile(self, benchmark):
+    def test_BV_100_transpile(self, benchmark, backend):
         """Compile 100Q BV circuit against target backend"""
         circuit = bv_all_ones(100)
         input_circuit_properties(circuit, benchmark)
-        pm = generate_preset_pass_manager(OPTIMIZATION_LEVEL, BACKEND)
+        pm = generate_preset_pass_manager(OPTIMIZATION_LEVEL, backend)
 
         @benchmark
         def result():
             trans_qc = pm.run(circuit)
             return trans_qc
 
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend, input_circuit=circuit)
 
-    def test_square_heisenberg_100_transpile(self, benchmark):
+    def test_square_heisenberg_100_transpile(self, benchmark, backend):
         """Compile 100Q square-Heisenberg circuit against target backend"""
-        circuit = qasm_circuit_loader(
+        circuit = cached_qasm_circuit_loader(
             Configuration.get_qasm_dir("square-heisenberg")
             + "square_heisenberg_N100.qasm",
             benchmark,
         )
-        pm = generate_preset_pass_manager(OPTIMIZATION_LEVEL, BACKEND)
+        pm = generate_preset_pass_manager(OPTIMIZATION_LEVEL, backend)
 
         @benchmark
         def result():
             trans_qc = pm.run(circuit)
             return trans_qc
 
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend, input_circuit=circuit)
 
-    def test_QAOA_100_transpile(self, benchmark):
+    def test_QAOA_100_transpile(self, benchmark, backend):
         """Compile 100Q QAOA circuit against target backend"""
-        circuit = qasm_circuit_loader(
+        circuit = cached_qasm_circuit_loader(
             Configuration.get_qasm_dir("qaoa") + "qaoa_barabasi_albert_N100_3reps.qasm",
             benchmark,
         )
-        pm = generate_preset_pass_manager(OPTIMIZATION_LEVEL, BACKEND)
+        pm = generate_preset_pass_manager(OPTIMIZATION_LEVEL, backend)
 
         @benchmark
         def result():
             trans_qc = pm.run(circuit)
             return trans_qc
 
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend, input_circuit=circuit)
 
-    def test_BVlike_simplification_transpile(self, benchmark):
+    def test_BVlike_simplification_transpile(self, benchmark, backend):
         """Transpile a BV-like circuit that should collapse down
         into a single X and Z gate on a target device
         """
         circuit = trivial_bvlike_circuit(100)
         input_circuit_properties(circuit, benchmark)
-        pm = generate_preset_pass_manager(OPTIMIZATION_LEVEL, BACKEND)
+        pm = generate_preset_pass_manager(OPTIMIZATION_LEVEL, backend)
 
         @benchmark
         def result():
             trans_qc = pm.run(circuit)
             return trans_qc
 
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend, input_circuit=circuit)
 
-    def test_clifford_100_transpile(self, benchmark):
+    def test_clifford_100_transpile(self, benchmark, backend):
         """Compile 100Q Clifford circuit against target backend"""
-        circuit = qasm_circuit_loader(
+        circuit = cached_qasm_circuit_loader(
             Configuration.get_qasm_dir("clifford") + "clifford_100_12345.qasm",
             benchmark,
         )
 
-        pm = generate_preset_pass_manager(OPTIMIZATION_LEVEL, BACKEND)
+        pm = generate_preset_pass_manager(OPTIMIZATION_LEVEL, backend)
 
         @benchmark
         def result():
             trans_qc = pm.run(circuit)
             return trans_qc
 
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend, input_circuit=circuit)
@@ -6,7 +6,8 @@ from qiskit.passmanager import PropertySet
 from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
 
 from benchpress.config import Configuration
-from benchpress.utilities.io import qasm_circuit_loader
+from benchpress.utilities.io import cached_qasm_circuit_loader
+from benchpress.utilities.validation import validate_equivalence
 from benchpress.qiskit_gym.circuits import multi_control_circuit
 from benchpress.workouts.validation import benchpress_test_validation
 from benchpress.workouts.manipulate import WorkoutCircuitManipulate
@@ -18,7 +19,7 @@ class TestWorkoutCircuitManipulate(WorkoutCircuitManipulate):
         """Perform Pauli-twirling on a 100Q QV
         circuit
         """
-        circuit = qasm_circuit_loader(
+        circuit = cached_qasm_circuit_loader(
             Configuration.get_qasm_dir("dtc") + "dtc_100_cx_12345.qasm", benchmark
         )
         assert benchmark(pauli_twirl_2q_gates, circuit)
@@ -48,7 +49,7 @@ class TestWorkoutCircuitManipulate(WorkoutCircuitManipulate):
         translate = generate_preset_pass_manager(
             1, basis_gates=["sx", "x", "rz", "cz"]
         ).translation
-        circ = qasm_circuit_loader(
+        circ = cached_qasm_circuit_loader(
             Configuration.get_qasm_dir("qv") + "qv_N100_12345.qasm", benchmark
         )
 
@@ -87,3 +88,4 @@ class TestWorkoutCircuitManipulate(WorkoutCircuitManipulate):
             filter_function=lambda x: x.operation.name == "cz"
         )
         assert result
+        validate_equivalence(circ, result, clifford_only=True)
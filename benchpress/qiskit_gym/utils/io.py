@@ -11,19 +11,38 @@
 # that they have been altered from the originals.
 from time import perf_counter
 from math import pi
-from qiskit import QuantumCircuit
+from qiskit import QuantumCircuit, qpy
 from qiskit.circuit.library import PauliEvolutionGate
 
+from benchpress.utilities.io.qasm_files import is_compressed_qasm, read_qasm
+from benchpress.utilities.metrics import (
+    circuit_arrays_from_operations,
+    record_output_metrics,
+)
+
 
 def qiskit_qasm_loader(qasm_file, benchmark):
     start = perf_counter()
-    circuit = QuantumCircuit.from_qasm_file(qasm_file)
+    if is_compressed_qasm(qasm_file):
+        circuit = QuantumCircuit.from_qasm_str(read_qasm(qasm_file))
+    else:
+        circuit = QuantumCircuit.from_qasm_file(qasm_file)
     stop = perf_counter()
     benchmark.extra_info["qasm_load_time"] = stop - start
     benchmark.extra_info["input_num_qubits"] = circuit.num_qubits
     return circuit
 
 
+def qiskit_circuit_dump(circuit, filename):
+    with open(filename, "wb") as fd:
+        qpy.dump(circuit, fd)
+
+
+def qiskit_circuit_load(filename):
+    with open(filename, "rb") as fd:
+        return qpy.load(fd)[0]
+
+
 def qiskit_hamiltonian_circuit(sparse_op, label=None, evo_time=1):
     qc = QuantumCircuit(sparse_op.num_qubits)
     qc.append(
@@ -37,12 +56,18 @@ def qiskit_input_circuit_properties(circuit, benchmark):
     benchmark.extra_info["input_num_qubits"] = circuit.num_qubits
 
 
-def qiskit_output_circuit_properties(circuit, two_qubit_gate, benchmark):
-    benchmark.extra_info["output_num_qubits"] = circuit.num_qubits
-    benchmark.extra_info["output_circuit_operations"] = circuit.count_ops()
-    benchmark.extra_info["output_gate_count_2q"] = circuit.count_ops().get(
-        two_qubit_gate, 0
-    )
-    benchmark.extra_info["output_depth_2q"] = circuit.depth(
-        filter_function=lambda x: x.operation.name == two_qubit_gate
+def qiskit_circuit_arrays(circuit):
+    indices = {bit: idx for idx, bit in enumerate(circuit.qubits)}
+    return circuit_arrays_from_operations(
+        circuit.num_qubits,
+        (
+            (inst.operation.name, [indices[qubit] for qubit in inst.qubits])
+            for inst in circuit.data
+        ),
     )
+
+
+def qiskit_output_circuit_properties(circuit, two_qubit_gate, benchmark):
+    arrays = qiskit_circuit_arrays(circuit)
+    record_output_metrics(arrays, two_qubit_gate, benchmark)
+    return arrays
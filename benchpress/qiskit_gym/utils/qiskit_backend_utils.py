@@ -10,6 +10,7 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 import json
+import math
 import os
 
 # This is here because the import path differs between Qiskit 1.0 and earlier versions
@@ -18,8 +19,21 @@ try:
 except ImportError:
     import qiskit.providers.fake_provider.backends as fake_backends
 from qiskit_ibm_runtime import QiskitRuntimeService
+from qiskit.circuit import (
+    Delay,
+    ForLoopOp,
+    IfElseOp,
+    Measure,
+    Parameter,
+    Reset,
+    SwitchCaseOp,
+    WhileLoopOp,
+)
+from qiskit.circuit.library import get_standard_gate_name_mapping
+from qiskit.providers import BackendV2, Options, QubitProperties
 from qiskit.providers.models.backendconfiguration import QasmBackendConfiguration
 from qiskit.providers.models.backendproperties import BackendProperties
+from qiskit.transpiler import InstructionProperties, Target
 
 from benchpress.config import POSSIBLE_2Q_GATES
 
@@ -94,6 +108,117 @@ def get_qiskit_bench_backend(backend_name):
     return backend
 
 
+class SnapshotBackend(BackendV2):
+    """Backend holding the target of a device snapshot, for transpilation
+    only"""
+
+    def __init__(self, target, name):
+        super().__init__(name=name)
+        self._target = target
+
+    @property
+    def target(self):
+        return self._target
+
+    @property
+    def max_circuits(self):
+        return None
+
+    @classmethod
+    def _default_options(cls):
+        return Options()
+
+    def run(self, run_input, **options):
+        raise NotImplementedError(f"{self.name} is a snapshot and cannot run")
+
+
+# Non-gate operations of device targets, keyed on name
+_SNAPSHOT_OPERATIONS = {
+    "measure": Measure(),
+    "reset": Reset(),
+    "delay": Delay(Parameter("t")),
+}
+_SNAPSHOT_CONTROL_FLOW = {
+    "for_loop": ForLoopOp,
+    "if_else": IfElseOp,
+    "switch_case": SwitchCaseOp,
+    "while_loop": WhileLoopOp,
+}
+
+
+def qiskit_backend_from_snapshot(snapshot):
+    """Build a Qiskit backend from a device snapshot, skipping the vendor
+    JSON parsing done by the fake provider
+
+    Parameters:
+        snapshot (dict): Snapshot as returned by `get_backend_snapshot`
+
+    Returns:
+        SnapshotBackend: Backend with the snapshot target, or None if the
+                         snapshot holds operations it cannot rebuild
+    """
+    gate_map = get_standard_gate_name_mapping()
+    num_qubits = snapshot["num_qubits"]
+    two_q_gate = snapshot["two_q_gate"]
+    known = set(gate_map) | set(_SNAPSHOT_OPERATIONS) | set(_SNAPSHOT_CONTROL_FLOW)
+    if two_q_gate not in POSSIBLE_2Q_GATES or not known.issuperset(
+        snapshot["operations"]
+    ):
+        return None
+    for name in snapshot["basis_gates"]:
+        if name != two_q_gate and gate_map[name].num_qubits != 1:
+            return None
+
+    def props(error, duration):
+        return InstructionProperties(
+            duration=_snapshot_value(duration), error=_snapshot_value(error)
+        )
+
+    target = Target(
+        num_qubits=num_qubits,
+        dt=_snapshot_value(snapshot["dt"]),
+        qubit_properties=[
+            QubitProperties(t1=_snapshot_value(t1), t2=_snapshot_value(t2))
+            for t1, t2 in zip(snapshot["t1"], snapshot["t2"])
+        ],
+    )
+    edges = [tuple(edge) for edge in snapshot["edges"].tolist()]
+    for name in snapshot["basis_gates"]:
+        errors = snapshot["gate_errors"][name]
+        durations = snapshot["gate_durations"][name]
+        qargs = edges if name == two_q_gate else [(q,) for q in range(num_qubits)]
+        target.add_instruction(
+            gate_map[name],
+            {qarg: props(errors[k], durations[k]) for k, qarg in enumerate(qargs)},
+        )
+    for name, operation in _SNAPSHOT_OPERATIONS.items():
+        if name not in snapshot["operations"]:
+            continue
+        if name == "measure":
+            properties = {
+                (q,): props(error, duration)
+                for q, (error, duration) in enumerate(
+                    zip(snapshot["readout_errors"], snapshot["readout_durations"])
+                )
+            }
+        else:
+            properties = {(q,): None for q in range(num_qubits)}
+        target.add_instruction(operation, properties)
+    for name, operation in _SNAPSHOT_CONTROL_FLOW.items():
+        if name in snapshot["operations"]:
+            target.add_instruction(operation, name=name)
+
+    backend = SnapshotBackend(target, snapshot["name"])
+    setattr(backend, "two_q_gate_type", two_q_gate)
+    return backend
+
+
+def _snapshot_value(value):
+    """Snapshot arrays store missing values as NaN, Qiskit uses None"""
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
 def extend_ibm_fake_backend(fake_backend):
     """The function takes a specific fake backend class such as `FakeSherbrooke and
     extends the class with two new methods. namely, `configuration` and `properties`
@@ -11,6 +11,19 @@
 # that they have been altered from the originals.
 """Basic circuit validation"""
 
+import numbers
+from math import isclose, pi
+
+from qiskit.circuit import ControlFlowOp
+from qiskit.exceptions import QiskitError
+from qiskit.quantum_info import Operator
+
+from benchpress.qiskit_gym.utils.io import qiskit_circuit_arrays
+from benchpress.utilities.validation.topology import (
+    get_adjacency,
+    validate_circuit_arrays,
+)
+
 
 def qiskit_circuit_validation(circuit, backend):
     """Validate that input circuit matches gate set
@@ -20,22 +33,184 @@ def qiskit_circuit_validation(circuit, backend):
         circuit (QuantumCircuit): Input circuit
         backend (BackendV2): Target backend
     """
-    circuit_ops = set(circuit.count_ops().keys())
     backend_ops = set(backend.operation_names)
     # Add barrier to backend ops
     backend_ops.add("barrier")
-    diff_set = set(circuit_ops).difference(backend_ops)
-    if diff_set:
-        raise Exception(f"Circuit has gates outside backend basis set {diff_set}")
+    return validate_circuit_arrays(
+        qiskit_circuit_arrays(circuit),
+        backend_ops,
+        backend.two_q_gate_type,
+        get_adjacency(backend, qiskit_backend_edges),
+    )
+
 
+def qiskit_backend_edges(backend):
+    """Directed coupling edges of a backend, for `get_adjacency`"""
     cmap = backend.coupling_map
-    if cmap.graph.num_edges() < cmap.graph.num_nodes() * (cmap.graph.num_nodes() - 1):
-        edges = set(cmap.get_edges())
-        for gate in circuit.get_instructions(backend.two_q_gate_type):
-            _edge = (
-                circuit.find_bit(gate.qubits[0]).index,
-                circuit.find_bit(gate.qubits[1]).index,
-            )
-            if _edge not in edges:
-                raise Exception(f"2Q gate edge {_edge} not in backend topology")
+    if cmap is None:
+        # No connectivity constraints
+        num_qubits = backend.num_qubits
+        edges = [(q0, q1) for q0 in range(num_qubits) for q1 in range(num_qubits)]
+        return num_qubits, edges, False
+    return cmap.size(), cmap.get_edges(), False
+
+
+# Gates that are Clifford whatever their parameters, and rotations that are
+# Clifford at multiples of pi / 2
+CLIFFORD_GATES = {
+    "id",
+    "x",
+    "y",
+    "z",
+    "h",
+    "s",
+    "sdg",
+    "sx",
+    "sxdg",
+    "cx",
+    "cy",
+    "cz",
+    "swap",
+    "iswap",
+    "dcx",
+    "ecr",
+    "barrier",
+    "delay",
+    "measure",
+}
+CLIFFORD_ROTATIONS = {"rx", "ry", "rz", "p", "u1"}
+
+
+def qiskit_is_clifford(circuit):
+    """Return whether a circuit only has Clifford gates, judged by gate
+    name and angle
+
+    Parameters:
+        circuit (QuantumCircuit): The circuit
+
+    Returns:
+        bool: True for Clifford circuits
+    """
+    for inst in circuit.data:
+        operation = inst.operation
+        if operation.name in CLIFFORD_GATES:
+            continue
+        if operation.name not in CLIFFORD_ROTATIONS:
+            return False
+        angle = operation.params[0]
+        if not isinstance(angle, numbers.Number):
+            return False
+        quarter_turns = 2 * angle / pi
+        if not isclose(quarter_turns, round(quarter_turns), abs_tol=1e-9):
+            return False
     return True
+
+
+def qiskit_equivalence_problem(input_circuit, output_circuit, layout=None):
+    """Arguments of `check_equivalence` for a transpiled circuit
+
+    The layout attached by the transpiler gives where every input qubit
+    starts and, after routing, ends; without one the qubits are taken to
+    be unmoved.
+
+    Parameters:
+        input_circuit (QuantumCircuit): Circuit given to the transpiler
+        output_circuit (QuantumCircuit): Circuit returned by the transpiler
+        layout (TranspileLayout): Layout to use instead of the one attached
+                                  to the output circuit
+
+    Returns:
+        dict: input_ops, output_ops, num_qubits, initial_layout and
+              final_layout
+
+    Raises:
+        ValueError: A circuit has non-unitary operations other than final
+                    measurements
+    """
+    if layout is None:
+        layout = output_circuit.layout
+    if layout is None:
+        initial_layout = final_layout = list(range(input_circuit.num_qubits))
+    else:
+        initial_layout = layout.initial_index_layout(filter_ancillas=True)
+        final_layout = layout.final_index_layout(filter_ancillas=True)
+    return {
+        "input_ops": qiskit_unitary_instructions(input_circuit),
+        "output_ops": qiskit_unitary_instructions(output_circuit),
+        "num_qubits": output_circuit.num_qubits,
+        "initial_layout": initial_layout,
+        "final_layout": final_layout,
+    }
+
+
+def qiskit_unitary_instructions(circuit):
+    """Unroll a circuit to (matrix, qubits) pairs of one- and two-qubit
+    unitaries
+
+    Barriers, delays and final measurements are dropped; wider gates are
+    expanded through their definitions.
+
+    Parameters:
+        circuit (QuantumCircuit): The circuit
+
+    Returns:
+        list: (matrix, qubit indices) of every unitary in circuit order
+
+    Raises:
+        ValueError: The circuit has other non-unitary operations
+    """
+    indices = {bit: idx for idx, bit in enumerate(circuit.qubits)}
+    ops = []
+    measured = set()
+    matrices = {}
+    for inst in circuit.data:
+        _unroll(
+            inst.operation,
+            [indices[qubit] for qubit in inst.qubits],
+            ops,
+            measured,
+            matrices,
+        )
+    return ops
+
+
+def _unroll(operation, qubits, ops, measured, matrices):
+    name = operation.name
+    if not qubits or name in ["barrier", "delay"]:
+        return
+    if name == "measure":
+        measured.update(qubits)
+        return
+    if isinstance(operation, ControlFlowOp) or name == "reset":
+        raise ValueError(f"Non-unitary operation {name}")
+    if getattr(operation, "condition", None) is not None:
+        raise ValueError(f"Classically conditioned operation {name}")
+    if measured.intersection(qubits):
+        raise ValueError(f"Operation {name} after a measurement")
+    if len(qubits) > 2:
+        definition = operation.definition
+        if definition is None:
+            raise ValueError(f"Operation {name} has no definition")
+        inner = {bit: qubits[idx] for idx, bit in enumerate(definition.qubits)}
+        for inst in definition.data:
+            _unroll(
+                inst.operation,
+                [inner[qubit] for qubit in inst.qubits],
+                ops,
+                measured,
+                matrices,
+            )
+        return
+    # Gates of the same name and numeric parameters share a matrix
+    key = None
+    if all(isinstance(param, numbers.Number) for param in operation.params):
+        key = (name, len(qubits), tuple(operation.params))
+    matrix = matrices.get(key) if key is not None else None
+    if matrix is None:
+        try:
+            matrix = Operator(operation).data
+        except (QiskitError, TypeError) as err:
+            raise ValueError(f"Operation {name} is not unitary") from err
+        if key is not None:
+            matrices[key] = matrix
+    ops.append((matrix, qubits))
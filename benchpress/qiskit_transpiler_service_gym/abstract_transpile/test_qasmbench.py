@@ -17,8 +17,11 @@ from qiskit_ibm_transpiler.transpiler_service import TranspilerService
 
 from benchpress.workouts.validation import benchpress_test_validation
 from benchpress.config import Configuration
-from benchpress.utilities.backends import FlexibleBackend
-from benchpress.utilities.io import qasm_circuit_loader, output_circuit_properties
+from benchpress.utilities.backends import get_flexible_backend
+from benchpress.utilities.io import (
+    cached_qasm_circuit_loader,
+    output_circuit_properties,
+)
 from benchpress.utilities.validation import circuit_validator
 from benchpress.workouts.abstract_transpile import (
     WorkoutAbstractQasmBenchSmall,
@@ -42,8 +45,8 @@ OPTIMIZATION_LEVEL = Configuration.options["qiskit"]["optimization_level"]
 class TestWorkoutAbstractQasmBenchSmall(WorkoutAbstractQasmBenchSmall):
     @pytest.mark.parametrize("circ_and_topo", SMALL_CIRC_TOPO, ids=SMALL_NAMES)
     def test_QASMBench_small(self, benchmark, circ_and_topo):
-        circuit = qasm_circuit_loader(circ_and_topo[0], benchmark)
-        BACKEND = FlexibleBackend(circuit.num_qubits, circ_and_topo[1])
+        circuit = cached_qasm_circuit_loader(circ_and_topo[0], benchmark)
+        BACKEND = get_flexible_backend(circuit.num_qubits, circ_and_topo[1])
         TRANS_SERVICE = TranspilerService(
             coupling_map=list(BACKEND.coupling_map.get_edges()),
             qiskit_transpile_options={"basis_gates": BACKEND.operation_names},
@@ -58,15 +61,15 @@ class TestWorkoutAbstractQasmBenchSmall(WorkoutAbstractQasmBenchSmall):
             return trans_qc
 
         output_circuit_properties(result, BACKEND.two_q_gate_type, benchmark)
-        assert circuit_validator(result, BACKEND)
+        assert circuit_validator(result, BACKEND, input_circuit=circuit)
 
 
 @benchpress_test_validation
 class TestWorkoutAbstractQasmBenchMedium(WorkoutAbstractQasmBenchMedium):
     @pytest.mark.parametrize("circ_and_topo", MEDIUM_CIRC_TOPO, ids=MEDIUM_NAMES)
     def test_QASMBench_medium(self, benchmark, circ_and_topo):
-        circuit = qasm_circuit_loader(circ_and_topo[0], benchmark)
-        BACKEND = FlexibleBackend(circuit.num_qubits, circ_and_topo[1])
+        circuit = cached_qasm_circuit_loader(circ_and_topo[0], benchmark)
+        BACKEND = get_flexible_backend(circuit.num_qubits, circ_and_topo[1])
         TRANS_SERVICE = TranspilerService(
             coupling_map=list(BACKEND.coupling_map.get_edges()),
             qiskit_transpile_options={"basis_gates": BACKEND.operation_names},
@@ -81,15 +84,15 @@ class TestWorkoutAbstractQasmBenchMedium(WorkoutAbstractQasmBenchMedium):
             return trans_qc
 
         output_circuit_properties(result, BACKEND.two_q_gate_type, benchmark)
-        assert circuit_validator(result, BACKEND)
+        assert circuit_validator(result, BACKEND, input_circuit=circuit)
 
 
 @benchpress_test_validation
 class TestWorkoutAbstractQasmBenchLarge(WorkoutAbstractQasmBenchLarge):
     @pytest.mark.parametrize("circ_and_topo", LARGE_CIRC_TOPO, ids=LARGE_NAMES)
     def test_QASMBench_large(self, benchmark, circ_and_topo):
-        circuit = qasm_circuit_loader(circ_and_topo[0], benchmark)
-        BACKEND = FlexibleBackend(circuit.num_qubits, circ_and_topo[1])
+        circuit = cached_qasm_circuit_loader(circ_and_topo[0], benchmark)
+        BACKEND = get_flexible_backend(circuit.num_qubits, circ_and_topo[1])
         TRANS_SERVICE = TranspilerService(
             coupling_map=list(BACKEND.coupling_map.get_edges()),
             qiskit_transpile_options={"basis_gates": BACKEND.operation_names},
@@ -104,4 +107,4 @@ class TestWorkoutAbstractQasmBenchLarge(WorkoutAbstractQasmBenchLarge):
             return trans_qc
 
         output_circuit_properties(result, BACKEND.two_q_gate_type, benchmark)
-        assert circuit_validator(result, BACKEND)
+        assert circuit_validator(result, BACKEND, input_circuit=circuit)
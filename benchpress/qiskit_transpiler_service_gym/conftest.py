@@ -11,12 +11,29 @@
 # that they have been altered from the originals.
 from importlib.metadata import version
 
+import pytest
 import qiskit
 import qiskit_ibm_runtime
 
+from benchpress.config import Configuration
+
 AI_SERVICE_VERSION = version("qiskit_ibm_transpiler")
 
 
+@pytest.fixture(scope="session")
+def trans_service(backend):
+    """Transpiler service configured for the target backend"""
+    from qiskit_ibm_transpiler.transpiler_service import TranspilerService
+
+    return TranspilerService(
+        coupling_map=list(backend.coupling_map.get_edges()),
+        qiskit_transpile_options={"basis_gates": backend.operation_names},
+        ai=True,
+        optimization_level=Configuration.options["qiskit"]["optimization_level"],
+        timeout=3600,
+    )
+
+
 def pytest_report_header(config):
     """Add some info about packages and backend to the pytest CLI header"""
     ret = [
@@ -13,12 +13,10 @@
 
 from qiskit.circuit.library import EfficientSU2
 
-from qiskit_ibm_transpiler.transpiler_service import TranspilerService
-
 from benchpress.config import Configuration
 from benchpress.qiskit_gym.circuits import bv_all_ones
 from benchpress.utilities.io import (
-    qasm_circuit_loader,
+    cached_qasm_circuit_loader,
     input_circuit_properties,
     output_circuit_properties,
 )
@@ -27,91 +25,79 @@ from benchpress.workouts.validation import benchpress_test_validation
 from benchpress.workouts.device_transpile import WorkoutDeviceTranspile100Q
 from benchpress.qiskit_gym.circuits import trivial_bvlike_circuit
 
-BACKEND = Configuration.backend()
-TWO_Q_GATE = BACKEND.two_q_gate_type
-OPTIMIZATION_LEVEL = Configuration.options["qiskit"]["optimization_level"]
-
-TRANS_SERVICE = TranspilerService(
-    coupling_map=list(BACKEND.coupling_map.get_edges()),
-    qiskit_transpile_options={"basis_gates": BACKEND.operation_names},
-    ai=True,
-    optimization_level=OPTIMIZATION_LEVEL,
-    timeout=3600,
-)
-
 
 @benchpress_test_validation
 class TestWorkoutDeviceTranspile100Q(WorkoutDeviceTranspile100Q):
-    def test_QFT_100_transpile(self, benchmark):
+    def test_QFT_100_transpile(self, benchmark, backend, trans_service):
         """Compile 100Q QFT circuit against target backend"""
-        circuit = qasm_circuit_loader(
+        circuit = cached_qasm_circuit_loader(
             Configuration.get_qasm_dir("qft") + "qft_N100.qasm", benchmark
         )
 
         @benchmark
         def result():
-            trans_qc = TRANS_SERVICE.run(circuit)
+            trans_qc = trans_service.run(circuit)
             return trans_qc
 
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend, input_circuit=circuit)
 
-    def test_QV_100_transpile(self, benchmark):
+    def test_QV_100_transpile(self, benchmark, backend, trans_service):
         """Compile 10Q QV circuit against target backend"""
-        circuit = qasm_circuit_loader(
+        circuit = cached_qasm_circuit_loader(
             Configuration.get_qasm_dir("qv") + "qv_N100_12345.qasm", benchmark
         )
 
         @benchmark
         def result():
-            trans_qc = TRANS_SERVICE.run(circuit)
+            trans_qc = trans_service.run(circuit)
             return trans_qc
 
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend, input_circuit=circuit)
 
-    def test_circSU2_89_transpile(self, benchmark):
+    def test_circSU2_89_transpile(self, benchmark, backend, trans_service):
         """Compile 89Q circSU2 circuit against target backend"""
         circuit = EfficientSU2(89, reps=3, entanglement="circular")
         input_circuit_properties(circuit, benchmark)
 
         @benchmark
         def result():
-            trans_qc = TRANS_SERVICE.run(circuit)
+            trans_qc = trans_service.run(circuit)
             return trans_qc
 
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend, input_circuit=circuit)
 
-    def test_circSU2_100_transpile(self, benchmark):
+    def test_circSU2_100_transpile(self, benchmark, backend, trans_service):
         """Compile 100Q circSU2 circuit against target backend"""
         circuit = EfficientSU2(100, reps=3, entanglement="circular")
         input_circuit_properties(circuit, benchmark)
 
         @benchmark
         def result():
-            trans_qc = TRANS_SERVICE.run(circuit)
+            trans_qc = trans_service.run(circuit)
             return trans_qc
 
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend, input_circuit=circuit)
 
-    def test_BV_100_transpile(self, benchmark):
+    def test_BV_100_transpile(self, benchmark, backend, trans_service):
         """Compile 100Q BV circuit against target backend"""
         circuit = bv_all_ones(100)
         input_circuit_properties(circuit, benchmark)
 
         @benchmark
         def result():
-            trans_qc = TRANS_SERVICE.run(circuit)
+            trans_qc = trans_service.run(circuit)
             return trans_qc
 
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend, input_circuit=circuit)
 
-    def test_square_heisenberg_100_transpile(self, benchmark):
+    def test_square_heisenberg_100_transpile(self, benchmark, backend, trans_service):
         """Compile 100Q square-Heisenberg circuit against target backend"""
-        circuit = qasm_circuit_loader(
+        circuit = cached_qasm_circuit_loader(
             Configuration.get_qasm_dir("square-heisenberg")
             + "square_heisenberg_N100.qasm",
             benchmark,
@@ -119,28 +105,28 @@ class TestWorkoutDeviceTranspile100Q(WorkoutDeviceTranspile100Q):
 
         @benchmark
         def result():
-            trans_qc = TRANS_SERVICE.run(circuit)
+            trans_qc = trans_service.run(circuit)
             return trans_qc
 
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend, input_circuit=circuit)
 
-    def test_QAOA_100_transpile(self, benchmark):
+    def test_QAOA_100_transpile(self, benchmark, backend, trans_service):
         """Compile 100Q QAOA circuit against target backend"""
-        circuit = qasm_circuit_loader(
+        circuit = cached_qasm_circuit_loader(
             Configuration.get_qasm_dir("qaoa") + "qaoa_barabasi_albert_N100_3reps.qasm",
             benchmark,
         )
 
         @benchmark
         def result():
-            trans_qc = TRANS_SERVICE.run(circuit)
+            trans_qc = trans_service.run(circuit)
             return trans_qc
 
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend, input_circuit=circuit)
 
-    def test_BVlike_simplification_transpile(self, benchmark):
+    def test_BVlike_simplification_transpile(self, benchmark, backend, trans_service):
         """Transpile a BV-like circuit that should collapse down
         into a single X and Z gate on a target device
         """
@@ -149,23 +135,23 @@ class TestWorkoutDeviceTranspile100Q(WorkoutDeviceTranspile100Q):
 
         @benchmark
         def result():
-            trans_qc = TRANS_SERVICE.run(circuit)
+            trans_qc = trans_service.run(circuit)
             return trans_qc
 
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend, input_circuit=circuit)
 
-    def test_clifford_100_transpile(self, benchmark):
+    def test_clifford_100_transpile(self, benchmark, backend, trans_service):
         """Compile 10Q Clifford circuit against target backend"""
-        circuit = qasm_circuit_loader(
+        circuit = cached_qasm_circuit_loader(
             Configuration.get_qasm_dir("clifford") + "clifford_100_12345.qasm",
             benchmark,
         )
 
         @benchmark
         def result():
-            trans_qc = TRANS_SERVICE.run(circuit)
+            trans_qc = trans_service.run(circuit)
             return trans_qc
 
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend, input_circuit=circuit)
@@ -17,7 +17,7 @@ from benchpress.utilities.io import input_circuit_properties, output_circuit_pro
 from benchpress.utilities.io.hamiltonians import generate_hamiltonian_circuit
 from benchpress.workouts.validation import benchpress_test_validation
 from benchpress.config import Configuration
-from benchpress.utilities.backends import FlexibleBackend
+from benchpress.utilities.backends import get_flexible_backend
 from benchpress.utilities.validation import circuit_validator
 
 
@@ -34,11 +34,9 @@ OPTIMIZATION_LEVEL = Configuration.options["qpanda"]["optimization_level"]
 class TestWorkoutAbstractHamiltonians(WorkoutAbstractHamiltonians):
     @pytest.mark.parametrize("circ_and_topo", HAM_TOPO, ids=HAM_TOPO_NAMES)
     def test_hamiltonians(self, benchmark, circ_and_topo):
-        prog = generate_hamiltonian_circuit(
-            circ_and_topo[0].pop("ham_hamlib_hamiltonian"), benchmark
-        )
+        prog = generate_hamiltonian_circuit(circ_and_topo[0].operator(), benchmark)
         input_circuit_properties(prog, benchmark)
-        backend = FlexibleBackend(len(prog.qubits()), layout=circ_and_topo[1])
+        backend = get_flexible_backend(len(prog.qubits()), layout=circ_and_topo[1])
         topo = backend.configuration().coupling_map
         pm = Transpiler()
 
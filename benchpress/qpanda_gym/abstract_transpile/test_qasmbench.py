@@ -12,7 +12,7 @@
 """Test qasmbench against abstract backend topologies"""
 
 from benchpress.config import Configuration
-from benchpress.utilities.backends import FlexibleBackend
+from benchpress.utilities.backends import get_flexible_backend
 from benchpress.workouts.abstract_transpile.qasmbench import (
     SMALL_CIRC_TOPO,
     SMALL_NAMES,
@@ -38,7 +38,10 @@ OPTIMIZATION_LEVEL = Configuration.options["qiskit"]["optimization_level"]
 """Test qasmbench against abstract backend topologies"""
 import pytest
 from pyqpanda3.transpilation import *
-from benchpress.utilities.io import qasm_circuit_loader, output_circuit_properties
+from benchpress.utilities.io import (
+    cached_qasm_circuit_loader,
+    output_circuit_properties,
+)
 from benchpress.utilities.validation import circuit_validator
 from benchpress.workouts.validation import benchpress_test_validation
 from benchpress.config import Configuration
@@ -56,8 +59,8 @@ OPTIMIZATION_LEVEL = Configuration.options["qpanda"]["optimization_level"]
 class TestWorkoutAbstractQasmBenchSmall(WorkoutAbstractQasmBenchSmall):
     @pytest.mark.parametrize("circ_and_topo", SMALL_CIRC_TOPO, ids=SMALL_NAMES)
     def test_QASMBench_small(self, benchmark, circ_and_topo):
-        prog = qasm_circuit_loader(circ_and_topo[0], benchmark)
-        backend = FlexibleBackend(len(prog.qubits()), layout=circ_and_topo[1])
+        prog = cached_qasm_circuit_loader(circ_and_topo[0], benchmark)
+        backend = get_flexible_backend(len(prog.qubits()), layout=circ_and_topo[1])
         topo = backend.configuration().coupling_map
         pm = Transpiler()
 
@@ -75,8 +78,8 @@ class TestWorkoutAbstractQasmBenchSmall(WorkoutAbstractQasmBenchSmall):
 class TestWorkoutAbstractQasmBenchMedium(WorkoutAbstractQasmBenchMedium):
     @pytest.mark.parametrize("circ_and_topo", MEDIUM_CIRC_TOPO, ids=MEDIUM_NAMES)
     def test_QASMBench_medium(self, benchmark, circ_and_topo):
-        prog = qasm_circuit_loader(circ_and_topo[0], benchmark)
-        backend = FlexibleBackend(len(prog.qubits()), layout=circ_and_topo[1])
+        prog = cached_qasm_circuit_loader(circ_and_topo[0], benchmark)
+        backend = get_flexible_backend(len(prog.qubits()), layout=circ_and_topo[1])
         topo = backend.configuration().coupling_map
         pm = Transpiler()
 
@@ -94,8 +97,8 @@ class TestWorkoutAbstractQasmBenchMedium(WorkoutAbstractQasmBenchMedium):
 class TestWorkoutAbstractQasmBenchLarge(WorkoutAbstractQasmBenchLarge):
     @pytest.mark.parametrize("circ_and_topo", LARGE_CIRC_TOPO, ids=LARGE_NAMES)
     def test_QASMBench_large(self, benchmark, circ_and_topo):
-        prog = qasm_circuit_loader(circ_and_topo[0], benchmark)
-        backend = FlexibleBackend(len(prog.qubits()), layout=circ_and_topo[1])
+        prog = cached_qasm_circuit_loader(circ_and_topo[0], benchmark)
+        backend = get_flexible_backend(len(prog.qubits()), layout=circ_and_topo[1])
         topo = backend.configuration().coupling_map
         pm = Transpiler()
 
@@ -10,39 +10,40 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 """Test transpilation against a device"""
-import os
 import pytest
 from pyqpanda3.transpilation import *
 from benchpress.config import Configuration
 from benchpress.workouts.validation import benchpress_test_validation
-from benchpress.workouts.device_transpile import WorkoutDeviceFeynman
-from benchpress.utilities.io import qasm_circuit_loader, output_circuit_properties
+from benchpress.workouts.device_transpile import (
+    WorkoutDeviceFeynman,
+    feynman_parameters,
+)
+from benchpress.utilities.io import (
+    cached_qasm_circuit_loader,
+    output_circuit_properties,
+)
 from benchpress.utilities.validation import circuit_validator
 
-BACKEND = Configuration.backend()
-TWO_Q_GATE = BACKEND.two_q_gate_type
 OPTIMIZATION_LEVEL = Configuration.options["qpanda"]["optimization_level"]
 
 
 def pytest_generate_tests(metafunc):
-    directory = Configuration.get_qasm_dir("feynman")
-    file_list = [x for x in os.listdir(directory) if x.endswith(".qasm")]
-    metafunc.parametrize("filename", file_list)
+    metafunc.parametrize("filename", feynman_parameters())
 
 
 @benchpress_test_validation
 class TestWorkoutDeviceFeynman(WorkoutDeviceFeynman):
 
-    def test_feynman_transpile(self, benchmark, filename):
+    def test_feynman_transpile(self, benchmark, filename, backend):
         """Transpile a feynman benchmark qasm file against a target device"""
-        prog = qasm_circuit_loader(
+        prog = cached_qasm_circuit_loader(
             f"{Configuration.get_qasm_dir('feynman')}{filename}", benchmark
         )
 
-        if len(prog.qubits()) > BACKEND.num_qubits:
+        if len(prog.qubits()) > backend.num_qubits:
             pytest.skip("Circuit too large for given backend.")
         pm = Transpiler()
-        topo = BACKEND.configuration().coupling_map
+        topo = backend.configuration().coupling_map
         # print(topo)
 
         @benchmark
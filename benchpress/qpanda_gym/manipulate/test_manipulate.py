@@ -2,7 +2,7 @@
 import numpy as np
 
 from benchpress.config import Configuration
-from benchpress.utilities.io import qasm_circuit_loader
+from benchpress.utilities.io import cached_qasm_circuit_loader
 from benchpress.qpanda_gym.circuits import multi_control_circuit
 from benchpress.workouts.validation import benchpress_test_validation
 from benchpress.workouts.manipulate import WorkoutCircuitManipulate
@@ -15,7 +15,7 @@ class TestWorkoutCircuitManipulate(WorkoutCircuitManipulate):
         """Perform Pauli-twirling on a 100Q QV
         circuit
         """
-        circuit = qasm_circuit_loader(
+        circuit = cached_qasm_circuit_loader(
             Configuration.get_qasm_dir("dtc") + "dtc_100_cx_12345.qasm", benchmark
         )
 
@@ -54,7 +54,7 @@ class TestWorkoutCircuitManipulate(WorkoutCircuitManipulate):
         """Change a QV100 circuit basis from [rx, ry, rz, cx]
         to [sx, x, rz, cz]
         """
-        circ = qasm_circuit_loader(
+        circ = cached_qasm_circuit_loader(
             Configuration.get_qasm_dir("qv") + "qv_N100_12345.qasm", benchmark
         )
 
@@ -71,7 +71,7 @@ class TestWorkoutCircuitManipulate(WorkoutCircuitManipulate):
         basis [rz, sx, x, cz]
         """
 
-        cliff_circ = qasm_circuit_loader(
+        cliff_circ = cached_qasm_circuit_loader(
             Configuration.get_qasm_dir("clifford") + "clifford_20_12345.qasm", benchmark
         )
 
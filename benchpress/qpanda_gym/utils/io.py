@@ -15,9 +15,19 @@ from qiskit.circuit.library import PauliEvolutionGate
 from time import perf_counter
 from pyqpanda3.compiler import *
 
+from benchpress.utilities.io.qasm_files import is_compressed_qasm, read_qasm
+from benchpress.utilities.metrics import (
+    circuit_arrays_from_operations,
+    record_output_metrics,
+)
+
+
 def qpanda_qasm_loader(qasm_file, benchmark):
     start = perf_counter()
-    prog = convert_qasm_file_to_qprog(qasm_file)
+    if is_compressed_qasm(qasm_file):
+        prog = convert_qasm_string_to_qprog(read_qasm(qasm_file))
+    else:
+        prog = convert_qasm_file_to_qprog(qasm_file)
 
     stop = perf_counter()
     benchmark.extra_info["qasm_load_time"] = stop - start
@@ -41,13 +51,24 @@ def qpanda_input_circuit_properties(circuit, benchmark):
 
 
 def qpanda_output_circuit_properties(circuit, two_qubit_gate, benchmark):
-    benchmark.extra_info["output_num_qubits"] = len(circuit.qubits())
-    benchmark.extra_info["output_circuit_operations"] = circuit.count_ops(False)
-    if two_qubit_gate == '2Q_GATE':
-        benchmark.extra_info["output_gate_count_2q"] = len(circuit.gate_operations(True))
-    else:
-        benchmark.extra_info["output_gate_count_2q"] = circuit.count_ops(False).get(
-            two_qubit_gate, 0
-        )
-    benchmark.extra_info["output_depth_2q"] = circuit.depth(True)
+    arrays = qpanda_circuit_arrays(circuit)
+    # '2Q_GATE' stands for whichever two-qubit gates qpanda compiled to
+    record_output_metrics(
+        arrays, None if two_qubit_gate == "2Q_GATE" else two_qubit_gate, benchmark
+    )
+    return arrays
 
+
+def qpanda_circuit_arrays(circuit):
+    """Convert a QProg to circuit arrays
+
+    Parameters:
+        circuit (QProg): The program
+
+    Returns:
+        CircuitArrays: The circuit arrays, on the program's qubit indices
+    """
+    return circuit_arrays_from_operations(
+        len(circuit.qubits()),
+        ((op.name(), op.qubits()) for op in circuit.gate_operations(False)),
+    )
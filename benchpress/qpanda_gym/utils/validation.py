@@ -11,6 +11,8 @@
 # that they have been altered from the originals.
 """Basic circuit validation"""
 
+from benchpress.utilities.validation.topology import get_adjacency, validate_edges
+
 
 def qpanda_circuit_validation(circuit, backend):
     """Validate that input circuit matches gate set
@@ -20,22 +22,17 @@ def qpanda_circuit_validation(circuit, backend):
         circuit (QuantumCircuit): Input circuit
         backend (BackendV2): Target backend
     """
-    ops = circuit.gate_operations(False)
-    arch_map = dict()
-    for edge in backend:
-        u, v = edge
-        if u not in arch_map:
-            arch_map[u] = []
-        if v not in arch_map:
-            arch_map[v] = []
-
-        arch_map[u].append(v)
-        arch_map[v].append(u)
-    for op in ops:
+    pairs = []
+    for op in circuit.gate_operations(False):
         qubits = op.qubits()
         if len(qubits) > 1:
-            if qubits[1] in arch_map[qubits[0]]:
-                continue
-            else:
-                raise Exception(f"2Q gate {op.name()}edge {qubits} not in backend topology")
+            pairs.append(qubits[:2])
+    validate_edges(pairs, get_adjacency(backend, qpanda_backend_edges))
     return True
+
+
+def qpanda_backend_edges(backend):
+    """Undirected edges of an edge list topology, for `get_adjacency`"""
+    edges = [tuple(edge) for edge in backend]
+    num_qubits = max((max(edge) for edge in edges), default=-1) + 1
+    return num_qubits, edges, True
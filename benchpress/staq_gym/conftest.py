@@ -12,12 +12,37 @@
 
 import importlib.metadata
 
+import pytest
 import qiskit
 import qiskit_ibm_runtime
 
+from benchpress.config import Configuration
+
 PYSTAQ_VERSION = importlib.metadata.version("pystaq")
 
 
+@pytest.fixture(scope="session")
+def qiskit_backend():
+    """Qiskit view of the target device, used to validate staq output"""
+    from benchpress.utilities.backends import get_backend
+
+    return get_backend(Configuration.options["general"]["backend_name"], "qiskit")
+
+
+@pytest.fixture(scope="session")
+def staq_device():
+    """Return the device JSON file of a pystaq Device
+
+    Files are cached per device, see `staq_device_file`.
+    """
+    from benchpress.staq_gym.utils.staq_backend_utils import staq_device_file
+
+    def _staq_device(backend):
+        return staq_device_file(backend)
+
+    return _staq_device
+
+
 def pytest_report_header(config):
     """Add some info about packages and backend to the pytest CLI header"""
     return [
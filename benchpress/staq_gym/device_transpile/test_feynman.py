@@ -11,89 +11,55 @@
 # that they have been altered from the originals.
 """Test transpilation against a device"""
 import json
-import os
-import subprocess
 
 import pytest
-from qiskit import QuantumCircuit
 
 from benchpress.config import Configuration
-from benchpress.utilities.io import qasm_circuit_loader, output_circuit_properties
+from benchpress.utilities.io import (
+    cached_qasm_circuit_loader,
+    uncompressed_qasm_file,
+    output_circuit_properties,
+)
 from benchpress.utilities.validation import circuit_validator
-from benchpress.workouts.device_transpile import WorkoutDeviceFeynman
-from benchpress.workouts.validation import benchpress_test_validation
-from benchpress.qiskit_gym.utils.qiskit_backend_utils import get_qiskit_bench_backend
-
-QISKIT_BACKEND = get_qiskit_bench_backend(
-    Configuration.options["general"]["backend_name"]
+from benchpress.staq_gym.utils.compile import staq_compile
+from benchpress.staq_gym.utils.io import staq_output_circuit
+from benchpress.workouts.device_transpile import (
+    WorkoutDeviceFeynman,
+    feynman_parameters,
 )
-BACKEND = Configuration.backend()
-LAYOUT = Configuration.options["staq"]["layout"]
-MAPPING = Configuration.options["staq"]["mapping"]
-OPTIMIZATION_LEVEL = Configuration.options["staq"]["optimization_level"]
-
-# Truncating OPTIMIZATION_LEVEL to max 2
-# OPTIMIZATION_LEVEL=3 uses a `--cnot-resynthesis` flag
-# that removes qubit connectivity
-OPTIMIZATION_LEVEL = min(2, OPTIMIZATION_LEVEL)
-
-RUN_ARGS_COMMON = [
-    "staq",
-    "-S",
-    f"-O{OPTIMIZATION_LEVEL}",
-    "-l",
-    LAYOUT,
-    "-M",
-    MAPPING,
-    "-f",
-    "qasm",
-]
+from benchpress.workouts.validation import benchpress_test_validation
 
 
 def pytest_generate_tests(metafunc):
-    directory = Configuration.get_qasm_dir("feynman")
-    file_list = [x for x in os.listdir(directory) if x.endswith(".qasm")]
-    metafunc.parametrize("filename", file_list)
-
-
-@pytest.fixture(scope="session")
-def staq_device(tmp_path_factory):
-    def _staq_device(backend):
-        device_file = tmp_path_factory.getbasetemp() / "device.json"
-        with open(device_file, "w") as f:
-            f.write(str(backend))
-
-        return device_file
-
-    return _staq_device
+    metafunc.parametrize("filename", feynman_parameters())
 
 
 @benchpress_test_validation
 class TestWorkoutDeviceFeynman(WorkoutDeviceFeynman):
 
-    def test_feynman_transpile(self, benchmark, filename, staq_device):
+    def test_feynman_transpile(
+        self, benchmark, filename, staq_device, backend, qiskit_backend
+    ):
         """Transpile a feynman benchmark qasm file against a target device"""
-        device = staq_device(backend=BACKEND)
+        device = staq_device(backend=backend)
         # Pystaq Device does not have an attribute for number of qubits in the device
         # Therefore, we have to load the device json file and get the length of "qubits"
         with open(device, "r") as jf:
             dev = json.load(jf)
         num_qubits = len(dev["qubits"])
-        input_qasm_file = f"{Configuration.get_qasm_dir('feynman')}{filename}"
+        input_qasm_file = uncompressed_qasm_file(
+            f"{Configuration.get_qasm_dir('feynman')}{filename}"
+        )
 
-        circuit = qasm_circuit_loader(input_qasm_file, benchmark)
+        circuit = cached_qasm_circuit_loader(input_qasm_file, benchmark)
         if circuit.num_qubits > num_qubits:
             pytest.skip("Circuit too large for given backend.")
 
         @benchmark
-        def result():
-            out = subprocess.run(
-                RUN_ARGS_COMMON + ["-m", "--device", device, input_qasm_file],
-                capture_output=True,
-                text=True,
-            )
+        def output_qasm():
+            return staq_compile(input_qasm_file, device)
 
-            return QuantumCircuit.from_qasm_str(out.stdout)
+        result = staq_output_circuit(output_qasm, benchmark)
 
         output_circuit_properties(result, "cx", benchmark)
-        assert circuit_validator(result, QISKIT_BACKEND)
+        assert circuit_validator(result, qiskit_backend)
@@ -10,94 +10,57 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 """Test transpilation against a device"""
-import subprocess
 
 import numpy as np
 import pytest
-from qiskit import QuantumCircuit, qasm2
+from qiskit import qasm2
 from qiskit.circuit.library import EfficientSU2
 
 from benchpress.config import Configuration
 from benchpress.utilities.io import (
-    qasm_circuit_loader,
+    cached_qasm_circuit_loader,
+    uncompressed_qasm_file,
     input_circuit_properties,
     output_circuit_properties,
 )
 from benchpress.utilities.validation import circuit_validator
+from benchpress.staq_gym.utils.compile import staq_compile
+from benchpress.staq_gym.utils.io import staq_output_circuit
 from benchpress.qiskit_gym.circuits import bv_all_ones, trivial_bvlike_circuit
 from benchpress.workouts.device_transpile import WorkoutDeviceTranspile100Q
 from benchpress.workouts.validation import benchpress_test_validation
-from benchpress.qiskit_gym.utils.qiskit_backend_utils import get_qiskit_bench_backend
-
-QISKIT_BACKEND = get_qiskit_bench_backend(
-    Configuration.options["general"]["backend_name"]
-)
-BACKEND = Configuration.backend()
-LAYOUT = Configuration.options["staq"]["layout"]
-MAPPING = Configuration.options["staq"]["mapping"]
-OPTIMIZATION_LEVEL = Configuration.options["staq"]["optimization_level"]
-
-# Truncating OPTIMIZATION_LEVEL to max 2
-# OPTIMIZATION_LEVEL=3 uses a `--cnot-resynthesis` flag
-# that removes qubit connectivity
-OPTIMIZATION_LEVEL = min(2, OPTIMIZATION_LEVEL)
-
-RUN_ARGS_COMMON = [
-    "staq",
-    "-S",
-    f"-O{OPTIMIZATION_LEVEL}",
-    "-l",
-    LAYOUT,
-    "-M",
-    MAPPING,
-    "-f",
-    "qasm",
-]
-
-
-@pytest.fixture(scope="session")
-def staq_device(tmp_path_factory):
-    def _staq_device(backend):
-        device_file = tmp_path_factory.getbasetemp() / "device.json"
-        with open(device_file, "w") as f:
-            f.write(str(backend))
-
-        return device_file
-
-    return _staq_device
 
 
 @benchpress_test_validation
 class TestWorkoutDeviceTranspile100Q(WorkoutDeviceTranspile100Q):
-    def test_QFT_100_transpile(self, benchmark, staq_device):
+    def test_QFT_100_transpile(self, benchmark, staq_device, backend, qiskit_backend):
         """Compile 100Q QFT circuit against target backend"""
-        device = staq_device(backend=BACKEND)
+        device = staq_device(backend=backend)
         qasm_file = "qft_N100.qasm"
-        input_qasm_file = Configuration.get_qasm_dir("qft") + qasm_file
-        _ = qasm_circuit_loader(input_qasm_file, benchmark)
+        input_qasm_file = uncompressed_qasm_file(
+            Configuration.get_qasm_dir("qft") + qasm_file
+        )
+        _ = cached_qasm_circuit_loader(input_qasm_file, benchmark)
 
         @benchmark
-        def result():
-            out = subprocess.run(
-                RUN_ARGS_COMMON + ["-m", "--device", device, input_qasm_file],
-                capture_output=True,
-                text=True,
-            )
-
-            return QuantumCircuit.from_qasm_str(out.stdout)
+        def output_qasm():
+            return staq_compile(input_qasm_file, device)
 
         # load output QASM as a QuantumCircuit to get statistics as
         # staq does not have built-in utilities for such
+        result = staq_output_circuit(output_qasm, benchmark)
         output_circuit_properties(result, "cx", benchmark)
-        assert circuit_validator(result, QISKIT_BACKEND)
+        assert circuit_validator(result, qiskit_backend)
 
     def test_QV_100_transpile(self, _benchmark, _staq_device):
         """Compile 100Q QV circuit against target backend"""
         pytest.fail("staq lacks support for running QV as it doesn't support 2q unitary operators")
 
-    def test_circSU2_89_transpile(self, benchmark, tmp_path_factory, staq_device):
+    def test_circSU2_89_transpile(
+        self, benchmark, tmp_path_factory, staq_device, backend, qiskit_backend
+    ):
         """Compile 89Q circSU2 circuit against target backend"""
-        device = staq_device(backend=BACKEND)
+        device = staq_device(backend=backend)
         circuit = EfficientSU2(89, reps=3, entanglement="circular")
         input_circuit_properties(circuit, benchmark)
         # staq works on qasm files only & qasm files need bounded params
@@ -111,21 +74,19 @@ class TestWorkoutDeviceTranspile100Q(WorkoutDeviceTranspile100Q):
         qasm2.dump(circuit, input_qasm_file)
 
         @benchmark
-        def result():
-            out = subprocess.run(
-                RUN_ARGS_COMMON + ["-m", "--device", device, input_qasm_file],
-                capture_output=True,
-                text=True,
-            )
+        def output_qasm():
+            return staq_compile(input_qasm_file, device)
 
-            return QuantumCircuit.from_qasm_str(out.stdout)
+        result = staq_output_circuit(output_qasm, benchmark)
 
         output_circuit_properties(result, "cx", benchmark)
-        assert circuit_validator(result, QISKIT_BACKEND)
+        assert circuit_validator(result, qiskit_backend)
 
-    def test_circSU2_100_transpile(self, benchmark, tmp_path_factory, staq_device):
+    def test_circSU2_100_transpile(
+        self, benchmark, tmp_path_factory, staq_device, backend, qiskit_backend
+    ):
         """Compile 100Q circSU2 circuit against target backend"""
-        device = staq_device(backend=BACKEND)
+        device = staq_device(backend=backend)
         circuit = EfficientSU2(100, reps=3, entanglement="circular")
         input_circuit_properties(circuit, benchmark)
         # staq works on qasm files only & qasm files need bounded params
@@ -139,21 +100,19 @@ class TestWorkoutDeviceTranspile100Q(WorkoutDeviceTranspile100Q):
         qasm2.dump(circuit, input_qasm_file)
 
         @benchmark
-        def result():
-            out = subprocess.run(
-                RUN_ARGS_COMMON + ["-m", "--device", device, input_qasm_file],
-                capture_output=True,
-                text=True,
-            )
+        def output_qasm():
+            return staq_compile(input_qasm_file, device)
 
-            return QuantumCircuit.from_qasm_str(out.stdout)
+        result = staq_output_circuit(output_qasm, benchmark)
 
         output_circuit_properties(result, "cx", benchmark)
-        assert circuit_validator(result, QISKIT_BACKEND)
+        assert circuit_validator(result, qiskit_backend)
 
-    def test_BV_100_transpile(self, benchmark, tmp_path_factory, staq_device):
+    def test_BV_100_transpile(
+        self, benchmark, tmp_path_factory, staq_device, backend, qiskit_backend
+    ):
         """Compile 100Q BV circuit against target backend"""
-        device = staq_device(backend=BACKEND)
+        device = staq_device(backend=backend)
         circuit = bv_all_ones(100)
         input_circuit_properties(circuit, benchmark)
         base_temp_dir = tmp_path_factory.getbasetemp()
@@ -161,65 +120,59 @@ class TestWorkoutDeviceTranspile100Q(WorkoutDeviceTranspile100Q):
         qasm2.dump(circuit, input_qasm_file)
 
         @benchmark
-        def result():
-            out = subprocess.run(
-                RUN_ARGS_COMMON + ["-m", "--device", device, input_qasm_file],
-                capture_output=True,
-                text=True,
-            )
+        def output_qasm():
+            return staq_compile(input_qasm_file, device)
 
-            return QuantumCircuit.from_qasm_str(out.stdout)
+        result = staq_output_circuit(output_qasm, benchmark)
 
         output_circuit_properties(result, "cx", benchmark)
-        assert circuit_validator(result, QISKIT_BACKEND)
+        assert circuit_validator(result, qiskit_backend)
 
-    def test_square_heisenberg_100_transpile(self, benchmark, staq_device):
+    def test_square_heisenberg_100_transpile(
+        self, benchmark, staq_device, backend, qiskit_backend
+    ):
         """Compile 100Q square-Heisenberg circuit against target backend"""
-        device = staq_device(backend=BACKEND)
+        device = staq_device(backend=backend)
         qasm_file = "square_heisenberg_N100.qasm"
-        input_qasm_file = Configuration.get_qasm_dir("square-heisenberg") + qasm_file
-        _ = qasm_circuit_loader(input_qasm_file, benchmark)
+        input_qasm_file = uncompressed_qasm_file(
+            Configuration.get_qasm_dir("square-heisenberg") + qasm_file
+        )
+        _ = cached_qasm_circuit_loader(input_qasm_file, benchmark)
 
         @benchmark
-        def result():
-            out = subprocess.run(
-                RUN_ARGS_COMMON + ["-m", "--device", device, input_qasm_file],
-                capture_output=True,
-                text=True,
-            )
+        def output_qasm():
+            return staq_compile(input_qasm_file, device)
 
-            return QuantumCircuit.from_qasm_str(out.stdout)
+        result = staq_output_circuit(output_qasm, benchmark)
 
         output_circuit_properties(result, "cx", benchmark)
-        assert circuit_validator(result, QISKIT_BACKEND)
+        assert circuit_validator(result, qiskit_backend)
 
-    def test_QAOA_100_transpile(self, benchmark, staq_device):
+    def test_QAOA_100_transpile(self, benchmark, staq_device, backend, qiskit_backend):
         """Compile 100Q QAOA circuit against target backend"""
-        device = staq_device(backend=BACKEND)
+        device = staq_device(backend=backend)
         qasm_file = "qaoa_barabasi_albert_N100_3reps.qasm"
-        input_qasm_file = Configuration.get_qasm_dir("qaoa") + qasm_file
-        _ = qasm_circuit_loader(input_qasm_file, benchmark)
+        input_qasm_file = uncompressed_qasm_file(
+            Configuration.get_qasm_dir("qaoa") + qasm_file
+        )
+        _ = cached_qasm_circuit_loader(input_qasm_file, benchmark)
 
         @benchmark
-        def result():
-            out = subprocess.run(
-                RUN_ARGS_COMMON + ["-m", "--device", device, input_qasm_file],
-                capture_output=True,
-                text=True,
-            )
+        def output_qasm():
+            return staq_compile(input_qasm_file, device)
 
-            return QuantumCircuit.from_qasm_str(out.stdout)
+        result = staq_output_circuit(output_qasm, benchmark)
 
         output_circuit_properties(result, "cx", benchmark)
-        assert circuit_validator(result, QISKIT_BACKEND)
+        assert circuit_validator(result, qiskit_backend)
 
     def test_BVlike_simplification_transpile(
-        self, benchmark, tmp_path_factory, staq_device
+        self, benchmark, tmp_path_factory, staq_device, backend, qiskit_backend
     ):
         """Transpile a BV-like circuit that should collapse down
         into a single X and Z gate on a target device
         """
-        device = staq_device(backend=BACKEND)
+        device = staq_device(backend=backend)
         circuit = trivial_bvlike_circuit(100)
         input_circuit_properties(circuit, benchmark)
         base_temp_dir = tmp_path_factory.getbasetemp()
@@ -227,36 +180,31 @@ class TestWorkoutDeviceTranspile100Q(WorkoutDeviceTranspile100Q):
         qasm2.dump(circuit, input_qasm_file)
 
         @benchmark
-        def result():
-            out = subprocess.run(
-                RUN_ARGS_COMMON + ["-m", "--device", device, input_qasm_file],
-                capture_output=True,
-                text=True,
-            )
+        def output_qasm():
+            return staq_compile(input_qasm_file, device)
 
-            return QuantumCircuit.from_qasm_str(out.stdout)
+        result = staq_output_circuit(output_qasm, benchmark)
 
         output_circuit_properties(result, "cx", benchmark)
-        assert circuit_validator(result, QISKIT_BACKEND)
+        assert circuit_validator(result, qiskit_backend)
 
-    def test_clifford_100_transpile(self, benchmark, staq_device):
+    def test_clifford_100_transpile(
+        self, benchmark, staq_device, backend, qiskit_backend
+    ):
         """Compile 100Q Clifford circuit against target backend"""
-        device = staq_device(backend=BACKEND)
+        device = staq_device(backend=backend)
         qasm_file = "clifford_100_12345.qasm"
-        input_qasm_file = Configuration.get_qasm_dir("clifford") + qasm_file
-        _ = qasm_circuit_loader(input_qasm_file, benchmark)
+        input_qasm_file = uncompressed_qasm_file(
+            Configuration.get_qasm_dir("clifford") + qasm_file
+        )
+        _ = cached_qasm_circuit_loader(input_qasm_file, benchmark)
 
         @benchmark
-        def result():
-            out = subprocess.run(
-                RUN_ARGS_COMMON + ["-m", "--device", device, input_qasm_file],
-                capture_output=True,
-                text=True,
-            )
-
-            return QuantumCircuit.from_qasm_str(out.stdout)
+        def output_qasm():
+            return staq_compile(input_qasm_file, device)
 
         # load output QASM as a QuantumCircuit to get statistics as
         # staq does not have built-in utilities for such
+        result = staq_output_circuit(output_qasm, benchmark)
         output_circuit_properties(result, "cx", benchmark)
-        assert circuit_validator(result, QISKIT_BACKEND)
+        assert circuit_validator(result, qiskit_backend)
@@ -9,6 +9,29 @@
 # Any modifications or derivative works of this code must retain this
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
+from time import perf_counter
+
+
+def staq_output_circuit(output_qasm, benchmark):
+    """Parse the QASM output of staq after the timed region
+
+    staq has no circuit object of its own, so output statistics and
+    validation use a Qiskit circuit.  The parse time is recorded as
+    `output_parse_time` rather than attributed to staq.
+
+    Parameters:
+        output_qasm (str): QASM returned by `staq_compile`
+        benchmark (Benchmark): Benchmark class to record info to
+
+    Returns:
+        QuantumCircuit: The compiled circuit
+    """
+    from qiskit import QuantumCircuit
+
+    start = perf_counter()
+    circuit = QuantumCircuit.from_qasm_str(output_qasm)
+    benchmark.extra_info["output_parse_time"] = perf_counter() - start
+    return circuit
 
 
 def staq_input_circuit_properties(circuit, benchmark):
@@ -16,9 +39,7 @@ def staq_input_circuit_properties(circuit, benchmark):
 
 
 def staq_output_circuit_properties(circuit, two_qubit_gate, benchmark):
-    benchmark.extra_info["output_num_qubits"] = circuit.num_qubits
-    benchmark.extra_info["output_circuit_operations"] = circuit.count_ops()
-    benchmark.extra_info["output_gate_count_2q"] = circuit.count_ops().get("cx", 0)
-    benchmark.extra_info["output_depth_2q"] = circuit.depth(
-        filter_function=lambda x: x.operation.name == "cx"
-    )
+    from benchpress.qiskit_gym.utils.io import qiskit_output_circuit_properties
+
+    # staq always emits CX
+    return qiskit_output_circuit_properties(circuit, "cx", benchmark)
@@ -1,11 +1,25 @@
+import hashlib
+import os
+from functools import lru_cache
 from typing import Iterable
 
+import numpy as np
 from pystaq import Device
 from qiskit.providers import BackendV2
 from qiskit.transpiler import CouplingMap
 
-from benchpress.qiskit_gym.utils.qiskit_backend_utils import get_qiskit_bench_backend
-from benchpress.utilities.backends import FlexibleBackend
+from benchpress.config import Configuration
+from benchpress.utilities.backends import (
+    FlexibleBackend,
+    get_backend_snapshot,
+    get_flexible_backend,
+)
+from benchpress.utilities.backends.flexible_backend import FLEXIBLE_BACKEND_CACHE_SIZE
+from benchpress.utilities.io.atomic import atomic_write
+
+# (Device, JSON file) pairs already written in this process keyed on the
+# Device's id; holding the Device keeps the id from being reused
+_DEVICE_FILES = {}
 
 
 def _get_staq_device(
@@ -78,20 +92,25 @@ def get_staq_bench_backend(backend_name: str) -> Device:
         understands number of qubits, coupling map, and optional 2-qubit and
         1-qubit gate errors. It does not have a notion of fixed basis gates.
 
+    The device is built from the cached backend snapshot, so the Qiskit
+    backend only has to be constructed the first time a device is seen.
+
     Args:
         backend_name (str): Name of the backend.
 
     Returns:
         dev (Device): Pystaq Device object.
     """
-    backend = get_qiskit_bench_backend(backend_name=backend_name)
-    num_qubits, coupling_map, one_q_errors, two_q_errors = _get_backend_data(backend)
+    snapshot = get_backend_snapshot(backend_name)
+    edges = [tuple(int(q) for q in edge) for edge in snapshot["edges"]]
+    one_q_errors = np.nan_to_num(snapshot["gate_errors"]["sx"])
+    two_q_errors = np.nan_to_num(snapshot["gate_errors"][snapshot["two_q_gate"]])
 
     return _get_staq_device(
-        num_qubits=num_qubits,
-        coupling_map=coupling_map,
-        one_q_errors=one_q_errors,
-        two_q_errors=two_q_errors,
+        num_qubits=snapshot["num_qubits"],
+        coupling_map=edges,
+        one_q_errors=dict(enumerate(one_q_errors.tolist())),
+        two_q_errors=dict(zip(edges, two_q_errors.tolist())),
     )
 
 
@@ -104,7 +123,7 @@ class StaqFlexibleBackend:
     """
 
     def __init__(self, min_qubits, layout="square"):
-        self._backend = FlexibleBackend(min_qubits, layout=layout)
+        self._backend = get_flexible_backend(min_qubits, layout=layout)
 
     def __repr__(self):
         out = f"<StaqFlexibleBackend(num_qubits={self._backend.num_qubits}, "
@@ -113,13 +132,51 @@ class StaqFlexibleBackend:
         return out
 
     def get_staq_flexible_backend(self):
-        (num_qubits, coupling_map, one_q_errors, two_q_errors) = _get_backend_data(
-            self._backend
-        )
-
-        return _get_staq_device(
-            num_qubits=num_qubits,
-            coupling_map=coupling_map,
-            one_q_errors=one_q_errors,
-            two_q_errors=two_q_errors,
-        )
+        """Return the pystaq Device of the backend
+
+        Devices are shared between all StaqFlexibleBackend instances with
+        the same number of qubits and layout.
+        """
+        return _cached_staq_flexible_device(self._backend)
+
+
+@lru_cache(maxsize=FLEXIBLE_BACKEND_CACHE_SIZE)
+def _cached_staq_flexible_device(backend):
+    # FlexibleBackend instances are themselves cached per size and layout,
+    # so the backend object identifies the device
+    (num_qubits, coupling_map, one_q_errors, two_q_errors) = _get_backend_data(backend)
+
+    return _get_staq_device(
+        num_qubits=num_qubits,
+        coupling_map=coupling_map,
+        one_q_errors=one_q_errors,
+        two_q_errors=two_q_errors,
+    )
+
+
+def staq_device_file(device: Device) -> str:
+    """Return the path of a JSON description of a pystaq Device, as taken by
+        the staq `--device` option.
+
+    Files live in `<cache_dir>/staq_devices`, named by a hash of their
+    contents, so they are written once and shared across tests and runs.
+
+    Args:
+        device (Device): Pystaq Device object.
+
+    Returns:
+        device_file (str): Path to the device JSON file.
+    """
+    if id(device) not in _DEVICE_FILES:
+        text = str(device)
+        fingerprint = hashlib.sha256(text.encode()).hexdigest()[:16]
+        device_file = f"{Configuration.get_cache_dir('staq_devices')}{fingerprint}.json"
+        if not os.path.exists(device_file):
+
+            def _writer(tmp_name):
+                with open(tmp_name, "w") as fd:
+                    fd.write(text)
+
+            atomic_write(device_file, _writer)
+        _DEVICE_FILES[id(device)] = (device, device_file)
+    return _DEVICE_FILES[id(device)][1]
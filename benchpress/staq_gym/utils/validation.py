@@ -11,6 +11,10 @@
 # that they have been altered from the originals.
 """Basic circuit validation"""
 
+from benchpress.qiskit_gym.utils.io import qiskit_circuit_arrays
+from benchpress.qiskit_gym.utils.validation import qiskit_backend_edges
+from benchpress.utilities.validation.topology import get_adjacency, validate_edges
+
 
 def staq_circuit_validation(circuit, backend):
     """Validate that input circuit matches the
@@ -20,17 +24,11 @@ def staq_circuit_validation(circuit, backend):
         circuit (QuantumCircuit): Input circuit
         backend (BackendV2): Target backend
     """
-    try:
-        cmap = backend._backend.coupling_map
-    except:
-        cmap = backend.coupling_map
-    if cmap.graph.num_edges() < cmap.graph.num_nodes() * (cmap.graph.num_nodes() - 1):
-        edges = set(cmap.get_edges())
-        for gate in circuit.get_instructions("cx"):
-            _edge = (
-                circuit.find_bit(gate.qubits[0]).index,
-                circuit.find_bit(gate.qubits[1]).index,
-            )
-            if _edge not in edges:
-                raise Exception(f"2Q gate edge {_edge} not in backend topology")
+    # StaqFlexibleBackend wraps a FlexibleBackend
+    backend = getattr(backend, "_backend", backend)
+    arrays = qiskit_circuit_arrays(circuit)
+    validate_edges(
+        arrays.qubits[arrays.mask("cx") & (arrays.widths == 2)],
+        get_adjacency(backend, qiskit_backend_edges),
+    )
     return True
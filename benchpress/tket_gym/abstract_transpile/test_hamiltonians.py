@@ -12,6 +12,7 @@
 """Test Hamiltonians against abstract backend topologies"""
 
 import pytest
+from pytket.predicates import CompilationUnit
 
 from benchpress.tket_gym.utils.tket_backend_utils import TketFlexibleBackend
 from benchpress.utilities.io import input_circuit_properties, output_circuit_properties
@@ -34,9 +35,7 @@ OPTIMIZATION_LEVEL = Configuration.options["qiskit"]["optimization_level"]
 class TestWorkoutAbstractHamiltonians(WorkoutAbstractHamiltonians):
     @pytest.mark.parametrize("circ_and_topo", HAM_TOPO, ids=HAM_TOPO_NAMES)
     def test_hamiltonians(self, benchmark, circ_and_topo):
-        circuit = generate_hamiltonian_circuit(
-            circ_and_topo[0].pop("ham_hamlib_hamiltonian"), benchmark
-        )
+        circuit = generate_hamiltonian_circuit(circ_and_topo[0].operator(), benchmark)
         input_circuit_properties(circuit, benchmark)
         backend = TketFlexibleBackend(circuit.n_qubits, circ_and_topo[1])
         TWO_Q_GATE = backend.two_q_gate_type
@@ -44,12 +43,14 @@ class TestWorkoutAbstractHamiltonians(WorkoutAbstractHamiltonians):
         pm = backend.default_compilation_pass(optimisation_level=OPTIMIZATION_LEVEL)
 
         @benchmark
-        def result():
-            # Need to make a copy as the compilation is done in-place
-            new_circ = circuit.copy()
-            pm.apply(new_circ)
-            return new_circ
+        def unit():
+            # The unit compiles its own copy and keeps the qubit maps
+            new_unit = CompilationUnit(circuit)
+            pm.apply(new_unit)
+            return new_unit
+
+        result = unit.circuit
 
         benchmark.extra_info.update(circ_and_topo[0])
         output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, backend)
+        assert circuit_validator(result, backend, input_circuit=circuit, layout=unit)
@@ -11,8 +11,12 @@
 # that they have been altered from the originals.
 """Test qasmbench against abstract backend topologies"""
 import pytest
+from pytket.predicates import CompilationUnit
 
-from benchpress.utilities.io import qasm_circuit_loader, output_circuit_properties
+from benchpress.utilities.io import (
+    cached_qasm_circuit_loader,
+    output_circuit_properties,
+)
 from benchpress.utilities.validation import circuit_validator
 from benchpress.workouts.validation import benchpress_test_validation
 from benchpress.config import Configuration
@@ -39,54 +43,60 @@ OPTIMIZATION_LEVEL = Configuration.options["tket"]["optimization_level"]
 class TestWorkoutAbstractQasmBenchSmall(WorkoutAbstractQasmBenchSmall):
     @pytest.mark.parametrize("circ_and_topo", SMALL_CIRC_TOPO, ids=SMALL_NAMES)
     def test_QASMBench_small(self, benchmark, circ_and_topo):
-        circuit = qasm_circuit_loader(circ_and_topo[0], benchmark)
+        circuit = cached_qasm_circuit_loader(circ_and_topo[0], benchmark)
         backend = TketFlexibleBackend(circuit.n_qubits, circ_and_topo[1])
         pm = backend.default_compilation_pass(optimisation_level=OPTIMIZATION_LEVEL)
 
         @benchmark
-        def result():
-            # Need to make a copy as the compilation is done in-place
-            new_circ = circuit.copy()
-            pm.apply(new_circ)
-            return new_circ
+        def unit():
+            # The unit compiles its own copy and keeps the qubit maps
+            new_unit = CompilationUnit(circuit)
+            pm.apply(new_unit)
+            return new_unit
+
+        result = unit.circuit
 
         output_circuit_properties(result, backend.two_q_gate_type, benchmark)
-        assert circuit_validator(result, backend)
+        assert circuit_validator(result, backend, input_circuit=circuit, layout=unit)
 
 
 @benchpress_test_validation
 class TestWorkoutAbstractQasmBenchMedium(WorkoutAbstractQasmBenchMedium):
     @pytest.mark.parametrize("circ_and_topo", MEDIUM_CIRC_TOPO, ids=MEDIUM_NAMES)
     def test_QASMBench_medium(self, benchmark, circ_and_topo):
-        circuit = qasm_circuit_loader(circ_and_topo[0], benchmark)
+        circuit = cached_qasm_circuit_loader(circ_and_topo[0], benchmark)
         backend = TketFlexibleBackend(circuit.n_qubits, circ_and_topo[1])
         pm = backend.default_compilation_pass(optimisation_level=OPTIMIZATION_LEVEL)
 
         @benchmark
-        def result():
-            # Need to make a copy as the compilation is done in-place
-            new_circ = circuit.copy()
-            pm.apply(new_circ)
-            return new_circ
+        def unit():
+            # The unit compiles its own copy and keeps the qubit maps
+            new_unit = CompilationUnit(circuit)
+            pm.apply(new_unit)
+            return new_unit
+
+        result = unit.circuit
 
         output_circuit_properties(result, backend.two_q_gate_type, benchmark)
-        assert circuit_validator(result, backend)
+        assert circuit_validator(result, backend, input_circuit=circuit, layout=unit)
 
 
 @benchpress_test_validation
 class TestWorkoutAbstractQasmBenchLarge(WorkoutAbstractQasmBenchLarge):
     @pytest.mark.parametrize("circ_and_topo", LARGE_CIRC_TOPO, ids=LARGE_NAMES)
     def test_QASMBench_large(self, benchmark, circ_and_topo):
-        circuit = qasm_circuit_loader(circ_and_topo[0], benchmark)
+        circuit = cached_qasm_circuit_loader(circ_and_topo[0], benchmark)
         backend = TketFlexibleBackend(circuit.n_qubits, circ_and_topo[1])
         pm = backend.default_compilation_pass(optimisation_level=OPTIMIZATION_LEVEL)
 
         @benchmark
-        def result():
-            # Need to make a copy as the compilation is done in-place
-            new_circ = circuit.copy()
-            pm.apply(new_circ)
-            return new_circ
+        def unit():
+            # The unit compiles its own copy and keeps the qubit maps
+            new_unit = CompilationUnit(circuit)
+            pm.apply(new_unit)
+            return new_unit
+
+        result = unit.circuit
 
         output_circuit_properties(result, backend.two_q_gate_type, benchmark)
-        assert circuit_validator(result, backend)
+        assert circuit_validator(result, backend, input_circuit=circuit, layout=unit)
@@ -11,43 +11,47 @@
 # that they have been altered from the originals.
 """Test summit benchmarks"""
 
-import os
 import pytest
+from pytket.predicates import CompilationUnit
 
 from benchpress.config import Configuration
-from benchpress.utilities.io import qasm_circuit_loader, output_circuit_properties
+from benchpress.utilities.io import (
+    cached_qasm_circuit_loader,
+    output_circuit_properties,
+)
 from benchpress.utilities.validation import circuit_validator
 from benchpress.workouts.validation import benchpress_test_validation
-from benchpress.workouts.device_transpile import WorkoutDeviceFeynman
+from benchpress.workouts.device_transpile import (
+    WorkoutDeviceFeynman,
+    feynman_parameters,
+)
 
-BACKEND = Configuration.backend()
-TWO_Q_GATE = BACKEND.two_q_gate_type
 OPTIMIZATION_LEVEL = Configuration.options["tket"]["optimization_level"]
 
 
 def pytest_generate_tests(metafunc):
-    directory = Configuration.get_qasm_dir("feynman")
-    file_list = [x for x in os.listdir(directory) if x.endswith(".qasm")]
-    metafunc.parametrize("filename", file_list)
+    metafunc.parametrize("filename", feynman_parameters())
 
 
 @benchpress_test_validation
 class TestWorkoutDeviceTranspile100Q(WorkoutDeviceFeynman):
-    def test_feynman_transpile(self, benchmark, filename):
+    def test_feynman_transpile(self, benchmark, filename, backend):
         """Compile a feynman benchmark qasm file against a target device"""
-        circuit = qasm_circuit_loader(
+        circuit = cached_qasm_circuit_loader(
             f"{Configuration.get_qasm_dir('feynman')}{filename}", benchmark
         )
-        if circuit.n_qubits > BACKEND.backend_info.n_nodes:
+        if circuit.n_qubits > backend.backend_info.n_nodes:
             pytest.skip("Circuit too large for given backend.")
-        pm = BACKEND.default_compilation_pass(optimisation_level=OPTIMIZATION_LEVEL)
+        pm = backend.default_compilation_pass(optimisation_level=OPTIMIZATION_LEVEL)
 
         @benchmark
-        def result():
-            # Need to make a copy as the compilation is done in-place
-            new_circ = circuit.copy()
-            pm.apply(new_circ)
-            return new_circ
-
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        def unit():
+            # The unit compiles its own copy and keeps the qubit maps
+            new_unit = CompilationUnit(circuit)
+            pm.apply(new_unit)
+            return new_unit
+
+        result = unit.circuit
+
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend, input_circuit=circuit, layout=unit)
@@ -26,7 +26,7 @@ from pytket.transform import Transform
 
 
 from benchpress.tket_gym.circuits import multi_control_circuit
-from benchpress.utilities.io import qasm_circuit_loader
+from benchpress.utilities.io import cached_qasm_circuit_loader
 from benchpress.config import Configuration
 from benchpress.workouts.validation import benchpress_test_validation
 from benchpress.workouts.manipulate import WorkoutCircuitManipulate
@@ -38,7 +38,7 @@ class TestWorkoutCircuitManipulate(WorkoutCircuitManipulate):
         """Perform Pauli-twirling on a 100Q QV
         circuit
         """
-        circuit = qasm_circuit_loader(
+        circuit = cached_qasm_circuit_loader(
             Configuration.get_qasm_dir("dtc") + "dtc_100_cx_12345.qasm", benchmark
         )
         PauliTwirling = PauliFrameRandomisation()
@@ -85,7 +85,7 @@ class TestWorkoutCircuitManipulate(WorkoutCircuitManipulate):
                 auto_rebase_pass({OpType.SX, OpType.X, OpType.Rz, OpType.CZ}),
             ]
         )
-        circ = qasm_circuit_loader(
+        circ = cached_qasm_circuit_loader(
             Configuration.get_qasm_dir("qv") + "qv_N100_12345.qasm", benchmark
         )
 
@@ -9,14 +9,20 @@
 # Any modifications or derivative works of this code must retain this
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
+import json
 from time import perf_counter
 from math import pi
 
 from pytket import Qubit, Circuit
-from pytket.qasm import circuit_from_qasm
+from pytket.qasm import circuit_from_qasm, circuit_from_qasm_str
 from pytket._tket.pauli import Pauli, QubitPauliString
 from pytket.utils import QubitPauliOperator, gen_term_sequence_circuit
 from benchpress.config import Configuration
+from benchpress.utilities.io.qasm_files import is_compressed_qasm, read_qasm
+from benchpress.utilities.metrics import (
+    circuit_arrays_from_operations,
+    record_output_metrics,
+)
 
 
 def tket_qasm_loader(qasm_file, benchmark):
@@ -30,15 +36,41 @@ def tket_qasm_loader(qasm_file, benchmark):
         Circuit: A Tket circuit instance
     """
     start = perf_counter()
-    circuit = circuit_from_qasm(
-        qasm_file, maxwidth=Configuration.options["tket"]["maxwidth"]
-    )
+    maxwidth = Configuration.options["tket"]["maxwidth"]
+    if is_compressed_qasm(qasm_file):
+        circuit = circuit_from_qasm_str(read_qasm(qasm_file), maxwidth=maxwidth)
+    else:
+        circuit = circuit_from_qasm(qasm_file, maxwidth=maxwidth)
     stop = perf_counter()
     benchmark.extra_info["qasm_load_time"] = stop - start
     benchmark.extra_info["input_num_qubits"] = circuit.n_qubits
     return circuit
 
 
+def tket_circuit_dump(circuit, filename):
+    """Serialize a circuit to tket JSON
+
+    Parameters:
+        circuit (Circuit): A Tket circuit instance
+        filename (str): Output file name
+    """
+    with open(filename, "w") as fd:
+        json.dump(circuit.to_dict(), fd)
+
+
+def tket_circuit_load(filename):
+    """Load a circuit written by `tket_circuit_dump`
+
+    Parameters:
+        filename (str): Input file name
+
+    Returns:
+        Circuit: A Tket circuit instance
+    """
+    with open(filename, "r") as fd:
+        return Circuit.from_dict(json.load(fd))
+
+
 def qubit_pauli_operator_from_qiskit(sparse_pauli_op):
     """Convert Qiskit SparsePauliOp to pytket QubitPauliOperator."""
     tk_qpop = {}
@@ -60,17 +92,26 @@ def tket_input_circuit_properties(circuit, benchmark):
     benchmark.extra_info["input_num_qubits"] = circuit.n_qubits
 
 
-def tket_output_circuit_properties(circuit, two_qubit_gate, benchmark):
-    ops = {}
-    for command in circuit.get_commands():
-        cmd_name = command.op.type.name
-        if cmd_name in ops:
-            ops[cmd_name] += 1
-        else:
-            ops[cmd_name] = 1
-    benchmark.extra_info["output_num_qubits"] = circuit.n_qubits
-    benchmark.extra_info["output_circuit_operations"] = ops
-    benchmark.extra_info["output_gate_count_2q"] = circuit.n_gates_of_type(
-        two_qubit_gate
+def tket_circuit_arrays(circuit):
+    qubits = circuit.qubits
+    if len({qubit.reg_name for qubit in qubits}) == 1 and all(
+        len(qubit.index) == 1 for qubit in qubits
+    ):
+        # A single register, e.g. device nodes after routing, keeps the
+        # physical qubit indices
+        indices = {qubit: qubit.index[0] for qubit in qubits}
+    else:
+        indices = {qubit: idx for idx, qubit in enumerate(qubits)}
+    return circuit_arrays_from_operations(
+        circuit.n_qubits,
+        (
+            (command.op.type.name, [indices[qubit] for qubit in command.qubits])
+            for command in circuit.get_commands()
+        ),
     )
-    benchmark.extra_info["output_depth_2q"] = circuit.depth_by_type(two_qubit_gate)
+
+
+def tket_output_circuit_properties(circuit, two_qubit_gate, benchmark):
+    arrays = tket_circuit_arrays(circuit)
+    record_output_metrics(arrays, two_qubit_gate.name, benchmark)
+    return arrays
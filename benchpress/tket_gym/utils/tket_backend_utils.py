@@ -21,7 +21,7 @@ from qiskit.providers.models.backendconfiguration import QasmBackendConfiguratio
 from qiskit.providers.models.backendproperties import BackendProperties
 
 from benchpress.config import POSSIBLE_2Q_GATES
-from benchpress.utilities.backends import FlexibleBackend
+from benchpress.utilities.backends import get_flexible_backend
 from benchpress.qiskit_gym.utils.qiskit_backend_utils import STR_TO_IBM_FAKE_BACKEND
 
 
@@ -115,7 +115,7 @@ class TketFlexibleBackend(IBMQBackend):
     """
 
     def __init__(self, min_qubits, layout="square"):
-        self._backend = FlexibleBackend(min_qubits, layout=layout)
+        self._backend = get_flexible_backend(min_qubits, layout=layout)
         self._backend_info = self._get_backend_info(self._backend.configuration(), None)
         config = self._backend.configuration()
         self._max_per_job = getattr(config, "max_experiments", 1)
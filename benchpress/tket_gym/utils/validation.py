@@ -11,6 +11,12 @@
 # that they have been altered from the originals.
 """Basic circuit validation"""
 
+import numbers
+from math import isclose
+
+from pytket import OpType
+from pytket.passes import DecomposeBoxes, DecomposeMultiQubitsCX
+
 
 def tket_circuit_validation(circuit, backend):
     """Validate that input circuit matches gate set
@@ -22,3 +28,162 @@ def tket_circuit_validation(circuit, backend):
     """
 
     return backend.valid_circuit(circuit)
+
+
+# Gates that are Clifford whatever their parameters, and rotations that are
+# Clifford at multiples of half a half-turn
+CLIFFORD_OPS = {
+    "noop",
+    "X",
+    "Y",
+    "Z",
+    "H",
+    "S",
+    "Sdg",
+    "SX",
+    "SXdg",
+    "V",
+    "Vdg",
+    "CX",
+    "CY",
+    "CZ",
+    "SWAP",
+    "ISWAPMax",
+    "ECR",
+    "Barrier",
+    "Measure",
+    "Phase",
+}
+CLIFFORD_ROTATIONS = {"Rx", "Ry", "Rz", "U1"}
+
+
+def tket_is_clifford(circuit):
+    """Return whether a circuit only has Clifford gates, judged by op type
+    and angle
+
+    Parameters:
+        circuit (Circuit): The circuit
+
+    Returns:
+        bool: True for Clifford circuits
+    """
+    for command in circuit.get_commands():
+        op = command.op
+        name = op.type.name
+        if name in CLIFFORD_OPS:
+            continue
+        if name not in CLIFFORD_ROTATIONS:
+            return False
+        # tket angles are in half-turns
+        angle = op.params[0]
+        if not isinstance(angle, numbers.Number):
+            return False
+        quarter_turns = 2 * angle
+        if not isclose(quarter_turns, round(quarter_turns), abs_tol=1e-9):
+            return False
+    return True
+
+
+# Operations that do not change the state of the qubits they act on
+_SKIPPED_OPS = {"Barrier", "noop", "Phase"}
+
+
+def tket_equivalence_problem(input_circuit, output_circuit, layout=None):
+    """Arguments of `check_equivalence` for a compiled circuit
+
+    Placement and routing leave the qubit maps in the `CompilationUnit`
+    the circuit was compiled in; without one the qubits are matched by
+    name.  Implicit wire swaps are made explicit first, so only the maps
+    move qubits.
+
+    Parameters:
+        input_circuit (Circuit): Circuit given to the compiler
+        output_circuit (Circuit): Circuit returned by the compiler
+        layout (CompilationUnit): Unit the output was compiled in
+
+    Returns:
+        dict: input_ops, output_ops, num_qubits, initial_layout and
+              final_layout
+
+    Raises:
+        ValueError: A circuit has non-unitary operations other than final
+                    measurements, or an input qubit is missing from the
+                    output
+    """
+    if layout is None:
+        initial_map = final_map = {qubit: qubit for qubit in input_circuit.qubits}
+    else:
+        initial_map, final_map = layout.initial_map, layout.final_map
+    physical = {qubit: idx for idx, qubit in enumerate(output_circuit.qubits)}
+    try:
+        initial_layout = [physical[initial_map[q]] for q in input_circuit.qubits]
+        final_layout = [physical[final_map[q]] for q in input_circuit.qubits]
+    except KeyError as err:
+        raise ValueError(f"Qubit {err} is not in the output circuit") from err
+    return {
+        "input_ops": tket_unitary_instructions(input_circuit),
+        "output_ops": tket_unitary_instructions(output_circuit),
+        "num_qubits": output_circuit.n_qubits,
+        "initial_layout": initial_layout,
+        "final_layout": final_layout,
+    }
+
+
+def tket_unitary_instructions(circuit):
+    """Unroll a circuit to (matrix, qubits) pairs of one- and two-qubit
+    unitaries
+
+    Boxes and wider gates are decomposed into CX and single-qubit gates,
+    and implicit wire swaps become SWAP gates.  Barriers and final
+    measurements are dropped.  tket matrices are big-endian, so the qubits
+    of two-qubit gates are reversed to give Qiskit's little-endian order.
+
+    Parameters:
+        circuit (Circuit): The circuit
+
+    Returns:
+        list: (matrix, qubit indices) of every unitary in circuit order
+
+    Raises:
+        ValueError: The circuit has other non-unitary operations
+    """
+    num_qubits = circuit.n_qubits
+    circuit = circuit.copy()
+    circuit.replace_implicit_wire_swaps()
+    DecomposeBoxes().apply(circuit)
+    DecomposeMultiQubitsCX().apply(circuit)
+    if circuit.n_qubits != num_qubits:
+        raise ValueError("Decomposition added ancilla qubits")
+    indices = {qubit: idx for idx, qubit in enumerate(circuit.qubits)}
+    ops = []
+    measured = set()
+    matrices = {}
+    for command in circuit.get_commands():
+        op = command.op
+        name = op.type.name
+        qubits = [indices[qubit] for qubit in command.qubits]
+        if not qubits or name in _SKIPPED_OPS:
+            continue
+        if op.type == OpType.Measure:
+            measured.update(qubits)
+            continue
+        if not op.is_gate():
+            raise ValueError(f"Non-unitary operation {name}")
+        if measured.intersection(qubits):
+            raise ValueError(f"Operation {name} after a measurement")
+        if len(qubits) > 2:
+            raise ValueError(f"Operation {name} on {len(qubits)} qubits")
+        # Gates of the same type and numeric parameters share a matrix
+        key = None
+        if all(isinstance(param, numbers.Number) for param in op.params):
+            key = (op.type, len(qubits), tuple(op.params))
+        matrix = matrices.get(key) if key is not None else None
+        if matrix is None:
+            try:
+                matrix = op.get_unitary()
+            except (RuntimeError, TypeError) as err:
+                raise ValueError(f"Operation {name} is not unitary") from err
+            if key is not None:
+                matrices[key] = matrix
+        ops.append((matrix, qubits[::-1]))
+    return ops
@@ -10,5 +10,10 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
-from .backend_utils import get_backend
-from .flexible_backend import FlexibleBackend
+from .backend_utils import get_backend, get_backend_snapshot
+from .flexible_backend import FlexibleBackend, get_flexible_backend
+from .distances import (
+    get_backend_distances,
+    get_topology_distances,
+    routing_swap_estimate,
+)
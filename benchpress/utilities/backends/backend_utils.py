@@ -9,9 +9,99 @@
 # Any modifications or derivative works of this code must retain this
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
+import os
+
+from benchpress.config import Configuration
+from benchpress.utilities.io.versions import package_version
+from .snapshot import load_snapshot, save_snapshot, snapshot_from_backend
+
+# Backends constructed in this process keyed on (backend_name, gym_name,
+# basis_gates); basis gates are None for devices without a cached snapshot
+_BACKEND_REGISTRY = {}
+# Device snapshots keyed on backend_name
+_SNAPSHOTS = {}
 
 
 def get_backend(backend_name: str, gym_name: str):
+    """Return the backend object for a gym, constructing it at most once
+    per process
+
+    Parameters:
+        backend_name (str): Name of the backend
+        gym_name (str): Name of the gym requesting the backend
+
+    Fake devices are keyed on their basis gates as well, read from the
+    device snapshot, and their Qiskit backend is built from the snapshot
+    rather than from the vendor data.  Snapshots of real devices are not
+    kept across sessions, so they are not taken just to form the key.
+
+    Returns:
+        The backend instance for the corresponding SDK
+    """
+    snapshot = None
+    if _snapshot_filename(backend_name) is not None:
+        snapshot = get_backend_snapshot(backend_name)
+    basis_gates = tuple(snapshot["basis_gates"]) if snapshot is not None else None
+    key = (backend_name, gym_name, basis_gates)
+    if key not in _BACKEND_REGISTRY:
+        backend = None
+        if gym_name == "qiskit" and snapshot is not None:
+            from benchpress.qiskit_gym.utils.qiskit_backend_utils import (
+                qiskit_backend_from_snapshot,
+            )
+
+            backend = qiskit_backend_from_snapshot(snapshot)
+        if backend is None:
+            backend = _build_backend(backend_name, gym_name)
+        _BACKEND_REGISTRY[key] = backend
+    return _BACKEND_REGISTRY[key]
+
+
+def get_backend_snapshot(backend_name: str):
+    """Return the compact snapshot of a device
+
+    Snapshots of fake backends are persisted in the cache directory, keyed
+    on the version of the package providing the fake backend data, so later
+    sessions and worker processes do not have to re-parse the vendor JSON.
+    Real devices are only cached in-process since their calibrations change.
+    On a cold cache the snapshot is taken from the vendor Qiskit backend,
+    which then serves the Qiskit gym of this process.
+
+    Parameters:
+        backend_name (str): Name of the backend
+
+    Returns:
+        dict: Snapshot as described in `snapshot_from_backend`
+    """
+    if backend_name in _SNAPSHOTS:
+        return _SNAPSHOTS[backend_name]
+
+    filename = _snapshot_filename(backend_name)
+    snapshot = None
+    if filename is not None and os.path.exists(filename):
+        snapshot = load_snapshot(filename)
+    if snapshot is None:
+        qiskit_backend = _BACKEND_REGISTRY.get((backend_name, "qiskit", None))
+        if qiskit_backend is None:
+            qiskit_backend = _build_backend(backend_name, "qiskit")
+        snapshot = snapshot_from_backend(qiskit_backend)
+        if filename is not None:
+            key = (backend_name, "qiskit", tuple(snapshot["basis_gates"]))
+            _BACKEND_REGISTRY.setdefault(key, qiskit_backend)
+            save_snapshot(snapshot, filename)
+    _SNAPSHOTS[backend_name] = snapshot
+    return snapshot
+
+
+def _snapshot_filename(backend_name):
+    if "fake" not in backend_name:
+        return None
+    provider_version = package_version("qiskit-ibm-runtime")
+    cache_dir = Configuration.get_cache_dir("backends")
+    return f"{cache_dir}{backend_name}-{provider_version}.npz"
+
+
+def _build_backend(backend_name, gym_name):
     if gym_name in ["qiskit", "qiskit-ibm-transpiler"]:
         from benchpress.qiskit_gym.utils.qiskit_backend_utils import (
             get_qiskit_bench_backend,
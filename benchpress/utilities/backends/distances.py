@@ -0,0 +1,167 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""All-pairs qubit distance matrices shared through the cache directory"""
+
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+import rustworkx as rx
+
+from benchpress.config import Configuration
+from ..graphs import topology_edges
+from .backend_utils import get_backend_snapshot
+
+# Distance between disconnected qubits
+UNREACHABLE = np.iinfo(np.uint16).max
+# Largest device for which a dense distance matrix is built.  rustworkx only
+# returns float64 matrices, so building one peaks at 8 bytes per entry
+# (800 MB at 10000 qubits); the cached uint16 matrix takes 2 bytes per entry.
+DISTANCE_MATRIX_MAX_QUBITS = Configuration.options["general"].get(
+    "distance_matrix_max_qubits", 10000
+)
+# Rows converted to uint16 at a time
+_BLOCK_ROWS = 256
+
+# Memory-mapped matrices keyed on (label, num_qubits, edge digest)
+_DISTANCES = {}
+
+
+def distance_matrix(num_qubits, edges, out=None):
+    """Compute the all-pairs hop distances of a coupling graph
+
+    The float64 matrix returned by rustworkx is converted in blocks of rows,
+    so no full-size temporary is made besides it.
+
+    Parameters:
+        num_qubits (int): Number of qubits
+        edges (ndarray): (E, 2) array of couplings, direction is ignored
+        out (ndarray): (num_qubits, num_qubits) uint16 array to write to,
+                       e.g. a memory-mapped file; default a new array
+
+    Returns:
+        ndarray: (num_qubits, num_qubits) uint16 array, with `UNREACHABLE`
+                 for disconnected pairs
+    """
+    graph = rx.PyGraph(multigraph=False)
+    graph.add_nodes_from(range(num_qubits))
+    graph.extend_from_edge_list(list(map(tuple, np.asarray(edges).tolist())))
+    dist = rx.graph_distance_matrix(graph, null_value=float(UNREACHABLE))
+    if out is None:
+        out = np.empty((num_qubits, num_qubits), dtype=np.uint16)
+    for start in range(0, num_qubits, _BLOCK_ROWS):
+        out[start : start + _BLOCK_ROWS] = dist[start : start + _BLOCK_ROWS]
+    np.fill_diagonal(out, 0)
+    return out
+
+
+def get_distance_matrix(num_qubits, edges, label):
+    """Return the distance matrix of a coupling graph, computing it at most
+    once across sessions and worker processes
+
+    Matrices are stored as `.npy` files in the cache directory and loaded
+    read-only with `mmap_mode="r"`, so concurrent workers share the pages.
+
+    Parameters:
+        num_qubits (int): Number of qubits
+        edges (ndarray): (E, 2) array of couplings
+        label (str): Human readable prefix for the cache file
+
+    Returns:
+        ndarray: Read-only distance matrix, or None if the device is larger
+                 than `distance_matrix_max_qubits`
+    """
+    if num_qubits > DISTANCE_MATRIX_MAX_QUBITS:
+        return None
+    edges = np.ascontiguousarray(edges, dtype=np.int64)
+    digest = hashlib.sha1(edges.tobytes()).hexdigest()[:12]
+    key = (label, num_qubits, digest)
+    if key in _DISTANCES:
+        return _DISTANCES[key]
+
+    cache_dir = Configuration.get_cache_dir("distances")
+    filename = f"{cache_dir}{label}-{num_qubits}-{digest}.npy"
+    if not os.path.exists(filename):
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".npy.tmp")
+        os.close(fd)
+        try:
+            # Write straight to the file, keeping the uint16 copy out of memory
+            out = np.lib.format.open_memmap(
+                tmp_name, mode="w+", dtype=np.uint16, shape=(num_qubits, num_qubits)
+            )
+            distance_matrix(num_qubits, edges, out=out)
+            out.flush()
+            del out
+            os.replace(tmp_name, filename)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    _DISTANCES[key] = np.load(filename, mmap_mode="r")
+    return _DISTANCES[key]
+
+
+def get_topology_distances(min_qubits, layout="square"):
+    """Return the distance matrix of an abstract topology
+
+    Parameters:
+        min_qubits (int): Minimum desired number of qubits
+        layout (str): Target qubit topology, see `FlexibleBackend`
+
+    Returns:
+        ndarray: Read-only distance matrix, see `get_distance_matrix`
+    """
+    num_qubits, edges = topology_edges(min_qubits, layout)
+    return get_distance_matrix(num_qubits, edges, layout)
+
+
+def get_backend_distances(backend_name):
+    """Return the distance matrix of a device backend
+
+    Parameters:
+        backend_name (str): Name of the backend
+
+    Returns:
+        ndarray: Read-only distance matrix, see `get_distance_matrix`
+    """
+    snapshot = get_backend_snapshot(backend_name)
+    return get_distance_matrix(
+        snapshot["num_qubits"], snapshot["edges"], snapshot["name"]
+    )
+
+
+def routing_swap_estimate(pairs, distances):
+    """Estimate the number of SWAPs needed to route a circuit
+
+    Each two-qubit interaction between qubits at distance d under the
+    trivial layout is charged d - 1 SWAPs.  This ignores layout selection
+    and SWAP reuse, so it is a coarse, SDK independent measure of how hard
+    a circuit is to route on a topology rather than a bound on any
+    particular router.
+
+    Parameters:
+        pairs (ndarray): (G, 2) array of interacting qubit pairs
+        distances (ndarray): Distance matrix of the target topology
+
+    Returns:
+        int: Estimated SWAP count, or None if a pair is disconnected or
+             does not fit on the topology
+    """
+    pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+    if not pairs.size:
+        return 0
+    if pairs.max() >= distances.shape[0]:
+        return None
+    dist = distances[pairs[:, 0], pairs[:, 1]].astype(np.int64)
+    if np.any(dist == UNREACHABLE):
+        return None
+    return int(np.maximum(dist - 1, 0).sum())
@@ -10,18 +10,19 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
-import math
-import scipy.optimize as opt
-import rustworkx as rx
+from functools import lru_cache
 
 from qiskit.providers.fake_provider import GenericBackendV2
 from qiskit.providers.models.backendconfiguration import QasmBackendConfiguration
 from qiskit.transpiler import CouplingMap
 
-from ..graphs import tree_graph, torus_coupling_map
+from ..graphs import symmetric_edges, topology_edges
 from benchpress.config import Configuration, POSSIBLE_2Q_GATES
 
 BASIS_GATES = Configuration.options["general"]["basis_gates"]
+FLEXIBLE_BACKEND_CACHE_SIZE = Configuration.options["general"].get(
+    "flexible_backend_cache_size", 128
+)
 
 
 class FlexibleBackend(GenericBackendV2):
@@ -44,51 +45,14 @@ class FlexibleBackend(GenericBackendV2):
             basis_gates = BASIS_GATES
         self._basis_gates = basis_gates
         self._coupling_map = None
-        if layout == "square":
-            dim = math.ceil(math.sqrt(min_qubits))
-            graph = rx.generators.grid_graph(rows=dim, cols=dim)
-            num_qubits = len(graph)
-            cmap = CouplingMap(list(graph.edge_list()))
-
-        elif layout == "heavy-hex":
-
-            def heavy_bound(d):
-                out = 5 * d**2 - 2 * d - 1 - 2 * min_qubits
-                return out
-
-            dim = math.ceil(opt.root(heavy_bound, 1).x[0])
-            if not dim % 2:
-                dim += 1
-            graph = rx.generators.heavy_hex_graph(dim)
-            num_qubits = len(graph)
-            cmap = CouplingMap(list(graph.edge_list()))
-
-        elif layout == "linear":
-            dim = min_qubits
-            graph = rx.generators.grid_graph(1, min_qubits)
-            num_qubits = len(graph)
-            cmap = CouplingMap(list(graph.edge_list()))
-
-        elif layout == "tree":
-            levels = math.ceil(math.log2(min_qubits + 1) - 1)
-            cmap = CouplingMap(tree_graph(levels))
-            num_qubits = cmap.size()
-
-        elif layout == "torus":
-            cmap = CouplingMap(torus_coupling_map(min_qubits))
-            num_qubits = cmap.size()
-
-        elif layout == "all-to-all":
+        if layout == "all-to-all":
             cmap = CouplingMap.from_full(min_qubits)
             num_qubits = min_qubits
-
         else:
-            raise ValueError(f"Invalid layout ({layout})")
+            num_qubits, edges = topology_edges(min_qubits, layout)
+            cmap = CouplingMap(symmetric_edges(edges).tolist())
 
         self._layout = layout
-        if cmap:
-            cmap.make_symmetric()
-
         self._configuration = QasmBackendConfiguration(
             backend_name=f"FlexibleBackend-{layout}",
             backend_version="1.0.0",
@@ -144,3 +108,49 @@ class FlexibleBackend(GenericBackendV2):
 
     def run(self, circuit, **kwargs):
         raise NotImplementedError("This backend does not contain a run method")
+
+
+def get_flexible_backend(min_qubits, layout="square", basis_gates=None):
+    """Return a shared FlexibleBackend instance
+
+    Backends are memoized on (min_qubits, layout, basis_gates) with LRU
+    eviction, so parametrized tests over the same topology and size reuse
+    a single target instead of building a new one per test.
+
+    Parameters:
+        min_qubits (int): Minimum desired number of qubits
+        layout (str): Target qubit topology, see `FlexibleBackend`
+        basis_gates (list): Supported basis gates.  If none
+                            supplied, defaults to the global
+                            default set
+
+    Returns:
+        FlexibleBackend: The cached backend instance
+    """
+    if basis_gates is None:
+        basis_gates = BASIS_GATES
+    return _cached_flexible_backend(int(min_qubits), layout, tuple(basis_gates))
+
+
+@lru_cache(maxsize=FLEXIBLE_BACKEND_CACHE_SIZE)
+def _cached_flexible_backend(min_qubits, layout, basis_gates):
+    return FlexibleBackend(min_qubits, layout=layout, basis_gates=list(basis_gates))
+
+
+def prewarm_flexible_backends(specs, basis_gates=None):
+    """Build the backends for a sequence of (min_qubits, layout) pairs ahead
+    of time
+
+    Only as many distinct backends as fit in the cache are built, in order
+    of first appearance, so that pre-warmed entries are not evicted before
+    the tests that need them run.
+
+    Parameters:
+        specs (iterable): Pairs of (min_qubits, layout)
+        basis_gates (list): Supported basis gates.  If none
+                            supplied, defaults to the global
+                            default set
+    """
+    unique_specs = list(dict.fromkeys((int(n), layout) for n, layout in specs))
+    for min_qubits, layout in unique_specs[:FLEXIBLE_BACKEND_CACHE_SIZE]:
+        get_flexible_backend(min_qubits, layout=layout, basis_gates=basis_gates)
@@ -0,0 +1,170 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Compact snapshots of device backends"""
+
+import os
+import tempfile
+
+import numpy as np
+
+SNAPSHOT_VERSION = 2
+
+
+def snapshot_from_backend(backend):
+    """Extract a compact, SDK independent description of a backend
+
+    Parameters:
+        backend (BackendV2): A Qiskit backend with a `two_q_gate_type` attribute
+
+    Returns:
+        dict: Snapshot holding the qubit count, basis gates, all operation
+              names, the coupling edges of the 2Q gate and per-qubit /
+              per-edge error and duration arrays.  Missing values are
+              stored as NaN.
+    """
+    from qiskit.circuit import Gate
+
+    target = backend.target
+    num_qubits = target.num_qubits
+    two_q_gate = backend.two_q_gate_type
+    basis_gates = sorted(
+        name
+        for name in target.operation_names
+        if isinstance(target.operation_from_name(name), Gate)
+    )
+    edges = np.asarray(
+        sorted(target.qargs_for_operation_name(two_q_gate)), dtype=np.int32
+    ).reshape(-1, 2)
+
+    gate_errors = {}
+    gate_durations = {}
+    for name in basis_gates:
+        gate_props = target[name]
+        if target.operation_from_name(name).num_qubits == 1:
+            qargs = [(q,) for q in range(num_qubits)]
+        elif name == two_q_gate:
+            qargs = [tuple(int(q) for q in edge) for edge in edges]
+        else:
+            continue
+        props = [gate_props.get(qarg) for qarg in qargs]
+        gate_errors[name] = _props_array(props, "error")
+        gate_durations[name] = _props_array(props, "duration")
+
+    if "measure" in target:
+        props = [target["measure"].get((q,)) for q in range(num_qubits)]
+        readout_errors = _props_array(props, "error")
+        readout_durations = _props_array(props, "duration")
+    else:
+        readout_errors = np.full(num_qubits, np.nan)
+        readout_durations = np.full(num_qubits, np.nan)
+
+    qubit_props = target.qubit_properties or [None] * num_qubits
+    return {
+        "name": str(backend.name),
+        "num_qubits": int(num_qubits),
+        "dt": float(target.dt) if target.dt is not None else np.nan,
+        "basis_gates": basis_gates,
+        "operations": sorted(target.operation_names),
+        "two_q_gate": two_q_gate,
+        "edges": edges,
+        "gate_errors": gate_errors,
+        "gate_durations": gate_durations,
+        "readout_errors": readout_errors,
+        "readout_durations": readout_durations,
+        "t1": _props_array(qubit_props, "t1"),
+        "t2": _props_array(qubit_props, "t2"),
+    }
+
+
+def save_snapshot(snapshot, filename):
+    """Write a snapshot to a `.npz` file
+
+    The file is written to a temporary name and then moved into place so
+    that concurrent workers never observe a partially written snapshot.
+
+    Parameters:
+        snapshot (dict): Snapshot from `snapshot_from_backend`
+        filename (str): Output file name
+    """
+    arrays = {
+        "version": np.asarray(SNAPSHOT_VERSION),
+        "name": np.asarray(snapshot["name"]),
+        "num_qubits": np.asarray(snapshot["num_qubits"]),
+        "dt": np.asarray(snapshot["dt"]),
+        "basis_gates": np.asarray(snapshot["basis_gates"], dtype=str),
+        "operations": np.asarray(snapshot["operations"], dtype=str),
+        "two_q_gate": np.asarray(snapshot["two_q_gate"]),
+        "edges": snapshot["edges"],
+        "readout_errors": snapshot["readout_errors"],
+        "readout_durations": snapshot["readout_durations"],
+        "t1": snapshot["t1"],
+        "t2": snapshot["t2"],
+    }
+    for name, values in snapshot["gate_errors"].items():
+        arrays[f"gate_errors/{name}"] = values
+    for name, values in snapshot["gate_durations"].items():
+        arrays[f"gate_durations/{name}"] = values
+
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, tmp_name = tempfile.mkstemp(dir=directory, suffix=".npz.tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            np.savez(tmp_file, **arrays)
+        os.replace(tmp_name, filename)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def load_snapshot(filename):
+    """Load a snapshot written by `save_snapshot`
+
+    Parameters:
+        filename (str): Snapshot file name
+
+    Returns:
+        dict: The snapshot, or None if the file was written by an
+              incompatible version of this module
+    """
+    with np.load(filename, allow_pickle=False) as data:
+        if int(data["version"]) != SNAPSHOT_VERSION:
+            return None
+        snapshot = {
+            "name": str(data["name"]),
+            "num_qubits": int(data["num_qubits"]),
+            "dt": float(data["dt"]),
+            "basis_gates": [str(name) for name in data["basis_gates"]],
+            "operations": [str(name) for name in data["operations"]],
+            "two_q_gate": str(data["two_q_gate"]),
+            "edges": data["edges"],
+            "gate_errors": {},
+            "gate_durations": {},
+            "readout_errors": data["readout_errors"],
+            "readout_durations": data["readout_durations"],
+            "t1": data["t1"],
+            "t2": data["t2"],
+        }
+        for key in data.files:
+            if "/" in key:
+                group, name = key.split("/", 1)
+                snapshot[group][name] = data[key]
+    return snapshot
+
+
+def _props_array(props, attr):
+    """Collect an attribute from a list of property objects into a float array"""
+    out = np.full(len(props), np.nan)
+    for idx, prop in enumerate(props):
+        value = getattr(prop, attr, None) if prop is not None else None
+        if value is not None:
+            out[idx] = value
+    return out
@@ -12,3 +12,9 @@
 
 from .tree import tree_graph
 from .torus import torus_coupling_map
+from .topology import (
+    LAYOUTS,
+    symmetric_edges,
+    topology_edges,
+    topology_graph,
+)
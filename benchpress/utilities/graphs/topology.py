@@ -0,0 +1,190 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Abstract device topologies as NumPy edge arrays"""
+
+import math
+
+import numpy as np
+import rustworkx as rx
+
+LAYOUTS = ["heavy-hex", "linear", "square", "torus", "tree", "all-to-all"]
+
+
+def square_dimension(min_qubits):
+    """Side length of the smallest square grid holding `min_qubits` qubits"""
+    return max(math.isqrt(max(min_qubits - 1, 0)) + 1, 1)
+
+
+def heavy_hex_dimension(min_qubits):
+    """Smallest odd code distance whose heavy-hex graph holds `min_qubits` qubits
+
+    A heavy-hex graph of distance d has (5d^2 - 2d - 1) / 2 qubits, so d is
+    the positive root of 5d^2 - 2d - 1 - 2n = 0, rounded up to the next odd
+    integer.
+    """
+    dim = max(math.ceil((1 + math.sqrt(6 + 10 * min_qubits)) / 5), 1)
+    if not dim % 2:
+        dim += 1
+    return dim
+
+
+def torus_dimensions(min_qubits):
+    """Return the (little, big) diameters of the torus holding `min_qubits`"""
+    little_diameter = max(math.ceil(math.sqrt(min_qubits / 3)), 1)
+    return little_diameter, 3 * little_diameter
+
+
+def tree_levels(min_qubits):
+    """Number of levels of the smallest binary tree holding `min_qubits`"""
+    return max(math.ceil(math.log2(min_qubits + 1) - 1), 1)
+
+
+def grid_edges(rows, cols):
+    """Nearest-neighbor edges of a `rows` x `cols` grid
+
+    Qubits are numbered in row-major order, matching
+    `rustworkx.generators.grid_graph`.
+
+    Returns:
+        ndarray: Edges as an (E, 2) integer array
+    """
+    index = np.arange(rows * cols, dtype=np.int64).reshape(rows, cols)
+    horizontal = np.stack([index[:, :-1].ravel(), index[:, 1:].ravel()], axis=1)
+    vertical = np.stack([index[:-1, :].ravel(), index[1:, :].ravel()], axis=1)
+    return np.concatenate([horizontal, vertical])
+
+
+def torus_edges(little_diameter, big_diameter):
+    """Edges of a `big_diameter` x `little_diameter` torus
+
+    Returns:
+        ndarray: Edges as an (E, 2) integer array, without duplicates
+                 or self-loops
+    """
+    index = np.arange(big_diameter * little_diameter, dtype=np.int64).reshape(
+        big_diameter, little_diameter
+    )
+    vertical = np.stack([index.ravel(), np.roll(index, -1, axis=0).ravel()], axis=1)
+    horizontal = np.stack([index.ravel(), np.roll(index, -1, axis=1).ravel()], axis=1)
+    return _unique_edges(np.concatenate([vertical, horizontal]))
+
+
+def tree_edges(levels):
+    """Edges of a complete binary tree with `levels` levels below the root
+
+    Node k has children 2k+1 and 2k+2, so the graph has 2^(levels+1)-1 qubits.
+
+    Returns:
+        ndarray: (child, parent) edges as an (E, 2) integer array
+    """
+    children = np.arange(1, 2 ** (levels + 1) - 1, dtype=np.int64)
+    return np.stack([children, (children - 1) // 2], axis=1)
+
+
+def heavy_hex_edges(dim):
+    """Edges of the distance `dim` heavy-hex graph
+
+    Returns:
+        ndarray: Edges as an (E, 2) integer array
+    """
+    graph = rx.generators.heavy_hex_graph(dim)
+    return np.asarray(graph.edge_list(), dtype=np.int64).reshape(-1, 2)
+
+
+def full_edges(num_qubits):
+    """Edges of the complete graph on `num_qubits` qubits
+
+    Returns:
+        ndarray: Edges as an (E, 2) integer array
+    """
+    return np.stack(np.triu_indices(num_qubits, k=1), axis=1).astype(np.int64)
+
+
+def topology_edges(min_qubits, layout="square"):
+    """Build the coupling edges of an abstract topology
+
+    Parameters:
+        min_qubits (int): Minimum desired number of qubits
+        layout (str): Target qubit topology.  Options are
+                      'heavy-hex', 'linear', 'square', 'torus',
+                      'tree', or 'all-to-all'
+
+    Returns:
+        tuple: Number of qubits and an (E, 2) integer array of
+               undirected edges
+
+    Raises:
+        ValueError: Invalid layout
+    """
+    min_qubits = int(min_qubits)
+    if layout == "square":
+        dim = square_dimension(min_qubits)
+        return dim * dim, grid_edges(dim, dim)
+
+    if layout == "heavy-hex":
+        dim = heavy_hex_dimension(min_qubits)
+        num_qubits = (5 * dim**2 - 2 * dim - 1) // 2
+        return num_qubits, heavy_hex_edges(dim)
+
+    if layout == "linear":
+        return min_qubits, grid_edges(1, min_qubits)
+
+    if layout == "tree":
+        levels = tree_levels(min_qubits)
+        return 2 ** (levels + 1) - 1, tree_edges(levels)
+
+    if layout == "torus":
+        little_diameter, big_diameter = torus_dimensions(min_qubits)
+        num_qubits = little_diameter * big_diameter
+        return num_qubits, torus_edges(little_diameter, big_diameter)
+
+    if layout == "all-to-all":
+        return min_qubits, full_edges(min_qubits)
+
+    raise ValueError(f"Invalid layout ({layout})")
+
+
+def topology_graph(min_qubits, layout="square"):
+    """Build an abstract topology as an undirected rustworkx graph
+
+    Parameters:
+        min_qubits (int): Minimum desired number of qubits
+        layout (str): Target qubit topology, see `topology_edges`
+
+    Returns:
+        PyGraph: Graph with one node per qubit
+    """
+    num_qubits, edges = topology_edges(min_qubits, layout)
+    graph = rx.PyGraph(multigraph=False)
+    graph.add_nodes_from(range(num_qubits))
+    graph.extend_from_edge_list(list(map(tuple, edges.tolist())))
+    return graph
+
+
+def symmetric_edges(edges):
+    """Return the edges together with their reverses
+
+    Parameters:
+        edges (ndarray): (E, 2) array of undirected edges
+
+    Returns:
+        ndarray: (2E, 2) array with both directions of every edge
+    """
+    return np.concatenate([edges, edges[:, ::-1]])
+
+
+def _unique_edges(edges):
+    """Drop self-loops and duplicate undirected edges, keeping first occurrence"""
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    keys = np.sort(edges, axis=1)
+    _, first = np.unique(keys, axis=0, return_index=True)
+    return edges[np.sort(first)]
@@ -9,7 +9,7 @@
 # Any modifications or derivative works of this code must retain this
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
-import math
+from .topology import symmetric_edges, torus_dimensions, torus_edges
 
 
 def torus_coupling_map(min_qubits, directed=False):
@@ -18,34 +18,9 @@ def torus_coupling_map(min_qubits, directed=False):
 
     Parameters:
         min_qubits (int): Minimum number of qubits
-        directed (bool): Create a directed graph, default=False
+        directed (bool): Include both directions of every edge, default=False
     """
-    little_diameter = math.ceil(math.sqrt(min_qubits / 3))
-    big_diameter = 3 * little_diameter
-    cmap = []
-    # Big diameter couplings
-    for edge in range(little_diameter):
-        start_qubit = edge
-        for idx in range(big_diameter):
-            if idx == big_diameter - 1:
-                cmap.append([start_qubit, edge])
-            else:
-                cmap.append([start_qubit, start_qubit + little_diameter])
-                start_qubit += little_diameter
-
-    # little diameter couplings
-    for edge in range(big_diameter):
-        start_idx = edge * little_diameter
-        # couple ends first
-        cmap.append([start_idx, start_idx + little_diameter - 1])
-        if little_diameter > 2:
-            for qubit in range(little_diameter - 1):
-                cmap.append([start_idx + qubit, start_idx + qubit + 1])
+    edges = torus_edges(*torus_dimensions(min_qubits))
     if directed:
-        temp_cmap = []
-        for edge in cmap:
-            temp_cmap.append(edge)
-            if edge[::-1] not in temp_cmap:
-                temp_cmap.append(edge[::-1])
-        cmap = temp_cmap
-    return cmap
+        edges = symmetric_edges(edges)
+    return edges.tolist()
@@ -10,7 +10,7 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
-import numpy as np
+from .topology import symmetric_edges, tree_edges
 
 
 def tree_graph(levels=3, directed=False):
@@ -28,15 +28,7 @@ def tree_graph(levels=3, directed=False):
     """
     if levels < 1:
         raise ValueError("Need to have at least one level")
-    cmap = []
-    prev_nodes = [0]
-    for layer in range(1, levels + 1):
-        current_nodes = np.arange(2**layer) + (2 ** (layer) - 1)
-        node_sections = np.split(current_nodes, 2**layer // 2)
-        for idx, nodes in enumerate(node_sections):
-            for nn in nodes:
-                cmap.append([nn, prev_nodes[idx]])
-                if not directed:
-                    cmap.append([prev_nodes[idx], nn])
-        prev_nodes = current_nodes
-    return cmap
+    edges = tree_edges(levels)
+    if not directed:
+        edges = symmetric_edges(edges)
+    return edges.tolist()
@@ -1,6 +1,24 @@
 """File IO utilities"""
 
 from .qasmbench import get_qasmbench_circuits
+from .qasm_files import (
+    is_qasm_file,
+    open_qasm,
+    read_qasm,
+    resolve_qasm_file,
+    uncompressed_qasm_file,
+)
 from .qasm_loader import qasm_circuit_loader
+from .qasm_stats import (
+    qasm_num_qubits,
+    qasm_statistics,
+    qasm_two_qubit_interactions,
+    record_qasm_statistics,
+)
+from .hamiltonian_store import get_hamiltonian_store
+from .hamlib import hamlib_records, iter_hamlib
+from .manifest import get_manifest, manifest_circuits, qasm_file_metadata
+from .circuit_cache import cached_qasm_circuit_loader
 from .circuit_output import output_circuit_properties
 from .circuit_input import input_circuit_properties
+from .versions import package_version
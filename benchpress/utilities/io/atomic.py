@@ -0,0 +1,48 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Atomic file writes for caches shared between worker processes"""
+
+import json
+import os
+import tempfile
+
+
+def atomic_write(filename, writer):
+    """Call `writer` on a temporary file and move it to `filename`
+
+    Readers never observe a partially written file, and concurrent writers
+    of the same file leave one complete copy behind.
+
+    Parameters:
+        filename (str): Output file name
+        writer (callable): Function taking the temporary file name
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, tmp_name = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    os.close(fd)
+    try:
+        writer(tmp_name)
+        os.replace(tmp_name, filename)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def atomic_write_json(data, filename):
+    """Atomically write JSON serializable data to `filename`"""
+
+    def _writer(tmp_name):
+        with open(tmp_name, "w") as fd:
+            json.dump(data, fd)
+
+    atomic_write(filename, _writer)
@@ -21,41 +21,53 @@ def output_circuit_properties(circuit, two_qubit_gate, benchmark):
     two_qubit_gate : Target two-qubit gate
     benchmark (Benchmark): Benchmark class to record info to
 
+    For tests targeting a device (see the `backend` fixture) the estimated
+    success probability of the circuit is recorded as well.
     """
     gym_name = Configuration.gym_name
+    arrays = None
     if gym_name in ["qiskit", "qiskit-ibm-transpiler"]:
         from benchpress.qiskit_gym.utils.io import qiskit_output_circuit_properties
 
-        qiskit_output_circuit_properties(circuit, two_qubit_gate, benchmark)
+        arrays = qiskit_output_circuit_properties(circuit, two_qubit_gate, benchmark)
 
     elif gym_name == "tket":
         from benchpress.tket_gym.utils.io import tket_output_circuit_properties
 
-        tket_output_circuit_properties(circuit, two_qubit_gate, benchmark)
+        arrays = tket_output_circuit_properties(circuit, two_qubit_gate, benchmark)
 
     elif gym_name == "bqskit":
         from benchpress.bqskit_gym.utils.io import bqskit_output_circuit_properties
 
-        bqskit_output_circuit_properties(circuit, two_qubit_gate, benchmark)
+        arrays = bqskit_output_circuit_properties(circuit, two_qubit_gate, benchmark)
 
     elif gym_name == "staq":
         from benchpress.staq_gym.utils.io import staq_output_circuit_properties
 
-        staq_output_circuit_properties(circuit, two_qubit_gate, benchmark)
+        arrays = staq_output_circuit_properties(circuit, two_qubit_gate, benchmark)
 
     elif gym_name == "braket":
         from benchpress.braket_gym.utils.io import braket_output_circuit_properties
 
-        braket_output_circuit_properties(circuit, two_qubit_gate, benchmark)
+        arrays = braket_output_circuit_properties(circuit, two_qubit_gate, benchmark)
 
     elif gym_name == "cirq":
         from benchpress.cirq_gym.utils.io import cirq_output_circuit_properties
 
-        cirq_output_circuit_properties(circuit, two_qubit_gate, benchmark)
+        arrays = cirq_output_circuit_properties(circuit, two_qubit_gate, benchmark)
 
     elif gym_name == "qpanda":
         from benchpress.qpanda_gym.utils.io import qpanda_output_circuit_properties
 
-        qpanda_output_circuit_properties(circuit, two_qubit_gate, benchmark)
+        arrays = qpanda_output_circuit_properties(circuit, two_qubit_gate, benchmark)
     else:
         raise Exception(f"Unsupported gym name {gym_name}")
+
+    backend_name = benchmark.extra_info.get("backend_name")
+    if arrays is not None and backend_name is not None:
+        from benchpress.utilities.backends import get_backend_snapshot
+        from benchpress.utilities.metrics import record_estimated_success_probability
+
+        record_estimated_success_probability(
+            arrays, get_backend_snapshot(backend_name), benchmark
+        )
@@ -0,0 +1,230 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Compact, lazily materialized store of HamLib Hamiltonians"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from benchpress.config import Configuration
+from .atomic import atomic_write
+
+STORE_VERSION = 1
+TERMS_KEY = "ham_hamlib_hamiltonian_terms"
+COEFFICIENTS_KEY = "ham_hamlib_hamiltonian_coefficients"
+
+# Stores loaded in this process keyed on the source file
+_STORES = {}
+
+
+class HamiltonianRecord(dict):
+    """Metadata of a single Hamiltonian
+
+    The record holds everything from the source file except the Pauli terms
+    and coefficients, so it can be used as a test parameter and copied into
+    `benchmark.extra_info`.  The operator itself is only built by `operator`.
+    """
+
+    def __init__(self, data, store, index):
+        super().__init__(data)
+        self.store = store
+        self.index = index
+
+    def operator(self):
+        """Return the Hamiltonian as a `SparsePauliOp`"""
+        return self.store.operator(self.index)
+
+
+class HamiltonianStore:
+    """Hamiltonians held as packed symplectic bit arrays plus coefficients"""
+
+    def __init__(self, filename):
+        """Load a store written by `build_hamiltonian_store`
+
+        Parameters:
+            filename (str): Store file name
+        """
+        with np.load(filename, allow_pickle=False) as data:
+            if int(data["version"]) != STORE_VERSION:
+                raise ValueError(f"Incompatible Hamiltonian store ({filename})")
+            self._x = data["x"]
+            self._z = data["z"]
+            self._coefficients = data["coefficients"]
+            self._offsets = data["offsets"]
+            self._num_qubits = data["num_qubits"]
+            metadata = json.loads(str(data["records"]))
+        self.records = [
+            HamiltonianRecord(record, self, idx) for idx, record in enumerate(metadata)
+        ]
+
+    def __len__(self):
+        return len(self.records)
+
+    def operator(self, index):
+        """Build the operator of a single Hamiltonian
+
+        Parameters:
+            index (int): Position of the Hamiltonian in the store
+
+        Returns:
+            SparsePauliOp: The Hamiltonian
+        """
+        from qiskit.quantum_info import PauliList, SparsePauliOp
+
+        start, stop = self._offsets[index], self._offsets[index + 1]
+        num_qubits = int(self._num_qubits[index])
+        x = np.unpackbits(
+            self._x[start:stop], axis=1, count=num_qubits, bitorder="little"
+        ).astype(bool)
+        z = np.unpackbits(
+            self._z[start:stop], axis=1, count=num_qubits, bitorder="little"
+        ).astype(bool)
+        return SparsePauliOp(
+            PauliList.from_symplectic(z, x), self._coefficients[start:stop]
+        )
+
+    def digest(self, index):
+        """Return a hash of the terms and coefficients of a single
+        Hamiltonian
+
+        Parameters:
+            index (int): Position of the Hamiltonian in the store
+
+        Returns:
+            str: Hex digest that only changes with the Hamiltonian itself
+        """
+        start, stop = self._offsets[index], self._offsets[index + 1]
+        num_qubits = int(self._num_qubits[index])
+        # Ignore the padding, which depends on the widest Hamiltonian stored
+        width = (num_qubits + 7) // 8
+        digest = hashlib.sha256(str(num_qubits).encode())
+        for block in [
+            self._x[start:stop, :width],
+            self._z[start:stop, :width],
+            self._coefficients[start:stop],
+        ]:
+            digest.update(np.ascontiguousarray(block).tobytes())
+        return digest.hexdigest()
+
+
+def get_hamiltonian_store(json_file=None):
+    """Return the Hamiltonian store for a HamLib JSON file, loading it at
+    most once per process
+
+    The compact store is built on first use and kept in
+    `<cache_dir>/hamlib`, keyed on the size and modification time of the
+    source file.
+
+    Parameters:
+        json_file (str): HamLib records, defaults to the representative set
+
+    Returns:
+        HamiltonianStore: The store
+    """
+    if json_file is None:
+        json_file = (
+            Configuration.get_hamiltonian_dir("hamlib") + "100_representative.json"
+        )
+    json_file = os.path.abspath(json_file)
+    if json_file not in _STORES:
+        stat = os.stat(json_file)
+        name = os.path.splitext(os.path.basename(json_file))[0]
+        cache_dir = Configuration.get_cache_dir("hamlib")
+        filename = f"{cache_dir}{name}-{stat.st_size}-{stat.st_mtime_ns}.npz"
+        if not os.path.exists(filename):
+            build_hamiltonian_store(json_file, filename)
+        _STORES[json_file] = HamiltonianStore(filename)
+    return _STORES[json_file]
+
+
+def build_hamiltonian_store(json_file, filename):
+    """Convert HamLib JSON records to a compact store file
+
+    Parameters:
+        json_file (str): HamLib records with Pauli label terms and
+                         coefficients
+        filename (str): Output `.npz` file name
+    """
+    with open(json_file, "r") as fd:
+        ham_records = json.load(fd)
+
+    x_blocks = []
+    z_blocks = []
+    coefficient_blocks = []
+    offsets = [0]
+    num_qubits = []
+    metadata = []
+    for record in ham_records:
+        terms = record.pop(TERMS_KEY)
+        coefficients = record.pop(COEFFICIENTS_KEY)
+        x, z = _symplectic_from_labels(terms)
+        x_blocks.append(x)
+        z_blocks.append(z)
+        coefficient_blocks.append(_coefficient_array(coefficients))
+        offsets.append(offsets[-1] + len(terms))
+        num_qubits.append(len(terms[0]) if terms else 0)
+        metadata.append(record)
+
+    width = max([block.shape[1] for block in x_blocks], default=0)
+    arrays = {
+        "version": np.asarray(STORE_VERSION),
+        "x": _stack_padded(x_blocks, width),
+        "z": _stack_padded(z_blocks, width),
+        "coefficients": (
+            np.concatenate(coefficient_blocks)
+            if coefficient_blocks
+            else np.zeros(0, dtype=complex)
+        ),
+        "offsets": np.asarray(offsets, dtype=np.int64),
+        "num_qubits": np.asarray(num_qubits, dtype=np.int64),
+        "records": np.asarray(json.dumps(metadata)),
+    }
+
+    def _writer(tmp_name):
+        with open(tmp_name, "wb") as fd:
+            np.savez(fd, **arrays)
+
+    atomic_write(filename, _writer)
+
+
+def _symplectic_from_labels(terms):
+    """Packed X and Z bit rows of Pauli labels, with qubit 0 the rightmost
+    character as in Qiskit"""
+    if not terms:
+        empty = np.zeros((0, 0), dtype=np.uint8)
+        return empty, empty
+    chars = np.frombuffer("".join(terms).encode("ascii"), dtype=np.uint8)
+    chars = chars.reshape(len(terms), -1)[:, ::-1]
+    is_y = chars == ord("Y")
+    x = (chars == ord("X")) | is_y
+    z = (chars == ord("Z")) | is_y
+    return (
+        np.packbits(x, axis=1, bitorder="little"),
+        np.packbits(z, axis=1, bitorder="little"),
+    )
+
+
+def _coefficient_array(coefficients):
+    """Coefficients stored as numbers, complex strings or [real, imag] pairs"""
+    coefficients = np.asarray(coefficients)
+    if coefficients.ndim == 2:
+        return coefficients[:, 0] + 1j * coefficients[:, 1]
+    return coefficients.astype(complex)
+
+
+def _stack_padded(blocks, width):
+    out = [np.pad(block, ((0, 0), (0, width - block.shape[1]))) for block in blocks]
+    if not out:
+        return np.zeros((0, width), dtype=np.uint8)
+    return np.concatenate(out)
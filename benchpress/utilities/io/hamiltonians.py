@@ -9,12 +9,16 @@
 # Any modifications or derivative works of this code must retain this
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
+import argparse
+import hashlib
 import json
 import os
-
-from qiskit.quantum_info import SparsePauliOp
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from benchpress.config import Configuration
+from .atomic import atomic_write, atomic_write_json
+from .hamiltonian_store import get_hamiltonian_store
+from .versions import package_version
 
 
 def generate_hamiltonian_circuit(sparse_op, benchmark):
@@ -49,33 +53,139 @@ def generate_hamiltonian_circuit(sparse_op, benchmark):
     return circuit
 
 
-def dump_hamiltonians_to_qasm(fn):
-    ham_records = json.load(open(fn, "r"))
-    for h in ham_records:
-        terms = h.pop("ham_hamlib_hamiltonian_terms")
-        coefficients = h.pop("ham_hamlib_hamiltonian_coefficients")
-        h["ham_hamlib_hamiltonian"] = SparsePauliOp(terms, coefficients)
+def dump_hamiltonians_to_qasm(
+    json_file, output_dir=None, max_workers=None, force=False
+):
+    """Write a QASM file with the Trotter circuit of every Hamiltonian in a
+    HamLib JSON file
+
+    Circuits are built in a process pool and written atomically.  The
+    source hash of every output is recorded in `<cache_dir>/hamlib/dumps`,
+    and outputs whose Hamiltonian and Qiskit version are unchanged since
+    the last run are skipped.
+
+    Parameters:
+        json_file (str): HamLib records
+        output_dir (str): Output directory, defaults to the JSON file name
+                          without its suffix
+        max_workers (int): Number of worker processes, defaults to the
+                           number of CPUs
+        force (bool): Rewrite every output
+
+    Returns:
+        list: Paths of the files written
 
-    output_dir = fn[:-2] + os.sep
+    Raises:
+        RuntimeError: Some circuits could not be written; the others are
+                      still recorded
+    """
+    json_file = os.path.abspath(json_file)
+    if output_dir is None:
+        output_dir = os.path.splitext(json_file)[0]
+    output_dir = os.path.abspath(output_dir)
     os.makedirs(output_dir, exist_ok=True)
 
-    from benchpress.qiskit_gym.utils.io import qiskit_hamiltonian_circuit
+    store = get_hamiltonian_store(json_file)
+    state_file = _dump_state_filename(output_dir)
+    state = {}
+    if not force and os.path.exists(state_file):
+        with open(state_file, "r") as fd:
+            state = json.load(fd)
+
+    generator = package_version("qiskit")
+    hashes = {}
+    pending = []
+    for ham in store.records:
+        filename = os.path.join(output_dir, _qasm_filename(ham))
+        source_hash = f"{store.digest(ham.index)}-{generator}"
+        hashes[filename] = source_hash
+        if state.get(filename) != source_hash or not os.path.exists(filename):
+            pending.append((ham.index, filename))
+        else:
+            state[filename] = source_hash
+
+    written = []
+    failed = []
+    # Record every finished output, even if others fail or the run is
+    # interrupted, so that only the remaining ones are redone
+    try:
+        if pending:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        _dump_hamiltonian, json_file, index, filename
+                    ): filename
+                    for index, filename in pending
+                }
+                for future in as_completed(futures):
+                    filename = futures[future]
+                    try:
+                        future.result()
+                    except Exception as err:
+                        failed.append(filename)
+                        print("failed", os.path.basename(filename), repr(err))
+                        continue
+                    state[filename] = hashes[filename]
+                    written.append(filename)
+                    print("dumped", os.path.basename(filename))
+    finally:
+        # Keeps hashes of outputs from other runs into the same directory
+        atomic_write_json(state, state_file)
+    if failed:
+        raise RuntimeError(
+            f"{len(failed)} Hamiltonians failed to dump: "
+            + ", ".join(os.path.basename(filename) for filename in failed)
+        )
+    print(f"{len(written)} written, {len(hashes) - len(written)} unchanged")
+    return written
+
+
+def _dump_hamiltonian(json_file, index, filename):
+    """Build and write the circuit of a single Hamiltonian in a worker"""
     from qiskit import qasm2
 
-    for ham in ham_records:
-        qc = qiskit_hamiltonian_circuit(ham["ham_hamlib_hamiltonian"])
-        fn = "".join(
+    from benchpress.qiskit_gym.utils.io import qiskit_hamiltonian_circuit
+
+    qc = qiskit_hamiltonian_circuit(get_hamiltonian_store(json_file).operator(index))
+    atomic_write(filename, lambda tmp_name: qasm2.dump(qc, tmp_name))
+
+
+def _qasm_filename(ham):
+    return (
+        "".join(
             c if c.isalnum() else "_"
             for c in "ham_"
             + ham["ham_problem"]
             + "_"
             + ham["ham_instance"][1:-1].replace("ham_", "").replace("ham", "")
         )
-        qasm2.dump(qc, output_dir + fn + ".qasm")
-        print("dumped", fn)
+        + ".qasm"
+    )
+
+
+def _dump_state_filename(output_dir):
+    label = hashlib.sha1(output_dir.encode()).hexdigest()[:12]
+    cache_dir = Configuration.get_cache_dir(os.path.join("hamlib", "dumps"))
+    return f"{cache_dir}{os.path.basename(output_dir)}-{label}.json"
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Dump HamLib circuits to QASM")
+    parser.add_argument(
+        "json_file",
+        nargs="?",
+        default=Configuration.get_hamiltonian_dir("hamlib") + "100_representative.json",
+        help="HamLib records, defaults to the representative set",
+    )
+    parser.add_argument("--output-dir", help="Output directory")
+    parser.add_argument("--workers", type=int, help="Number of worker processes")
+    parser.add_argument(
+        "--force", action="store_true", help="Rewrite unchanged outputs"
+    )
+    args = parser.parse_args()
     dump_hamiltonians_to_qasm(
-        Configuration.get_hamiltonian_dir("hamlib") + "100_representative.json"
+        args.json_file,
+        output_dir=args.output_dir,
+        max_workers=args.workers,
+        force=args.force,
     )
@@ -0,0 +1,265 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Streaming reader for the upstream HamLib HDF5 library
+
+HamLib is distributed as HDF5 files, one per problem instance family, laid
+out as `<category>/<problem>/<family>.hdf5`.  Every dataset in a file holds
+one Hamiltonian as the string form of an OpenFermion `QubitOperator`, e.g.
+`0.5 [X0 Y1] +\\n-1.0 [Z3]`.  Files are read one dataset at a time, so the
+library never has to fit in memory.  Reading HDF5 requires the optional
+`h5py` package.
+"""
+
+import hashlib
+import json
+import os
+import re
+
+from benchpress.config import Configuration
+from .atomic import atomic_write_json
+from .hamiltonian_store import HamiltonianRecord, get_hamiltonian_store
+
+HAMLIB_SUFFIXES = (".hdf5", ".h5")
+TERM_PATTERN = re.compile(r"([^\[\]]*)\[([^\]]*)\]")
+QUBIT_PATTERN = re.compile(r"[XYZ](\d+)")
+SCAN_VERSION = 1
+
+
+class HamlibFile:
+    """A single HamLib HDF5 file"""
+
+    def __init__(self, filename, hamlib_dir=None):
+        """Create a HamlibFile
+
+        Parameters:
+            filename (str): Path to the HDF5 file
+            hamlib_dir (str): Library root the problem class is taken
+                              relative to, defaults to the file's directory
+        """
+        self.filename = os.path.abspath(filename)
+        rel_dir = os.path.relpath(
+            os.path.dirname(self.filename),
+            os.path.dirname(self.filename) if hamlib_dir is None else hamlib_dir,
+        )
+        parts = [] if rel_dir == os.curdir else rel_dir.split(os.sep)
+        self.family = os.path.splitext(os.path.basename(self.filename))[0]
+        self.category = parts[0] if parts else ""
+        self.problem = parts[-1] if parts else self.family
+
+    def read(self, key):
+        """Return the operator string stored under a dataset name"""
+        with _open_hdf5(self.filename) as fd:
+            data = fd[key][()]
+        if isinstance(data, bytes):
+            return data.decode("utf-8")
+        return str(data)
+
+    def operator(self, key):
+        """Build the operator stored under a dataset name
+
+        Parameters:
+            key (str): Dataset name
+
+        Returns:
+            SparsePauliOp: The Hamiltonian
+        """
+        from qiskit.quantum_info import SparsePauliOp
+
+        num_qubits, terms = parse_qubit_operator(self.read(key))
+        if not terms:
+            return SparsePauliOp("I" * max(num_qubits, 1), 0)
+        return SparsePauliOp.from_sparse_list(terms, max(num_qubits, 1))
+
+    def scan(self):
+        """Return name, qubit and term counts of every Hamiltonian in the
+        file
+
+        The scan reads one dataset at a time and is stored in
+        `<cache_dir>/hamlib/hdf5`, keyed on the path, size and modification
+        time of the file.
+
+        Returns:
+            list: dicts with key, ham_qubits and ham_terms
+        """
+        stat = os.stat(self.filename)
+        label = hashlib.sha1(self.filename.encode()).hexdigest()[:12]
+        cache_dir = Configuration.get_cache_dir(os.path.join("hamlib", "hdf5"))
+        scan_file = (
+            f"{cache_dir}{self.family}-{label}-{stat.st_size}-{stat.st_mtime_ns}.json"
+        )
+        if os.path.exists(scan_file):
+            with open(scan_file, "r") as fd:
+                data = json.load(fd)
+            if data.get("version") == SCAN_VERSION:
+                return data["entries"]
+
+        entries = []
+        with _open_hdf5(self.filename) as fd:
+            for key in _dataset_names(fd):
+                data = fd[key][()]
+                text = data.decode("utf-8") if isinstance(data, bytes) else str(data)
+                entries.append(
+                    {
+                        "key": key,
+                        "ham_qubits": _num_qubits(text),
+                        "ham_terms": text.count("["),
+                    }
+                )
+        atomic_write_json({"version": SCAN_VERSION, "entries": entries}, scan_file)
+        return entries
+
+    def records(self):
+        """Yield a `HamiltonianRecord` for every Hamiltonian in the file"""
+        for entry in self.scan():
+            data = {
+                "ham_category": self.category,
+                "ham_problem": self.problem,
+                "ham_family": self.family,
+                # Quoted as in the representative set, whose test ids strip
+                # the first and last character
+                "ham_instance": repr(entry["key"]),
+                "ham_qubits": entry["ham_qubits"],
+                "ham_terms": entry["ham_terms"],
+            }
+            yield HamiltonianRecord(data, self, entry["key"])
+
+
+def iter_hamlib(
+    hamlib_dir, problems=None, min_qubits=None, max_qubits=None, max_terms=None
+):
+    """Iterate over the Hamiltonians of a HamLib library
+
+    Only metadata is held per record; the operator of a record is read
+    from its file when `HamiltonianRecord.operator` is called.
+
+    Parameters:
+        hamlib_dir (str): Library root, or a single HDF5 file
+        problems (list): Keep problem classes whose category, problem or
+                         family name is in this list
+        min_qubits (int): Minimum number of qubits
+        max_qubits (int): Maximum number of qubits
+        max_terms (int): Maximum number of Pauli terms
+
+    Yields:
+        HamiltonianRecord: Records passing every filter, in path order
+    """
+    if os.path.isfile(hamlib_dir):
+        filenames = [hamlib_dir]
+        hamlib_dir = os.path.dirname(os.path.abspath(hamlib_dir))
+    else:
+        filenames = _hamlib_files(hamlib_dir)
+    if problems is not None:
+        problems = {problem.lower() for problem in problems}
+
+    for filename in filenames:
+        hamlib_file = HamlibFile(filename, hamlib_dir)
+        names = {hamlib_file.category, hamlib_file.problem, hamlib_file.family}
+        if problems is not None and not problems & {name.lower() for name in names}:
+            continue
+        for record in hamlib_file.records():
+            if min_qubits is not None and record["ham_qubits"] < min_qubits:
+                continue
+            if max_qubits is not None and record["ham_qubits"] > max_qubits:
+                continue
+            if max_terms is not None and record["ham_terms"] > max_terms:
+                continue
+            yield record
+
+
+def hamlib_records():
+    """Return the HamLib records selected by the configuration
+
+    If `hamlib_dir` is set in the [general] section the records are read
+    from that HDF5 library, filtered by `hamlib_problems`,
+    `hamlib_min_qubits`, `hamlib_max_qubits` and `hamlib_max_terms`.
+    Otherwise the representative set is used.
+
+    Returns:
+        list: HamiltonianRecord instances
+    """
+    options = Configuration.options["general"]
+    hamlib_dir = options.get("hamlib_dir")
+    if not hamlib_dir:
+        return get_hamiltonian_store().records
+    return list(
+        iter_hamlib(
+            hamlib_dir,
+            problems=options.get("hamlib_problems"),
+            min_qubits=options.get("hamlib_min_qubits"),
+            max_qubits=options.get("hamlib_max_qubits"),
+            max_terms=options.get("hamlib_max_terms"),
+        )
+    )
+
+
+def parse_qubit_operator(text):
+    """Parse the string form of an OpenFermion `QubitOperator`
+
+    Parameters:
+        text (str): Operator string, e.g. '0.5 [X0 Y1] +\\n-1.0 [Z3]'
+
+    Returns:
+        tuple: number of qubits and a list of (paulis, indices, coefficient)
+               terms as accepted by `SparsePauliOp.from_sparse_list`
+    """
+    num_qubits = 0
+    terms = []
+    for match in TERM_PATTERN.finditer(text):
+        coefficient = match.group(1).strip().lstrip("+").strip()
+        paulis = ""
+        indices = []
+        for op in match.group(2).split():
+            paulis += op[0]
+            indices.append(int(op[1:]))
+        if indices:
+            num_qubits = max(num_qubits, max(indices) + 1)
+        terms.append((paulis, indices, complex(coefficient.replace(" ", "") or "1")))
+    return num_qubits, terms
+
+
+def _num_qubits(text):
+    indices = (int(match.group(1)) for match in QUBIT_PATTERN.finditer(text))
+    return max(indices, default=-1) + 1
+
+
+def _hamlib_files(hamlib_dir):
+    """Sorted paths of the HDF5 files below a directory"""
+    out = []
+    for root, _, files in os.walk(hamlib_dir):
+        for file in files:
+            if file.endswith(HAMLIB_SUFFIXES):
+                out.append(os.path.join(root, file))
+    return sorted(out)
+
+
+def _dataset_names(fd):
+    """Names of every dataset in an open HDF5 file, in file order"""
+    import h5py
+
+    names = []
+
+    def _visit(name, obj):
+        if isinstance(obj, h5py.Dataset):
+            names.append(name)
+
+    fd.visititems(_visit)
+    return names
+
+
+def _open_hdf5(filename):
+    try:
+        import h5py
+    except ImportError as err:
+        raise ImportError(
+            "Reading HamLib HDF5 files requires the 'h5py' package"
+        ) from err
+    return h5py.File(filename, "r")
@@ -0,0 +1,170 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Per-directory manifests of the QASM circuit corpus"""
+
+import argparse
+import hashlib
+import json
+import os
+
+from benchpress.config import Configuration
+from .atomic import atomic_write_json
+from .qasm_files import is_qasm_file, qasm_name, resolve_qasm_file
+from .qasm_stats import qasm_statistics
+
+MANIFEST_VERSION = 2
+
+# Manifests already brought up to date in this process keyed on directory
+_MANIFESTS = {}
+
+
+def get_manifest(qasm_dir):
+    """Return the manifest of every QASM file below a directory
+
+    Manifests are stored as JSON in `<cache_dir>/manifests` and updated
+    incrementally: only files whose size or modification time changed since
+    the last scan are hashed and rescanned.
+
+    Parameters:
+        qasm_dir (str): Top-level directory
+
+    Returns:
+        dict: Entries keyed on the path relative to `qasm_dir`, holding
+              name, sha256, file_size, mtime_ns and the statistics returned
+              by `qasm_statistics`
+    """
+    qasm_dir = os.path.abspath(qasm_dir)
+    if qasm_dir in _MANIFESTS:
+        return _MANIFESTS[qasm_dir]
+
+    manifest_file = _manifest_filename(qasm_dir)
+    entries = {}
+    if os.path.exists(manifest_file):
+        with open(manifest_file, "r") as fd:
+            data = json.load(fd)
+        if data.get("version") == MANIFEST_VERSION:
+            entries = data["files"]
+
+    updated = {}
+    changed = False
+    for rel_path in _qasm_files(qasm_dir):
+        stat = os.stat(os.path.join(qasm_dir, rel_path))
+        entry = entries.get(rel_path)
+        if (
+            entry is None
+            or entry["file_size"] != stat.st_size
+            or entry["mtime_ns"] != stat.st_mtime_ns
+        ):
+            entry = _scan_file(os.path.join(qasm_dir, rel_path), stat)
+            changed = True
+        updated[rel_path] = entry
+    if changed or len(updated) != len(entries):
+        atomic_write_json(
+            {"version": MANIFEST_VERSION, "files": updated}, manifest_file
+        )
+    _MANIFESTS[qasm_dir] = updated
+    return updated
+
+
+def manifest_circuits(qasm_dir, exclude="transpiled"):
+    """Get the file paths and names of the circuits below a directory
+    from its manifest
+
+    Parameters:
+        qasm_dir (str): Top-level directory
+        exclude (str): Skip files whose path contains this string
+
+    Returns:
+        tuple: list of QASM file paths and list of names, sorted by path
+    """
+    manifest = get_manifest(qasm_dir)
+    qasm_files = []
+    qasm_names = []
+    for rel_path, entry in manifest.items():
+        if exclude and exclude in rel_path:
+            continue
+        qasm_files.append(os.path.join(qasm_dir, rel_path))
+        qasm_names.append(entry["name"])
+    return qasm_files, qasm_names
+
+
+def qasm_file_metadata(qasm_file):
+    """Return the manifest entry of a single QASM file
+
+    Manifests already loaded in this process are searched first, otherwise
+    the manifest of the file's own directory is used.
+
+    Parameters:
+        qasm_file (str): Path to a plain or compressed QASM file
+
+    Returns:
+        dict: The manifest entry, or None if the file does not exist
+    """
+    qasm_file = os.path.abspath(resolve_qasm_file(qasm_file))
+    for qasm_dir, manifest in _MANIFESTS.items():
+        rel_path = os.path.relpath(qasm_file, qasm_dir)
+        if rel_path in manifest:
+            return manifest[rel_path]
+    if not os.path.exists(qasm_file):
+        return None
+    return get_manifest(os.path.dirname(qasm_file)).get(os.path.basename(qasm_file))
+
+
+def _qasm_files(qasm_dir):
+    """Sorted relative paths of the QASM files below a directory"""
+    out = []
+    for root, _, files in os.walk(qasm_dir):
+        for file in files:
+            if is_qasm_file(file):
+                out.append(os.path.relpath(os.path.join(root, file), qasm_dir))
+    return sorted(out)
+
+
+def _scan_file(filename, stat):
+    digest = hashlib.sha256()
+    with open(filename, "rb") as fd:
+        for chunk in iter(lambda: fd.read(1 << 20), b""):
+            digest.update(chunk)
+    entry = {
+        "name": qasm_name(filename).split(".")[0],
+        "sha256": digest.hexdigest(),
+        "file_size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+    entry.update(qasm_statistics(filename))
+    return entry
+
+
+def _manifest_filename(qasm_dir):
+    qasm_root = os.path.abspath(Configuration.get_qasm_dir())
+    rel_dir = os.path.relpath(qasm_dir, qasm_root)
+    if rel_dir.startswith(os.pardir):
+        label = hashlib.sha1(qasm_dir.encode()).hexdigest()[:12]
+    else:
+        label = rel_dir.replace(os.sep, "__")
+    return f"{Configuration.get_cache_dir('manifests')}{label}.json"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build QASM corpus manifests")
+    parser.add_argument(
+        "qasm_dirs",
+        nargs="*",
+        help="Directories to index, defaults to every directory in the corpus",
+    )
+    args = parser.parse_args()
+    qasm_root = Configuration.get_qasm_dir()
+    qasm_dirs = args.qasm_dirs or [
+        entry.path for entry in os.scandir(qasm_root) if entry.is_dir()
+    ]
+    for qasm_dir in sorted(qasm_dirs):
+        print(f"{qasm_dir}: {len(get_manifest(qasm_dir))} files")
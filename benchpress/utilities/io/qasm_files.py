@@ -0,0 +1,194 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Plain and compressed QASM files
+
+QASM files may be stored as `.qasm`, `.qasm.gz` or `.qasm.zst`.  Paths to
+`name.qasm` transparently resolve to a compressed sibling when the plain
+file is not present, so workouts keep referring to circuits by their
+uncompressed names.  Reading `.qasm.zst` requires the optional `zstandard`
+package.
+"""
+
+import argparse
+import gzip
+import io
+import os
+import shutil
+
+from benchpress.config import Configuration
+from .atomic import atomic_write
+
+COMPRESSED_SUFFIXES = (".gz", ".zst")
+QASM_SUFFIXES = (".qasm",) + tuple(".qasm" + suffix for suffix in COMPRESSED_SUFFIXES)
+
+
+def is_qasm_file(filename):
+    """Return True if the file name has a plain or compressed QASM suffix"""
+    return os.fspath(filename).endswith(QASM_SUFFIXES)
+
+
+def is_compressed_qasm(filename):
+    """Return True if the file name has a compressed QASM suffix"""
+    return os.fspath(filename).endswith(QASM_SUFFIXES[1:])
+
+
+def qasm_name(filename):
+    """Return the base name of a QASM file without its QASM suffix"""
+    name = os.path.basename(os.fspath(filename))
+    for suffix in QASM_SUFFIXES[::-1]:
+        if name.endswith(suffix):
+            return name[: -len(suffix)]
+    return name
+
+
+def resolve_qasm_file(qasm_file):
+    """Return the path of a QASM file as stored on disk
+
+    Parameters:
+        qasm_file (str): Path to a plain or compressed QASM file
+
+    Returns:
+        str: The path itself if it exists, else the first existing
+             compressed sibling, else the path unchanged
+    """
+    qasm_file = os.fspath(qasm_file)
+    if os.path.exists(qasm_file):
+        return qasm_file
+    for suffix in COMPRESSED_SUFFIXES:
+        if os.path.exists(qasm_file + suffix):
+            return qasm_file + suffix
+    return qasm_file
+
+
+def open_qasm(qasm_file, mode="rt"):
+    """Open a plain or compressed QASM file for streaming reads
+
+    Parameters:
+        qasm_file (str): Path to the QASM file
+        mode (str): 'rt' for text or 'rb' for bytes
+
+    Returns:
+        file: File object decompressing on the fly
+    """
+    qasm_file = resolve_qasm_file(qasm_file)
+    if qasm_file.endswith(".gz"):
+        return gzip.open(qasm_file, mode)
+    if qasm_file.endswith(".zst"):
+        try:
+            import zstandard
+        except ImportError as err:
+            raise ImportError(
+                "Reading .qasm.zst files requires the 'zstandard' package"
+            ) from err
+        reader = zstandard.ZstdDecompressor().stream_reader(
+            open(qasm_file, "rb"), closefd=True
+        )
+        if "b" in mode:
+            return reader
+        return io.TextIOWrapper(reader, encoding="utf-8")
+    return open(qasm_file, mode)
+
+
+def read_qasm(qasm_file):
+    """Return the contents of a plain or compressed QASM file as a string"""
+    with open_qasm(qasm_file, "rt") as fd:
+        return fd.read()
+
+
+def uncompressed_qasm_file(qasm_file):
+    """Return the path of an uncompressed copy of a QASM file
+
+    Needed by tools that only accept file paths, such as the staq
+    executable.  Compressed files are decompressed once into the cache
+    directory and reused while the source file is unchanged.
+
+    Parameters:
+        qasm_file (str): Path to a plain or compressed QASM file
+
+    Returns:
+        str: Path to a plain QASM file
+    """
+    qasm_file = resolve_qasm_file(qasm_file)
+    if not is_compressed_qasm(qasm_file):
+        return qasm_file
+    stat = os.stat(qasm_file)
+    cache_dir = Configuration.get_cache_dir("qasm")
+    filename = (
+        f"{cache_dir}{qasm_name(qasm_file)}-{stat.st_size}-{stat.st_mtime_ns}.qasm"
+    )
+    if not os.path.exists(filename):
+
+        def _writer(tmp_name):
+            with open(tmp_name, "wb") as out, open_qasm(qasm_file, "rb") as src:
+                shutil.copyfileobj(src, out)
+
+        atomic_write(filename, _writer)
+    return filename
+
+
+def compress_qasm_file(qasm_file, fmt="gz", remove=False):
+    """Write a compressed copy of a plain QASM file next to it
+
+    Parameters:
+        qasm_file (str): Path to a plain QASM file
+        fmt (str): Compression format, 'gz' or 'zst'
+        remove (bool): Remove the plain file afterwards
+
+    Returns:
+        str: Path of the compressed file
+    """
+    if fmt not in ["gz", "zst"]:
+        raise ValueError(f"Invalid compression format ({fmt})")
+    out_file = f"{qasm_file}.{fmt}"
+    with open(qasm_file, "rb") as src:
+        if fmt == "gz":
+            with gzip.open(out_file, "wb", compresslevel=9) as out:
+                shutil.copyfileobj(src, out)
+        else:
+            import zstandard
+
+            with open(out_file, "wb") as out:
+                zstandard.ZstdCompressor(level=19).copy_stream(src, out)
+    if remove:
+        os.remove(qasm_file)
+    return out_file
+
+
+def compress_qasm_dir(qasm_dir, fmt="gz", remove=False):
+    """Compress every plain QASM file below a directory
+
+    Parameters:
+        qasm_dir (str): Top-level directory
+        fmt (str): Compression format, 'gz' or 'zst'
+        remove (bool): Remove the plain files afterwards
+
+    Returns:
+        list: Paths of the compressed files
+    """
+    out = []
+    for root, _, files in os.walk(qasm_dir):
+        for file in files:
+            if file.endswith(".qasm"):
+                out.append(compress_qasm_file(os.path.join(root, file), fmt, remove))
+    return out
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compress a QASM corpus")
+    parser.add_argument("qasm_dir", help="Top-level directory to compress")
+    parser.add_argument("--format", choices=["gz", "zst"], default="gz")
+    parser.add_argument(
+        "--remove", action="store_true", help="Remove the plain QASM files"
+    )
+    args = parser.parse_args()
+    for filename in compress_qasm_dir(args.qasm_dir, args.format, args.remove):
+        print(filename)
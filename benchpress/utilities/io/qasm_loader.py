@@ -12,6 +12,7 @@
 """QASMbench utilities"""
 
 from benchpress.config import Configuration
+from .qasm_files import resolve_qasm_file
 
 
 def qasm_circuit_loader(qasm_file, benchmark):
@@ -24,6 +25,7 @@ def qasm_circuit_loader(qasm_file, benchmark):
         The circuit instance for the corresponding SDK
     """
     gym_name = Configuration.gym_name
+    qasm_file = resolve_qasm_file(qasm_file)
     if gym_name in ["qiskit", "qiskit-ibm-transpiler", "staq"]:
         from benchpress.qiskit_gym.utils.io import qiskit_qasm_loader
 
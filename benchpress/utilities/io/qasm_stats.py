@@ -0,0 +1,278 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""SDK independent statistics of OpenQASM 2 files"""
+
+import re
+from collections import Counter
+
+import numpy as np
+
+from .qasm_files import open_qasm
+
+STATEMENT_PATTERN = re.compile(
+    r"^(?:if\s*\([^)]*\)\s*)?([A-Za-z_]\w*)\s*(?:\((.*)\))?\s*(.*)$", re.S
+)
+DELIMITER_PATTERN = re.compile(r"([{};])")
+ARG_PATTERN = re.compile(r"^([A-Za-z_]\w*)\s*(?:\[\s*(\d+)\s*\])?$")
+GATE_PATTERN = re.compile(
+    r"^gate\s+([A-Za-z_]\w*)\s*(?:\([^)]*\))?\s*([^{]*)\{(.*)\}$", re.S
+)
+# Statements that do not act on qubits
+DECLARATIONS = {"OPENQASM", "include", "creg"}
+
+
+def qasm_statistics(qasm_file):
+    """Compute circuit statistics of an OpenQASM 2 file without an SDK
+
+    User defined gates are expanded into the gates of their definitions,
+    down to gates the file does not define (those of `qelib1.inc` and
+    opaque gates).  Barriers are listed in the gate counts but, as in
+    Qiskit, are left out of the size and do not contribute to depth.
+
+    Parameters:
+        qasm_file (str): Path to a plain or compressed QASM file
+
+    Returns:
+        dict: num_qubits, gate_counts, size, gate_count_2q, depth and
+              depth_2q of the circuit
+    """
+    scanner = _QasmScanner()
+    with open_qasm(qasm_file, "rt") as fd:
+        for statement in _statements(fd):
+            scanner.apply(statement)
+    return scanner.statistics()
+
+
+def qasm_num_qubits(qasm_file):
+    """Return the number of qubits declared in a QASM file
+    without parsing the circuit
+
+    Parameters:
+        qasm_file (str): Path to a plain or compressed QASM file
+
+    Returns:
+        int: Total size of all quantum registers
+    """
+    scanner = _QasmScanner()
+    with open_qasm(qasm_file, "rt") as fd:
+        for statement in _statements(fd):
+            if statement.startswith("qreg"):
+                scanner.apply(statement)
+    return scanner.num_qubits
+
+
+def qasm_two_qubit_interactions(qasm_file):
+    """Return the qubit pairs acted on by two-qubit gates in a QASM file
+    without parsing the circuit
+
+    Qubits are numbered by concatenating the quantum registers in
+    declaration order.  Register broadcasts are expanded; barriers and
+    gates on other numbers of qubits are ignored.
+
+    Parameters:
+        qasm_file (str): Path to a plain or compressed QASM file
+
+    Returns:
+        tuple: Number of qubits and an (G, 2) integer array of qubit pairs
+    """
+    scanner = _QasmScanner(record_pairs=True)
+    with open_qasm(qasm_file, "rt") as fd:
+        for statement in _statements(fd):
+            scanner.apply(statement)
+    pairs = np.asarray(scanner.pairs, dtype=np.int64).reshape(-1, 2)
+    return scanner.num_qubits, pairs
+
+
+def record_qasm_statistics(qasm_file, benchmark):
+    """Record SDK independent statistics of an input QASM file
+
+    Statistics are taken from the corpus manifest, so indexed files are not
+    read again.  Do not call this inside a timed region.
+
+    Parameters:
+        qasm_file (str): Path to a plain or compressed QASM file
+        benchmark (Benchmark): Benchmark class to record info to
+    """
+    from .manifest import qasm_file_metadata
+
+    stats = qasm_file_metadata(qasm_file) or qasm_statistics(qasm_file)
+    benchmark.extra_info["input_num_qubits"] = stats["num_qubits"]
+    benchmark.extra_info["input_circuit_operations"] = stats["gate_counts"]
+    benchmark.extra_info["input_gate_count_2q"] = stats["gate_count_2q"]
+    benchmark.extra_info["input_depth"] = stats["depth"]
+    benchmark.extra_info["input_depth_2q"] = stats["depth_2q"]
+
+
+def _statements(lines):
+    """Yield the top-level statements of a QASM program, skipping comments
+
+    Gate definitions are yielded whole, as `gate name(...) args {body}`.
+    """
+    buffer = []
+    depth = 0
+    for line in lines:
+        for token in DELIMITER_PATTERN.split(line.split("//", 1)[0]):
+            if token == "{":
+                depth += 1
+                buffer.append(token)
+            elif token == "}":
+                depth -= 1
+                buffer.append(token)
+                if not depth:
+                    statement = "".join(buffer).strip()
+                    buffer = []
+                    if statement:
+                        yield statement
+            elif depth:
+                buffer.append(token)
+            elif token == ";":
+                statement = "".join(buffer).strip()
+                buffer = []
+                if statement:
+                    yield statement
+            elif token:
+                buffer.append(token)
+
+
+class _QasmScanner:
+    """Accumulates statistics over QASM statements
+
+    Memory is one depth counter pair per qubit plus the gate name counts,
+    independent of the number of statements, unless the qubit pairs of
+    two-qubit gates are recorded.
+
+    Parameters:
+        record_pairs (bool): Collect the qubits of two-qubit gates in `pairs`
+    """
+
+    def __init__(self, record_pairs=False):
+        self.record_pairs = record_pairs
+        self.pairs = []
+        # Number of arguments and flattened body of each user defined gate
+        self.definitions = {}
+        self.registers = {}
+        self.num_qubits = 0
+        self.gate_counts = Counter()
+        self.gate_count_2q = 0
+        self.depth = []
+        self.depth_2q = []
+
+    def apply(self, statement):
+        if statement.startswith("gate"):
+            self._define(statement)
+            return
+        if statement.startswith("opaque "):
+            return
+        match = STATEMENT_PATTERN.match(statement)
+        if match is None:
+            return
+        name, _, args = match.groups()
+        if name in DECLARATIONS:
+            return
+        if name == "qreg":
+            reg = ARG_PATTERN.match(args.strip())
+            if reg is not None and reg.group(2) is not None:
+                size = int(reg.group(2))
+                self.registers[reg.group(1)] = (self.num_qubits, size)
+                self.num_qubits += size
+                self.depth.extend([0] * size)
+                self.depth_2q.extend([0] * size)
+            return
+        if name == "measure":
+            args = args.split("->", 1)[0]
+        definition = self.definitions.get(name)
+        for qubits in self._expand(args):
+            if definition is None or definition[0] != len(qubits):
+                self._add_gate(name, qubits)
+                continue
+            for gate, indices in definition[1]:
+                self._add_gate(gate, tuple(qubits[idx] for idx in indices))
+
+    def _define(self, statement):
+        """Record a gate definition with its body flattened into gates the
+        file does not define, on argument indices"""
+        match = GATE_PATTERN.match(statement)
+        if match is None:
+            return
+        name, args, body = match.groups()
+        formal = {arg.strip(): idx for idx, arg in enumerate(args.split(","))}
+        flat = []
+        for line in body.split(";"):
+            gate = STATEMENT_PATTERN.match(line.strip())
+            if gate is None or gate.group(1) == "barrier":
+                continue
+            operands = [arg.strip() for arg in gate.group(3).split(",")]
+            if not all(arg in formal for arg in operands):
+                continue
+            indices = tuple(formal[arg] for arg in operands)
+            inner = self.definitions.get(gate.group(1))
+            if inner is None or inner[0] != len(indices):
+                flat.append((gate.group(1), indices))
+            else:
+                flat.extend(
+                    (sub, tuple(indices[idx] for idx in sub_indices))
+                    for sub, sub_indices in inner[1]
+                )
+        self.definitions[name] = (len(formal), flat)
+
+    def _add_gate(self, name, qubits):
+        self.gate_counts[name] += 1
+        if name == "barrier":
+            return
+        if len(qubits) == 2:
+            self.gate_count_2q += 1
+            if self.record_pairs:
+                self.pairs.append(qubits)
+        self._add_layer(qubits)
+
+    def _expand(self, args):
+        """Expand register broadcasts into per-application qubit tuples
+        lazily, so whole-register operations never materialize a list"""
+        operands = []
+        width = 1
+        for arg in args.split(","):
+            reg = ARG_PATTERN.match(arg.strip())
+            if reg is None or reg.group(1) not in self.registers:
+                return []
+            offset, size = self.registers[reg.group(1)]
+            if reg.group(2) is None:
+                operands.append((offset, size))
+                width = max(width, size)
+            else:
+                operands.append((offset + int(reg.group(2)), None))
+        return (
+            tuple(qubit if size is None else qubit + idx for qubit, size in operands)
+            for idx in range(width)
+        )
+
+    def _add_layer(self, qubits):
+        level = max(self.depth[q] for q in qubits) + 1
+        level_2q = max(self.depth_2q[q] for q in qubits)
+        if len(qubits) == 2:
+            level_2q += 1
+        for q in qubits:
+            self.depth[q] = level
+            if len(qubits) > 1:
+                self.depth_2q[q] = level_2q
+
+    def statistics(self):
+        gate_counts = dict(self.gate_counts)
+        return {
+            "num_qubits": self.num_qubits,
+            "gate_counts": gate_counts,
+            "size": sum(
+                count for name, count in gate_counts.items() if name != "barrier"
+            ),
+            "gate_count_2q": self.gate_count_2q,
+            "depth": max(self.depth, default=0),
+            "depth_2q": max(self.depth_2q, default=0),
+        }
@@ -0,0 +1,30 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Installed package versions, used to key caches of SDK output"""
+
+import importlib.metadata
+
+
+def package_version(package, default="unknown"):
+    """Return the installed version of a distribution
+
+    Parameters:
+        package (str): Distribution name, e.g. 'qiskit'
+        default: Value returned if the distribution is not installed
+
+    Returns:
+        str: The version, or `default`
+    """
+    try:
+        return importlib.metadata.version(package)
+    except importlib.metadata.PackageNotFoundError:
+        return default
@@ -0,0 +1,20 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+from .arrays import CircuitArrays, circuit_arrays, circuit_arrays_from_operations
+from .engine import (
+    circuit_metrics,
+    operation_counts,
+    record_output_metrics,
+    two_qubit_depth,
+)
+from .esp import estimated_success_probability, record_estimated_success_probability
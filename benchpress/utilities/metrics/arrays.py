@@ -0,0 +1,128 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Compact array form of circuits shared by every gym"""
+
+import numpy as np
+
+from benchpress.config import Configuration
+
+
+class CircuitArrays:
+    """A circuit as one operation code and up to two qubit indices per
+    instruction
+
+    Attributes:
+        num_qubits (int): Number of qubits in the circuit
+        names (list): Operation name of each operation code
+        opcodes (ndarray): Operation code of each instruction
+        qubits (ndarray): (N, 2) qubit indices of each instruction, -1 where
+                          an instruction acts on fewer than two qubits.  Only
+                          the first two qubits of wider instructions are kept.
+                          Converters keep device qubit indices where the SDK
+                          exposes them
+        widths (ndarray): Number of qubits of each instruction
+    """
+
+    def __init__(self, num_qubits, names, opcodes, qubits, widths):
+        self.num_qubits = num_qubits
+        self.names = names
+        self.opcodes = opcodes
+        self.qubits = qubits
+        self.widths = widths
+
+    def __len__(self):
+        return self.opcodes.shape[0]
+
+    def opcode(self, name):
+        """Return the operation code of a name, or -1 if it does not occur"""
+        try:
+            return self.names.index(name)
+        except ValueError:
+            return -1
+
+    def mask(self, name):
+        """Return a boolean mask of the instructions of an operation"""
+        return self.opcodes == self.opcode(name)
+
+
+def circuit_arrays_from_operations(num_qubits, operations):
+    """Build circuit arrays from a sequence of operations
+
+    Parameters:
+        num_qubits (int): Number of qubits in the circuit
+        operations (iterable): (name, qubit indices) of every instruction in
+                               circuit order
+
+    Returns:
+        CircuitArrays: The circuit arrays
+    """
+    codes = {}
+    opcodes = []
+    first = []
+    second = []
+    widths = []
+    for name, qubits in operations:
+        code = codes.get(name)
+        if code is None:
+            code = codes[name] = len(codes)
+        opcodes.append(code)
+        width = len(qubits)
+        widths.append(width)
+        first.append(qubits[0] if width else -1)
+        second.append(qubits[1] if width > 1 else -1)
+    return CircuitArrays(
+        num_qubits,
+        list(codes),
+        np.asarray(opcodes, dtype=np.int32),
+        np.stack(
+            [np.asarray(first, dtype=np.int32), np.asarray(second, dtype=np.int32)],
+            axis=1,
+        ),
+        np.asarray(widths, dtype=np.int32),
+    )
+
+
+def circuit_arrays(circuit):
+    """Convert a circuit of the current gym to circuit arrays
+
+    Parameters:
+        circuit : Circuit instance of the gym's SDK
+
+    Returns:
+        CircuitArrays: The circuit arrays
+    """
+    gym_name = Configuration.gym_name
+    if gym_name in ["qiskit", "qiskit-ibm-transpiler", "staq"]:
+        from benchpress.qiskit_gym.utils.io import qiskit_circuit_arrays
+
+        return qiskit_circuit_arrays(circuit)
+    elif gym_name == "tket":
+        from benchpress.tket_gym.utils.io import tket_circuit_arrays
+
+        return tket_circuit_arrays(circuit)
+    elif gym_name == "bqskit":
+        from benchpress.bqskit_gym.utils.io import bqskit_circuit_arrays
+
+        return bqskit_circuit_arrays(circuit)
+    elif gym_name == "cirq":
+        from benchpress.cirq_gym.utils.io import cirq_circuit_arrays
+
+        return cirq_circuit_arrays(circuit)
+    elif gym_name == "braket":
+        from benchpress.braket_gym.utils.io import braket_circuit_arrays
+
+        return braket_circuit_arrays(circuit)
+    elif gym_name == "qpanda":
+        from benchpress.qpanda_gym.utils.io import qpanda_circuit_arrays
+
+        return qpanda_circuit_arrays(circuit)
+    raise ValueError(f"Circuit arrays are not supported for {gym_name}")
@@ -0,0 +1,97 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Circuit metrics computed identically for every SDK from circuit arrays"""
+
+import numpy as np
+
+
+def operation_counts(arrays):
+    """Return the number of instructions of each operation
+
+    Parameters:
+        arrays (CircuitArrays): The circuit
+
+    Returns:
+        dict: Counts keyed on operation name, in order of first occurrence
+    """
+    counts = np.bincount(arrays.opcodes, minlength=len(arrays.names))
+    return {name: int(count) for name, count in zip(arrays.names, counts)}
+
+
+def two_qubit_depth(arrays, two_qubit_gate):
+    """Return the depth of the circuit counting only one 2Q gate
+
+    Parameters:
+        arrays (CircuitArrays): The circuit
+        two_qubit_gate (str): Name of the 2Q gate, or None for every
+                              two-qubit instruction
+
+    Returns:
+        int: Number of layers of the 2Q gate
+    """
+    pairs = arrays.qubits[_two_qubit_mask(arrays, two_qubit_gate)]
+    if not pairs.shape[0]:
+        return 0
+    # Layering is inherently sequential; walking plain ints over the 2Q
+    # gates only keeps it to a single cheap pass
+    levels = [0] * max(arrays.num_qubits, int(pairs.max()) + 1)
+    depth = 0
+    for q0, q1 in pairs.tolist():
+        level = max(levels[q0], levels[q1]) + 1
+        levels[q0] = levels[q1] = level
+        if level > depth:
+            depth = level
+    return depth
+
+
+def circuit_metrics(arrays, two_qubit_gate):
+    """Compute the output metrics of a circuit
+
+    Parameters:
+        arrays (CircuitArrays): The circuit
+        two_qubit_gate (str): Name of the 2Q gate, or None for every
+                              two-qubit instruction
+
+    Returns:
+        dict: num_qubits, circuit_operations, gate_count_2q and depth_2q
+    """
+    counts = operation_counts(arrays)
+    if two_qubit_gate is None:
+        gate_count_2q = int(np.count_nonzero(_two_qubit_mask(arrays, None)))
+    else:
+        gate_count_2q = counts.get(two_qubit_gate, 0)
+    return {
+        "num_qubits": arrays.num_qubits,
+        "circuit_operations": counts,
+        "gate_count_2q": gate_count_2q,
+        "depth_2q": two_qubit_depth(arrays, two_qubit_gate),
+    }
+
+
+def record_output_metrics(arrays, two_qubit_gate, benchmark):
+    """Record the output metrics of a circuit
+
+    Parameters:
+        arrays (CircuitArrays): The circuit
+        two_qubit_gate (str): Name of the 2Q gate, or None for every
+                              two-qubit instruction
+        benchmark (Benchmark): Benchmark class to record info to
+    """
+    for key, value in circuit_metrics(arrays, two_qubit_gate).items():
+        benchmark.extra_info["output_" + key] = value
+
+
+def _two_qubit_mask(arrays, two_qubit_gate):
+    """Boolean mask of the 2Q gates, or of every two-qubit instruction"""
+    if two_qubit_gate is None:
+        return arrays.widths == 2
+    return arrays.mask(two_qubit_gate) & (arrays.widths == 2)
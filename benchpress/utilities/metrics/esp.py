@@ -0,0 +1,244 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Estimated success probability of device outputs from calibration data"""
+
+import numpy as np
+
+from benchpress.config import Configuration
+
+# Also charge idle qubits for decoherence, which needs a schedule pass
+ESP_IDLE_DECOHERENCE = Configuration.options["general"].get(
+    "esp_idle_decoherence", False
+)
+
+
+# Directives that never touch a qubit's state
+FREE_INSTRUCTIONS = {"barrier", "delay"}
+
+# Calibrated 1Q gates whose values stand in for 1Q gates outside the basis
+SUBSTITUTE_1Q_GATES = ["sx", "x"]
+
+
+def instruction_errors(arrays, snapshot):
+    """Return the calibrated error of every instruction
+
+    Instructions are matched to the device by name, ignoring case and a
+    trailing 'gate' (so 'CZ', 'cz' and 'CZGate' are the same gate).  The
+    circuit qubit indices are taken to be device qubits.  Gates outside the
+    device basis are charged the error of the device 2Q gate on the same
+    edge, or of `sx` (else `x`) on the same qubit, and missing calibration
+    data is replaced by the device median of that gate.  Barriers and
+    delays have zero error; anything else that cannot be priced, such as
+    a 2Q gate between uncoupled qubits, is NaN.
+
+    Parameters:
+        arrays (CircuitArrays): The circuit
+        snapshot (dict): Device snapshot from `get_backend_snapshot`
+
+    Returns:
+        ndarray: Error per instruction
+    """
+    return _instruction_values(
+        arrays, snapshot, snapshot["gate_errors"], snapshot["readout_errors"]
+    )
+
+
+def instruction_durations(arrays, snapshot):
+    """Return the calibrated duration in seconds of every instruction
+
+    Gates outside the device basis are matched as in `instruction_errors`.
+
+    Parameters:
+        arrays (CircuitArrays): The circuit
+        snapshot (dict): Device snapshot from `get_backend_snapshot`
+
+    Returns:
+        ndarray: Duration per instruction, zero where unknown
+    """
+    readout_durations = np.zeros(snapshot["num_qubits"])
+    return np.nan_to_num(
+        _instruction_values(
+            arrays, snapshot, snapshot["gate_durations"], readout_durations
+        )
+    )
+
+
+def estimated_success_probability(arrays, snapshot, idle=False):
+    """Return the product of the gate fidelities of a circuit on a device
+
+    Parameters:
+        arrays (CircuitArrays): The circuit
+        snapshot (dict): Device snapshot from `get_backend_snapshot`
+        idle (bool): Also multiply by exp(-t / T2) for the time t every
+                     active qubit sits idle in an as-soon-as-possible
+                     schedule (T1 where T2 is unknown)
+
+    Returns:
+        float: The estimated success probability, or None if the error of
+               some instruction is unknown
+    """
+    errors = instruction_errors(arrays, snapshot)
+    if np.isnan(errors).any():
+        return None
+    log_esp = np.sum(np.log1p(-np.clip(errors, 0, 1)))
+    if idle:
+        log_esp -= np.sum(_idle_decay(arrays, snapshot))
+    return float(np.exp(log_esp))
+
+
+def substituted_gates(arrays, snapshot):
+    """Return the names of the gates outside the device basis
+
+    Parameters:
+        arrays (CircuitArrays): The circuit
+        snapshot (dict): Device snapshot from `get_backend_snapshot`
+
+    Returns:
+        list: Sorted gate names that are priced by substitution
+    """
+    basis = set(snapshot["basis_gates"]) | FREE_INSTRUCTIONS | {"measure"}
+    used = np.unique(arrays.opcodes)
+    return sorted(
+        {
+            arrays.names[code]
+            for code in used.tolist()
+            if _device_gate_name(arrays.names[code]) not in basis
+        }
+    )
+
+
+def record_estimated_success_probability(arrays, snapshot, benchmark):
+    """Record the estimated success probability of an output circuit
+
+    `output_esp` is None when some instruction cannot be priced, and gates
+    outside the device basis are listed in `output_esp_substituted_gates`.
+
+    Parameters:
+        arrays (CircuitArrays): The circuit
+        snapshot (dict): Device snapshot from `get_backend_snapshot`
+        benchmark (Benchmark): Benchmark class to record info to
+    """
+    benchmark.extra_info["output_esp"] = estimated_success_probability(arrays, snapshot)
+    benchmark.extra_info["output_esp_substituted_gates"] = substituted_gates(
+        arrays, snapshot
+    )
+    if ESP_IDLE_DECOHERENCE:
+        benchmark.extra_info["output_esp_idle"] = estimated_success_probability(
+            arrays, snapshot, idle=True
+        )
+
+
+def _device_gate_name(name):
+    name = name.lower()
+    if name.endswith("gate") and len(name) > 4:
+        name = name[:-4]
+    return name
+
+
+def _instruction_values(arrays, snapshot, gate_values, readout_values):
+    """Look up per-qubit or per-edge values for every instruction, NaN
+    where no value applies"""
+    num_qubits = snapshot["num_qubits"]
+    two_q_gate = snapshot["two_q_gate"]
+    out = np.full(len(arrays), np.nan)
+    q0 = arrays.qubits[:, 0]
+    q1 = arrays.qubits[:, 1]
+    on_device = (q0 >= 0) & (q0 < num_qubits) & (q1 < num_qubits)
+    substitute_1q = next(
+        (gate for gate in SUBSTITUTE_1Q_GATES if gate in gate_values), None
+    )
+    edge_index = None
+    for code, name in enumerate(arrays.names):
+        gate = _device_gate_name(name)
+        mask = arrays.opcodes == code
+        if gate in FREE_INSTRUCTIONS:
+            out[mask] = 0.0
+            continue
+        mask &= on_device
+        if gate == "measure":
+            mask &= arrays.widths == 1
+            out[mask] = _fill_missing(readout_values)[q0[mask]]
+        elif gate in gate_values and len(gate_values[gate]) == num_qubits:
+            mask &= arrays.widths == 1
+            out[mask] = _fill_missing(gate_values[gate])[q0[mask]]
+        elif two_q_gate in gate_values and np.any(mask & (arrays.widths == 2)):
+            # The device 2Q gate, or a 2Q gate outside the basis
+            mask &= arrays.widths == 2
+            if edge_index is None:
+                edge_index = _edge_index(snapshot["edges"], num_qubits, q0, q1)
+            mask &= edge_index >= 0
+            out[mask] = _fill_missing(gate_values[two_q_gate])[edge_index[mask]]
+        elif substitute_1q is not None:
+            # A 1Q gate outside the basis
+            mask &= arrays.widths == 1
+            out[mask] = _fill_missing(gate_values[substitute_1q])[q0[mask]]
+    return out
+
+
+def _fill_missing(values):
+    """Replace missing calibration data by the median of the others"""
+    values = np.asarray(values, dtype=float)
+    missing = np.isnan(values)
+    if missing.any() and not missing.all():
+        values = np.where(missing, np.nanmedian(values), values)
+    return values
+
+
+def _edge_index(edges, num_qubits, q0, q1):
+    """Position of every (q0, q1) pair in the device edge list, trying the
+    reverse direction for symmetric gates, or -1 if it is not an edge"""
+    keys = edges[:, 0].astype(np.int64) * num_qubits + edges[:, 1]
+    order = np.argsort(keys)
+    sorted_keys = keys[order]
+    out = np.full(q0.shape[0], -1, dtype=np.int64)
+    if not keys.shape[0]:
+        return out
+    for first, second in [(q0, q1), (q1, q0)]:
+        query = first.astype(np.int64) * num_qubits + second
+        pos = np.clip(np.searchsorted(sorted_keys, query), 0, len(keys) - 1)
+        found = (out < 0) & (sorted_keys[pos] == query)
+        found &= (first >= 0) & (second >= 0)
+        out[found] = order[pos[found]]
+    return out
+
+
+def _idle_decay(arrays, snapshot):
+    """Idle time divided by T2 (or T1) for every active device qubit"""
+    num_qubits = snapshot["num_qubits"]
+    durations = instruction_durations(arrays, snapshot)
+    qubits = arrays.qubits
+    # The schedule is sequential by nature; walk plain ints once
+    available = [0.0] * num_qubits
+    for (q0, q1), duration in zip(qubits.tolist(), durations.tolist()):
+        if not 0 <= q0 < num_qubits:
+            continue
+        if 0 <= q1 < num_qubits:
+            end = max(available[q0], available[q1]) + duration
+            available[q0] = available[q1] = end
+        else:
+            available[q0] += duration
+    total = max(available)
+
+    busy = np.zeros(num_qubits)
+    for column in range(2):
+        valid = (qubits[:, column] >= 0) & (qubits[:, column] < num_qubits)
+        busy += np.bincount(
+            qubits[valid, column], weights=durations[valid], minlength=num_qubits
+        )
+    active = np.zeros(num_qubits, dtype=bool)
+    active[qubits[(qubits >= 0) & (qubits < num_qubits)]] = True
+    coherence = np.where(np.isnan(snapshot["t2"]), snapshot["t1"], snapshot["t2"])
+    idle = np.clip(total - busy, 0, None)
+    decay = np.zeros(num_qubits)
+    usable = active & np.isfinite(coherence) & (coherence > 0)
+    decay[usable] = idle[usable] / coherence[usable]
+    return decay
@@ -0,0 +1,58 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Parallel test runner
+
+The exports are imported on first use: worker processes import this
+package before pinning themselves, which must happen before numpy, pytest
+or an SDK is imported and starts its thread pools.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "isolation": ["in_isolated_child", "run_isolated"],
+    "placement": ["available_cpus", "core_sets", "pin_from_env", "worker_env"],
+    "parallel": [
+        "collect_tests",
+        "merge_results",
+        "predict_runtimes",
+        "run_parallel",
+        "update_overhead",
+    ],
+    "predict": [
+        "RuntimePredictor",
+        "lpt_order",
+        "predicted_makespan",
+        "runtime_features",
+    ],
+    "skiplist": [
+        "TimeoutSkipList",
+        "gym_name_from_path",
+        "load_overhead",
+        "load_runtimes",
+        "read_skipfile",
+        "record_overhead",
+        "record_runtimes",
+        "sdk_versions",
+        "write_skipfile",
+    ],
+}
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_MODULES)
+
+
+def __getattr__(name):
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{_MODULES[name]}")
+    return getattr(module, name)
@@ -0,0 +1,318 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Run test bodies in forked children under wall clock and memory limits
+
+Fixtures are set up in the pytest process as usual; only the test function
+runs in a child forked from it, in its own process group so that anything
+it spawns is killed with it.  Memory is capped with a cgroup v2 (when the
+session runs in a delegated cgroup with the memory controller enabled) or
+else `RLIMIT_AS`.  Timeouts are reported as failures and exhausted memory
+as XFAIL, as the README defines them, and the session carries on.
+
+The peak memory reported is what the child used on top of the pytest
+process it was forked from: with a cgroup only pages the child allocates
+are charged to it, and otherwise the resident size of the parent before
+the fork, which the child's `ru_maxrss` includes, is subtracted.  Since
+`RLIMIT_AS` caps the address space of the whole child, including what it
+inherited from the parent, it is set to the parent's virtual size at the
+fork plus the memory cap.
+
+The benchmark timings and `extra_info` of the child are copied into the
+session's `benchmark` fixture so reports are the same as without isolation.
+"""
+
+import os
+import pickle
+import resource
+import select
+import signal
+import sys
+import time
+import traceback
+
+import pytest
+
+# Set on items whose child was killed at the deadline
+TIMED_OUT = pytest.StashKey[bool]()
+
+_CGROUP_ROOT = "/sys/fs/cgroup"
+# True in a forked child, where the test body runs as usual
+_IN_CHILD = False
+_READ_SIZE = 1 << 16
+
+
+def in_isolated_child():
+    """Return whether this process is a forked test child"""
+    return _IN_CHILD
+
+
+def run_isolated(pyfuncitem, timeout=None, memory=None):
+    """Run a test function in a forked child
+
+    Parameters:
+        pyfuncitem (Function): The test item, with its fixtures set up
+        timeout (float): Wall clock seconds before the child is killed
+        memory (int): Memory cap of the child in MB
+    """
+    global _IN_CHILD
+    cgroup = _make_cgroup(memory) if memory else None
+    baseline = _status_mb("VmRSS")
+    inherited = _status_mb("VmSize")
+    result_read, result_write = os.pipe()
+    go_read, go_write = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        _IN_CHILD = True
+        os.close(result_read)
+        os.close(go_write)
+        os.setpgid(0, 0)
+        # Wait until the parent has tried to move us into the cgroup
+        joined = os.read(go_read, 1) == b"c"
+        os.close(go_read)
+        if memory and not joined:
+            limit = int((inherited + memory) * 1024 * 1024)
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        _child(pyfuncitem, result_write)
+
+    os.close(result_write)
+    os.close(go_read)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    payload = None
+    timed_out = False
+    try:
+        try:
+            os.setpgid(pid, pid)
+        except OSError:
+            pass
+        if cgroup is not None:
+            try:
+                _write(os.path.join(cgroup, "cgroup.procs"), str(pid))
+            except OSError:
+                _remove_cgroup(cgroup)
+                cgroup = None
+        # "c": capped by the cgroup, "r": the child caps itself
+        os.write(go_write, b"c" if cgroup is not None else b"r")
+        os.close(go_write)
+        payload, timed_out = _read_until(result_read, deadline)
+    finally:
+        os.close(result_read)
+        if timed_out or payload is None:
+            _kill_group(pid)
+        _, status, usage = os.wait4(pid, 0)
+        _kill_group(pid)
+    # ru_maxrss is in kB on Linux and includes the pages of the parent
+    peak = max(usage.ru_maxrss / 1024 - baseline, 0.0)
+    oom_killed = False
+    limit = None
+    if cgroup is not None:
+        peak = _read_int(os.path.join(cgroup, "memory.peak"), peak * 2**20) / 2**20
+        oom_killed = _oom_kills(cgroup) > 0
+        limit = f"cgroup memory.max of {memory} MB"
+        _remove_cgroup(cgroup)
+    elif memory:
+        limit = (
+            f"RLIMIT_AS address space limit of {memory} MB above the "
+            f"{inherited:.0f} MB parent"
+        )
+    outcome = (payload, status, timed_out, oom_killed)
+    _report(pyfuncitem, outcome, peak, baseline, timeout, limit)
+
+
+def _child(pyfuncitem, result_write):
+    """Run the test body and send its outcome to the parent, never
+    returning"""
+    outcome = {"outcome": "passed"}
+    try:
+        pyfuncitem.ihook.pytest_pyfunc_call(pyfuncitem=pyfuncitem)
+    except pytest.skip.Exception as err:
+        outcome = {"outcome": "skipped", "message": err.msg}
+    except pytest.xfail.Exception as err:
+        outcome = {"outcome": "xfailed", "message": err.msg}
+    except MemoryError:
+        outcome = {"outcome": "oom"}
+    except BaseException:
+        try:
+            excinfo = pytest.ExceptionInfo.from_current()
+            message = str(pyfuncitem.repr_failure(excinfo))
+        except Exception:
+            message = traceback.format_exc()
+        outcome = {"outcome": "failed", "message": message}
+    benchmark = pyfuncitem.funcargs.get("benchmark")
+    if benchmark is not None:
+        outcome["extra_info"] = dict(benchmark.extra_info)
+        outcome["mode"] = benchmark._mode
+        if benchmark.stats is not None:
+            outcome["iterations"] = benchmark.stats.iterations
+            outcome["data"] = list(benchmark.stats.stats.data)
+    code = 0
+    try:
+        data = pickle.dumps(outcome)
+    except Exception:
+        data = pickle.dumps({"outcome": "failed", "message": traceback.format_exc()})
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(result_write, view) :]
+    except BaseException:
+        code = 1
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(code)
+
+
+def _read_until(fd, deadline):
+    """Read the child's outcome, giving up at the deadline"""
+    chunks = []
+    while True:
+        remaining = None if deadline is None else deadline - time.monotonic()
+        if remaining is not None and remaining <= 0:
+            return None, True
+        ready, _, _ = select.select([fd], [], [], remaining)
+        if not ready:
+            continue
+        chunk = os.read(fd, _READ_SIZE)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    if not chunks:
+        return None, False
+    try:
+        return pickle.loads(b"".join(chunks)), False
+    except Exception:
+        return None, False
+
+
+def _report(pyfuncitem, outcome, peak, baseline, timeout, limit):
+    """Turn the child's outcome into the test's"""
+    payload, status, timed_out, oom_killed = outcome
+    usage = f"peak memory {peak:.0f} MB above the {baseline:.0f} MB parent"
+    if timed_out:
+        pyfuncitem.stash[TIMED_OUT] = True
+        pytest.fail(f"Timed out after {timeout}s ({usage})", pytrace=False)
+    killed = os.WIFSIGNALED(status) and os.WTERMSIG(status) == signal.SIGKILL
+    out_of_memory = payload is not None and payload["outcome"] == "oom"
+    if oom_killed or out_of_memory or (payload is None and killed):
+        pytest.xfail(f"Exceeded the {limit or 'memory limit'} ({usage})")
+    if payload is None:
+        if os.WIFSIGNALED(status):
+            reason = f"signal {signal.Signals(os.WTERMSIG(status)).name}"
+        else:
+            reason = f"exit code {os.WEXITSTATUS(status)}"
+        pytest.fail(f"Test process died with {reason} ({usage})", pytrace=False)
+
+    benchmark = pyfuncitem.funcargs.get("benchmark")
+    if benchmark is not None and "extra_info" in payload:
+        benchmark.extra_info.update(payload["extra_info"])
+        benchmark.extra_info["isolated_peak_memory_mb"] = peak
+        benchmark._mode = payload["mode"]
+        if "data" in payload:
+            iterations = payload["iterations"]
+            stats = benchmark._make_stats(iterations)
+            for value in payload["data"]:
+                stats.update(value * iterations)
+    if payload["outcome"] == "skipped":
+        pytest.skip(payload["message"])
+    if payload["outcome"] == "xfailed":
+        pytest.xfail(payload["message"])
+    if payload["outcome"] == "failed":
+        pytest.fail(payload["message"], pytrace=False)
+
+
+def _kill_group(pid):
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _make_cgroup(memory):
+    """Create a cgroup v2 capped at `memory` MB below the current one, or
+    return None where that is not possible"""
+    try:
+        with open("/proc/self/cgroup") as fd:
+            entries = [line.strip().split(":", 2) for line in fd]
+    except OSError:
+        return None
+    paths = [path for hierarchy, _, path in entries if hierarchy == "0"]
+    if not paths:
+        return None
+    parent = _CGROUP_ROOT + paths[0].rstrip("/")
+    # Only a cgroup v2 mount has cgroup.controllers, and children of the
+    # parent can only be capped if it delegates the memory controller
+    try:
+        with open(os.path.join(parent, "cgroup.subtree_control")) as fd:
+            delegated = "memory" in fd.read().split()
+    except OSError:
+        return None
+    if not delegated or not os.path.exists(os.path.join(parent, "cgroup.controllers")):
+        return None
+    path = os.path.join(parent, f"benchpress-{os.getpid()}-{time.monotonic_ns()}")
+    try:
+        os.mkdir(path)
+    except OSError:
+        return None
+    try:
+        _write(os.path.join(path, "memory.max"), str(memory * 1024 * 1024))
+    except OSError:
+        _remove_cgroup(path)
+        return None
+    try:
+        _write(os.path.join(path, "memory.swap.max"), "0")
+    except OSError:
+        pass
+    return path
+
+
+def _remove_cgroup(path):
+    try:
+        os.rmdir(path)
+    except OSError:
+        pass
+
+
+def _oom_kills(path):
+    try:
+        with open(os.path.join(path, "memory.events")) as fd:
+            for line in fd:
+                key, value = line.split()
+                if key == "oom_kill":
+                    return int(value)
+    except OSError:
+        pass
+    return 0
+
+
+def _read_int(filename, default):
+    try:
+        with open(filename) as fd:
+            return int(fd.read())
+    except (OSError, ValueError):
+        return default
+
+
+def _status_mb(field):
+    """A memory field of this process, e.g. "VmRSS", in MB, 0 where
+    unknown"""
+    try:
+        with open("/proc/self/status") as fd:
+            for line in fd:
+                if line.startswith(f"{field}:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0.0
+
+
+def _write(filename, text):
+    # Interface files are never created, only written
+    with open(filename, "r+") as fd:
+        fd.write(text)
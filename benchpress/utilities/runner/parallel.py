@@ -0,0 +1,375 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Run benchmark tests in parallel on disjoint sets of cores
+
+    python -m benchpress.utilities.runner [options] PATHS [-- PYTEST_ARGS]
+
+Tests are collected once and handed out to workers, each owning a fixed set
+of cores.  Every test runs in a fresh pytest process pinned to its worker's
+cores, with the thread pools of the numerical libraries and SDKs sized to
+match, so concurrently running tests do not compete for cores.  Tests are
+dispatched longest predicted runtime first (see `predict`), so that long
+tests do not start last and leave the other workers idle.  The
+pytest-benchmark results of all tests are merged into a single JSON file.
+"""
+
+import argparse
+import json
+import os
+import queue
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+from benchpress.config import Configuration
+from benchpress.utilities.io.atomic import atomic_write_json
+from .placement import available_cpus, core_sets, worker_env
+from .predict import RuntimePredictor, lpt_order, predicted_makespan
+from .skiplist import load_runtimes, record_overhead
+
+WORKER_MODULE = "benchpress.utilities.runner.worker"
+
+
+def collect_tests(pytest_args, cwd=None):
+    """Collect the tests selected by pytest arguments
+
+    Parameters:
+        pytest_args (list): Paths and options as given to pytest
+        cwd (str): Directory to collect from, default the current one
+
+    Returns:
+        list: Dict with the `nodeid`, `gym` and runtime features of every
+              selected test
+
+    Raises:
+        RuntimeError: Collection failed
+    """
+    cwd = os.getcwd() if cwd is None else cwd
+    filename = os.path.join(
+        Configuration.get_cache_dir("runs"), f"collect-{os.getpid()}.json"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-m", WORKER_MODULE, "--collect", filename]
+        + _common_args(cwd)
+        + list(pytest_args),
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    try:
+        with open(filename) as fd:
+            return json.load(fd)
+    except FileNotFoundError:
+        raise RuntimeError(f"Test collection failed:\n{proc.stdout}") from None
+    finally:
+        if os.path.exists(filename):
+            os.remove(filename)
+
+
+def predict_runtimes(tests):
+    """Predict the runtime of tests
+
+    Predictions are made from the runtimes recorded for the gym of each
+    test with the installed SDK versions.
+
+    Parameters:
+        tests (list): Dicts with the `nodeid`, `gym` and features of each
+                      test, as returned by `collect_tests`
+
+    Returns:
+        list: Copies of the tests with their `predicted` runtime, None for
+              tests nothing is known about
+    """
+    predictors = {}
+    for gym_name in {test.get("gym") for test in tests}:
+        if gym_name is None:
+            continue
+        predictors[gym_name] = RuntimePredictor.from_history(gym_name)
+        predictors[gym_name].fit(
+            [test for test in tests if test.get("gym") == gym_name]
+        )
+    tests = [dict(test) for test in tests]
+    for test in tests:
+        predictor = predictors.get(test.get("gym"))
+        test["predicted"] = None if predictor is None else predictor.predict(test)
+    return tests
+
+
+def update_overhead(records):
+    """Record the per-process overhead of each gym from a parallel run
+
+    The overhead of a test is its wall clock time minus the call duration
+    its process recorded.
+
+    Parameters:
+        records (list): Run records with the `nodeid` and `gym` of each test
+    """
+    by_gym = {}
+    for record in records:
+        if record.get("gym") is not None and record["returncode"] == 0:
+            by_gym.setdefault(record["gym"], []).append(record)
+    for gym_name, gym_records in by_gym.items():
+        history = load_runtimes(gym_name)
+        overheads = [
+            record["duration"] - history[record["nodeid"]]["duration"]
+            for record in gym_records
+            if record["nodeid"] in history
+        ]
+        if overheads:
+            record_overhead(gym_name, max(statistics.median(overheads), 0.0))
+
+
+def run_parallel(
+    tests,
+    workers,
+    pytest_args=(),
+    run_dir=None,
+    cwd=None,
+    log=print,
+):
+    """Run tests on pinned workers
+
+    Workers take the next test as soon as they are free, in the order
+    given.
+
+    Parameters:
+        tests (list): Dicts with the `nodeid` of each test, and optionally
+                      its `gym` and `predicted` runtime
+        workers (list): CPU ids of each worker
+        pytest_args (list): Extra pytest options for every test
+        run_dir (str): Directory for per-test logs and results, default a
+                       new directory under the `runs` cache
+        cwd (str): Directory to run from, default the current one
+        log (callable): Progress output
+
+    Returns:
+        dict: Merged pytest-benchmark JSON with a `parallel_info` section
+    """
+    cwd = os.getcwd() if cwd is None else cwd
+    if run_dir is None:
+        run_dir = Configuration.get_cache_dir(
+            os.path.join("runs", time.strftime("%Y%m%d_%H%M%S"))
+        )
+    os.makedirs(run_dir, exist_ok=True)
+
+    pending = queue.Queue()
+    for index, test in enumerate(tests):
+        pending.put((index, test))
+    records = [None] * len(tests)
+    lock = threading.Lock()
+    done = [0]
+
+    def work(worker, cpus):
+        env = worker_env(worker, cpus)
+        while True:
+            try:
+                index, test = pending.get_nowait()
+            except queue.Empty:
+                return
+            record = _run_test(
+                index, test, worker, cpus, env, pytest_args, run_dir, cwd
+            )
+            with lock:
+                records[index] = record
+                done[0] += 1
+                predicted = ""
+                if record["predicted"] is not None:
+                    predicted = f", predicted {record['predicted']:.1f}s"
+                log(
+                    f"[{done[0]}/{len(tests)}] {_status(record['returncode'])} "
+                    f"{test['nodeid']} ({record['duration']:.1f}s{predicted}, "
+                    f"worker {worker}, cpus {_cpu_list(cpus)})"
+                )
+
+    start = time.perf_counter()
+    threads = [
+        threading.Thread(target=work, args=(worker, cpus), daemon=True)
+        for worker, cpus in enumerate(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    makespan = time.perf_counter() - start
+
+    output = merge_results(records)
+    output["total_duration"] = makespan
+    output["parallel_info"] = {
+        "workers": [list(cpus) for cpus in workers],
+        "run_dir": run_dir,
+        "makespan": makespan,
+        "tests": [
+            {key: value for key, value in record.items() if key != "result"}
+            for record in records
+        ],
+    }
+    return output
+
+
+def merge_results(records):
+    """Merge the pytest-benchmark JSON of single-test runs
+
+    Parameters:
+        records (list): Run records with the loaded JSON under `result`
+
+    Returns:
+        dict: One pytest-benchmark JSON document
+    """
+    output = {}
+    benchmarks = []
+    counts = {}
+    dumps = {}
+    for record in records:
+        result = record.get("result")
+        if not result:
+            continue
+        if not output:
+            output = dict(result)
+        benchmarks.extend(result.get("benchmarks", []))
+        for status, count in result.get("test_status_counts", {}).items():
+            counts[status] = counts.get(status, 0) + count
+        for status, tests in result.get("test_dumps", {}).items():
+            dumps.setdefault(status, {}).update(tests)
+    output["benchmarks"] = benchmarks
+    output["test_status_counts"] = counts
+    output["test_dumps"] = dumps
+    return output
+
+
+def _run_test(index, test, worker, cpus, env, pytest_args, run_dir, cwd):
+    """Run one test in its own pinned pytest process"""
+    stem = os.path.join(run_dir, f"{index:05d}")
+    json_file = stem + ".json"
+    start = time.perf_counter()
+    with open(stem + ".log", "w") as log_file:
+        proc = subprocess.run(
+            [sys.executable, "-m", WORKER_MODULE, test["nodeid"]]
+            + _common_args(cwd)
+            + [f"--benchmark-json={json_file}"]
+            + list(pytest_args),
+            cwd=cwd,
+            env=env,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+        )
+    record = {
+        "nodeid": test["nodeid"],
+        "gym": test.get("gym"),
+        "worker": worker,
+        "cpus": list(cpus),
+        "returncode": proc.returncode,
+        "duration": time.perf_counter() - start,
+        "predicted": test.get("predicted"),
+        "log": stem + ".log",
+    }
+    if os.path.exists(json_file):
+        with open(json_file) as fd:
+            record["result"] = json.load(fd)
+    return record
+
+
+def _common_args(cwd):
+    # Node ids are relative to the directory they were collected from, and
+    # concurrent processes must not race on the pytest cache
+    return [f"--rootdir={cwd}", "-p", "no:cacheprovider"]
+
+
+def _status(returncode):
+    return {0: "OK", 1: "FAILED", 5: "NOTRUN"}.get(returncode, f"EXIT {returncode}")
+
+
+def _cpu_list(cpus):
+    return ",".join(str(cpu) for cpu in cpus)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run benchpress tests in parallel on pinned cores",
+        usage="%(prog)s [options] PATHS [-- PYTEST_ARGS]",
+    )
+    parser.add_argument(
+        "-n", "--workers", type=int, help="Number of workers, default all that fit"
+    )
+    parser.add_argument(
+        "--cores-per-worker", type=int, default=1, help="Cores given to each worker"
+    )
+    parser.add_argument(
+        "--smt",
+        action="store_true",
+        help="Use every hardware thread rather than one per physical core",
+    )
+    parser.add_argument(
+        "--order",
+        choices=["longest", "collected"],
+        default="longest",
+        help="Dispatch longest predicted runtime first (default) or in "
+        "collection order",
+    )
+    parser.add_argument(
+        "--benchmark-json",
+        help="Merged results file, default .benchmarks/parallel_<time>.json",
+    )
+    parser.add_argument("paths", nargs="*", help="Test paths, as for pytest")
+    argv = list(sys.argv[1:] if argv is None else argv)
+    extra = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, extra = argv[:split], argv[split + 1 :]
+    args = parser.parse_args(argv)
+
+    try:
+        workers = core_sets(
+            args.workers, args.cores_per_worker, available_cpus(smt=args.smt)
+        )
+    except ValueError as err:
+        parser.error(str(err))
+    tests = collect_tests(args.paths + extra)
+    tests = predict_runtimes(tests)
+    if args.order == "longest":
+        tests = lpt_order(tests)
+    durations = [test["predicted"] for test in tests]
+    predicted = None
+    if durations and None not in durations:
+        predicted = predicted_makespan(durations, len(workers))
+    print(
+        f"Running {len(tests)} tests on {len(workers)} workers"
+        + ("" if predicted is None else f", predicted makespan {predicted:.1f}s")
+    )
+    output = run_parallel(tests, workers, pytest_args=extra)
+    output["parallel_info"]["predicted_makespan"] = predicted
+    update_overhead(output["parallel_info"]["tests"])
+
+    filename = args.benchmark_json
+    if filename is None:
+        filename = os.path.join(
+            ".benchmarks", time.strftime("parallel_%Y%m%d_%H%M%S.json")
+        )
+    os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+    atomic_write_json(output, filename)
+    makespan = f"Makespan {output['parallel_info']['makespan']:.1f}s"
+    if predicted is not None:
+        makespan += f" (predicted {predicted:.1f}s)"
+    print(
+        f"{makespan}, results in {filename}, logs in "
+        f"{output['parallel_info']['run_dir']}"
+    )
+    failed = any(
+        test["returncode"] not in (0, 5) for test in output["parallel_info"]["tests"]
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Placement of benchmark workers on disjoint sets of cores"""
+
+import os
+
+# Set in the environment of every worker process by the parallel runner
+WORKER_ENV = "BENCHPRESS_WORKER"
+CPUS_ENV = "BENCHPRESS_CPUS"
+
+# Thread pool sizes read by the numerical libraries and SDKs at import time
+THREAD_LIMIT_VARS = [
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "RAYON_NUM_THREADS",
+    "QISKIT_NUM_PROCS",
+]
+
+_SYSFS_CPU = "/sys/devices/system/cpu/cpu{}/topology/"
+
+
+def available_cpus(smt=False):
+    """Return the logical CPUs this process may run on
+
+    Parameters:
+        smt (bool): Keep every hardware thread; otherwise only the first
+                    thread of each physical core is kept so that workers
+                    never share a core
+
+    Returns:
+        list: Sorted CPU ids
+    """
+    cpus = sorted(os.sched_getaffinity(0))
+    if smt:
+        return cpus
+    seen = set()
+    out = []
+    for cpu in cpus:
+        core = _physical_core(cpu)
+        if core is None:
+            out.append(cpu)
+        elif core not in seen:
+            seen.add(core)
+            out.append(cpu)
+    return out
+
+
+def core_sets(num_workers=None, cores_per_worker=1, cpus=None):
+    """Split CPUs into disjoint sets, one per worker
+
+    Parameters:
+        num_workers (int): Number of workers, default as many as fit
+        cores_per_worker (int): CPUs given to each worker
+        cpus (list): CPUs to split, default `available_cpus()`
+
+    Returns:
+        list: A sorted list of CPU ids per worker
+
+    Raises:
+        ValueError: There are too few CPUs for the request
+    """
+    if cpus is None:
+        cpus = available_cpus()
+    if cores_per_worker < 1:
+        raise ValueError("cores_per_worker must be at least 1")
+    fit = len(cpus) // cores_per_worker
+    if num_workers is None:
+        num_workers = fit
+    if num_workers < 1 or num_workers > fit:
+        raise ValueError(
+            f"{num_workers} workers of {cores_per_worker} cores do not fit on "
+            f"{len(cpus)} CPUs"
+        )
+    # Consecutive ids keep a worker's cores close together (same socket and
+    # cache domain on the usual numbering)
+    return [
+        cpus[idx * cores_per_worker : (idx + 1) * cores_per_worker]
+        for idx in range(num_workers)
+    ]
+
+
+def worker_env(worker, cpus, env=None):
+    """Return the environment of a worker process
+
+    Thread pools are sized to the worker's CPUs so that an SDK cannot
+    spill onto the cores of other workers.
+
+    Parameters:
+        worker (int): Worker index
+        cpus (list): CPUs of the worker
+        env (dict): Base environment, default `os.environ`
+
+    Returns:
+        dict: The environment
+    """
+    env = dict(os.environ if env is None else env)
+    for var in THREAD_LIMIT_VARS:
+        env[var] = str(len(cpus))
+    env[WORKER_ENV] = str(worker)
+    env[CPUS_ENV] = ",".join(str(cpu) for cpu in cpus)
+    return env
+
+
+def pin_from_env():
+    """Pin the current process to the CPUs given by the parallel runner
+
+    Returns:
+        list: The CPUs pinned to, or None outside the parallel runner
+    """
+    value = os.environ.get(CPUS_ENV)
+    if not value:
+        return None
+    cpus = [int(cpu) for cpu in value.split(",")]
+    os.sched_setaffinity(0, cpus)
+    return cpus
+
+
+def _physical_core(cpu):
+    """(package, core) of a logical CPU, or None if unknown"""
+    path = _SYSFS_CPU.format(cpu)
+    try:
+        with open(path + "physical_package_id") as fd:
+            package = int(fd.read())
+        with open(path + "core_id") as fd:
+            core = int(fd.read())
+    except (OSError, ValueError):
+        return None
+    return package, core
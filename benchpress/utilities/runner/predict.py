@@ -0,0 +1,181 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Predict test runtimes from earlier runs and order tests longest first
+
+Tests that have run before with the installed SDK versions are predicted
+to take as long as they did.  Other tests are predicted by a ridge
+regression of the log runtime on the circuit features (qubits, operations,
+2Q gates, depth), the topology and the test function, fitted to the tests
+with a recorded runtime.
+"""
+
+import heapq
+import math
+import statistics
+
+import numpy as np
+import pytest
+
+from .skiplist import load_overhead, load_runtimes
+
+# Set by the root conftest on tests whose input circuit statistics are known
+CIRCUIT_METADATA = pytest.StashKey[dict]()
+
+FEATURES = ("num_qubits", "size", "gate_count_2q", "depth")
+
+
+def runtime_features(item):
+    """Features of a collected test used to predict its runtime
+
+    Parameters:
+        item (Item): Collected test
+
+    Returns:
+        dict: The test `function` (node id without parameters), the circuit
+              `FEATURES` that are known and the abstract `topology`, if any
+    """
+    features = {"function": item.nodeid.split("[")[0]}
+    metadata = item.stash.get(CIRCUIT_METADATA, None) or {}
+    for key in FEATURES:
+        if key in metadata:
+            features[key] = metadata[key]
+    callspec = getattr(item, "callspec", None)
+    if callspec is not None and "circ_and_topo" in callspec.params:
+        topology = callspec.params["circ_and_topo"][1]
+        if isinstance(topology, str):
+            features["topology"] = topology
+    return features
+
+
+class RuntimePredictor:
+    """Predict the runtime of tests from the runtimes of earlier runs
+
+    Parameters:
+        history (dict): `duration` and `timed_out` by node id, as returned
+                        by `load_runtimes`
+        overhead (float): Seconds to start the process of a test, added to
+                          every prediction
+        ridge (float): Regularization of the regression
+    """
+
+    def __init__(self, history, overhead=0.0, ridge=1e-2):
+        self.history = history
+        self.overhead = overhead
+        self.ridge = ridge
+        self._columns = None
+        self._weights = None
+        self._median = (
+            statistics.median(entry["duration"] for entry in history.values())
+            if history
+            else None
+        )
+
+    @classmethod
+    def from_history(cls, gym_name):
+        """Predictor from the recorded runtimes of a gym's installed SDK"""
+        return cls(load_runtimes(gym_name), load_overhead(gym_name) or 0.0)
+
+    def fit(self, tests):
+        """Fit the regression to the given tests with a recorded runtime
+
+        Parameters:
+            tests (list): Dicts with the `nodeid` and features of each test
+        """
+        known = [
+            test
+            for test in tests
+            if test["nodeid"] in self.history
+            and not self.history[test["nodeid"]].get("timed_out")
+        ]
+        self._columns = _columns(known)
+        if len(known) < 2:
+            self._weights = None
+            return
+        x = np.array([_row(test, self._columns) for test in known])
+        y = np.log(
+            [max(self.history[test["nodeid"]]["duration"], 1e-6) for test in known]
+        )
+        gram = x.T @ x + self.ridge * np.eye(x.shape[1])
+        self._weights = np.linalg.solve(gram, x.T @ y)
+
+    def predict(self, test):
+        """Predicted runtime of a test in seconds, None if nothing is known
+
+        Parameters:
+            test (dict): The `nodeid` and features of the test
+        """
+        entry = self.history.get(test["nodeid"])
+        if entry is not None:
+            # A test that timed out is predicted to time out again
+            duration = entry["duration"]
+        elif self._weights is not None:
+            duration = math.exp(_row(test, self._columns) @ self._weights)
+        elif self._median is not None:
+            duration = self._median
+        else:
+            return None
+        return duration + self.overhead
+
+
+def lpt_order(tests):
+    """Order tests longest predicted runtime first
+
+    Tests without a prediction go first, as any of them may be long,
+    largest circuit first.
+
+    Parameters:
+        tests (list): Dicts with the `nodeid`, features and `predicted`
+                      runtime of each test
+
+    Returns:
+        list: The tests in dispatch order
+    """
+
+    def key(test):
+        predicted = test.get("predicted")
+        if predicted is None:
+            return (0, -test.get("size", 0), -test.get("num_qubits", 0))
+        return (1, -predicted, 0)
+
+    return sorted(tests, key=key)
+
+
+def predicted_makespan(durations, num_workers):
+    """Makespan of list scheduling durations, in order, on identical workers
+
+    Parameters:
+        durations (list): Predicted runtimes in dispatch order
+        num_workers (int): Number of workers
+
+    Returns:
+        float: Time at which the last test finishes
+    """
+    finish = [0.0] * max(num_workers, 1)
+    for duration in durations:
+        heapq.heapreplace(finish, finish[0] + duration)
+    return max(finish)
+
+
+def _columns(tests):
+    """Categorical values seen in the training tests"""
+    return {
+        "topology": sorted({test["topology"] for test in tests if "topology" in test}),
+        "function": sorted({test["function"] for test in tests if "function" in test}),
+    }
+
+
+def _row(test, columns):
+    row = [1.0]
+    row.extend(math.log1p(test.get(key, 0)) for key in FEATURES)
+    for key, values in columns.items():
+        row.extend(1.0 if test.get(key) == value else 0.0 for value in values)
+    return np.array(row)
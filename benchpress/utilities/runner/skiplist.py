@@ -0,0 +1,334 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Timeout skip list built from the runtimes of earlier sessions
+
+The call duration of every test is recorded in the `runtimes` cache, keyed
+by SDK and invalidated whenever the installed versions of that SDK change.
+With `--timeout-skip-list=<SECs>` tests are run under that timeout (see
+`isolation`), tests known to take longer are skipped without being run,
+and `skipfile.txt` is rewritten with them.  Without the option, the tests
+listed in an existing `skipfile.txt` for the installed SDK versions are
+skipped.
+
+`skipfile.txt` has one section per SDK, headed by its package versions:
+
+    [qiskit qiskit==1.3.0 qiskit-ibm-runtime==0.33.2]
+    qiskit_gym/abstract_transpile/test_qasmbench.py::...[adder_n433-heavy-hex]
+"""
+
+import contextlib
+import fcntl
+import json
+import os
+
+import pytest
+
+from benchpress.config import Configuration
+from benchpress.utilities.io.atomic import atomic_write, atomic_write_json
+from benchpress.utilities.io.versions import package_version
+from .isolation import TIMED_OUT
+
+SKIPFILE = "skipfile.txt"
+
+# Distributions whose versions determine the runtimes of each gym
+SDK_PACKAGES = {
+    "qiskit": ["qiskit"],
+    "qiskit-ibm-transpiler": ["qiskit-ibm-transpiler", "qiskit"],
+    "tket": ["pytket", "pytket-qiskit"],
+    "bqskit": ["bqskit"],
+    "cirq": ["cirq-core"],
+    "braket": ["amazon-braket-sdk"],
+    "staq": ["pystaq"],
+    "qpanda": ["pyqpanda3"],
+}
+
+
+# Gym packages not named after their gym
+GYM_DIRECTORIES = {"qiskit_transpiler_service_gym": "qiskit-ibm-transpiler"}
+
+
+def gym_name_from_path(path):
+    """Name of the gym a test file belongs to
+
+    `Configuration.gym_name` is set by the first gym imported, so sessions
+    collecting several gyms must take the gym of each test from its path.
+
+    Parameters:
+        path (str or Path): Path of a test file
+
+    Returns:
+        str: Name of the gym, or None outside of the gyms
+    """
+    for part in reversed(os.path.normpath(str(path)).split(os.sep)):
+        if part.endswith("_gym"):
+            return GYM_DIRECTORIES.get(part, part[: -len("_gym")])
+    return None
+
+
+def sdk_versions(gym_name):
+    """Installed versions of the packages benchmarked by a gym
+
+    Parameters:
+        gym_name (str): Name of the gym
+
+    Returns:
+        dict: Version of each package, None for packages not installed
+    """
+    return {
+        package: package_version(package, default=None)
+        for package in SDK_PACKAGES.get(gym_name, [])
+    }
+
+
+def exceeds_timeout(entry, timeout):
+    """Return whether a recorded test is known to run past a timeout
+
+    A test that timed out is only known to take at least as long as the
+    timeout it was run with.
+    """
+    if entry.get("timed_out"):
+        return entry["duration"] >= timeout
+    return entry["duration"] > timeout
+
+
+def load_runtimes(gym_name, versions=None):
+    """Recorded call durations of a gym's tests
+
+    Parameters:
+        gym_name (str): Name of the gym
+        versions (dict): Package versions the records must match, default
+                         the installed ones
+
+    Returns:
+        dict: `duration` and `timed_out` of each test by node id, empty if
+              the records are for other versions
+    """
+    versions = sdk_versions(gym_name) if versions is None else versions
+    record = _read_json(_runtimes_file()).get(gym_name, {})
+    if record.get("versions") != versions:
+        return {}
+    return record.get("tests", {})
+
+
+def record_runtimes(gym_name, tests, versions=None):
+    """Merge call durations into the records of a gym
+
+    Records for other versions of the SDK are dropped.  Concurrent sessions
+    (e.g. of the parallel runner) are serialized with a lock file.
+
+    Parameters:
+        gym_name (str): Name of the gym
+        tests (dict): `duration` and `timed_out` of each test by node id
+        versions (dict): Package versions of the records, default the
+                         installed ones
+
+    Returns:
+        dict: All records of the gym after the merge
+    """
+    versions = sdk_versions(gym_name) if versions is None else versions
+    filename = _runtimes_file()
+    with _locked():
+        data = _read_json(filename)
+        record = data.get(gym_name, {})
+        if record.get("versions") != versions:
+            record = {"versions": versions, "tests": {}}
+        record["tests"].update(tests)
+        data[gym_name] = record
+        atomic_write_json(data, filename)
+    return record["tests"]
+
+
+def load_overhead(gym_name, versions=None):
+    """Recorded seconds to start the process of a single test, or None"""
+    versions = sdk_versions(gym_name) if versions is None else versions
+    record = _read_json(_runtimes_file()).get(gym_name, {})
+    if record.get("versions") != versions:
+        return None
+    return record.get("overhead")
+
+
+def record_overhead(gym_name, overhead, versions=None):
+    """Record the seconds to start the process of a single test
+
+    Parameters:
+        gym_name (str): Name of the gym
+        overhead (float): Wall clock minus call duration of a test process
+        versions (dict): Package versions of the records, default the
+                         installed ones
+    """
+    versions = sdk_versions(gym_name) if versions is None else versions
+    filename = _runtimes_file()
+    with _locked():
+        data = _read_json(filename)
+        record = data.get(gym_name, {})
+        if record.get("versions") != versions:
+            record = {"versions": versions, "tests": {}}
+        record["overhead"] = overhead
+        data[gym_name] = record
+        atomic_write_json(data, filename)
+
+
+def read_skipfile(filename):
+    """Read the sections of a skip list file
+
+    Returns:
+        dict: `(versions, node ids)` by SDK; node ids listed before any
+              section header are under None, with versions None
+    """
+    sections = {None: (None, [])}
+    current = sections[None][1]
+    try:
+        with open(filename) as fd:
+            lines = [line.strip() for line in fd]
+    except FileNotFoundError:
+        return {}
+    for line in lines:
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("[") and line.endswith("]"):
+            sdk, *packages = line[1:-1].split()
+            versions = {}
+            for package in packages:
+                name, _, version = package.partition("==")
+                versions[name] = version or None
+            current = []
+            sections[sdk] = (versions, current)
+        else:
+            current.append(line)
+    return sections
+
+
+def write_skipfile(filename, sections):
+    """Write skip list sections as read by `read_skipfile`"""
+    lines = ["# Tests skipped for exceeding the timeout, by SDK version"]
+    for sdk, (versions, nodeids) in sections.items():
+        if sdk is None:
+            lines[1:1] = nodeids
+            continue
+        packages = " ".join(
+            f"{name}=={version or ''}" for name, version in versions.items()
+        )
+        lines.append(f"[{sdk} {packages}]".replace(" ]", "]"))
+        lines.extend(sorted(nodeids))
+
+    def _writer(tmp_name):
+        with open(tmp_name, "w") as fd:
+            fd.write("\n".join(lines) + "\n")
+
+    atomic_write(filename, _writer)
+
+
+class TimeoutSkipList:
+    """Pytest plugin skipping tests that are known to time out
+
+    Parameters:
+        timeout (float): Timeout in seconds, or None to only apply the
+                         skip list file
+        skipfile (str): Path of the skip list file
+    """
+
+    def __init__(self, timeout, skipfile):
+        self.timeout = timeout
+        self.skipfile = skipfile
+        self.gyms = {}
+        self.versions = {}
+        self.results = {}
+        self.timed_out = set()
+
+    def pytest_collection_modifyitems(self, config, items):
+        sections = read_skipfile(self.skipfile) if self.timeout is None else {}
+        legacy = set(sections.get(None, (None, []))[1])
+        runtimes = {}
+        for item in items:
+            gym_name = gym_name_from_path(item.path)
+            if gym_name is None:
+                continue
+            self.gyms[item.nodeid] = gym_name
+            if gym_name not in self.versions:
+                self.versions[gym_name] = sdk_versions(gym_name)
+                runtimes[gym_name] = load_runtimes(gym_name, self.versions[gym_name])
+            if self.timeout is not None:
+                entry = runtimes[gym_name].get(item.nodeid)
+                if entry is not None and exceeds_timeout(entry, self.timeout):
+                    reason = self._reason(entry, self.versions[gym_name])
+                    item.add_marker(pytest.mark.skip(reason=reason))
+                continue
+            versions, nodeids = sections.get(gym_name, (None, []))
+            if item.nodeid in legacy or (
+                versions == self.versions[gym_name] and item.nodeid in nodeids
+            ):
+                item.add_marker(
+                    pytest.mark.skip(reason=f"Listed in {SKIPFILE} as timing out")
+                )
+
+    def pytest_runtest_makereport(self, item, call):
+        if call.when == "call" and item.stash.get(TIMED_OUT, False):
+            self.timed_out.add(item.nodeid)
+
+    def pytest_runtest_logreport(self, report):
+        gym_name = self.gyms.get(report.nodeid)
+        if gym_name is None or report.when != "call":
+            return
+        timed_out = report.nodeid in self.timed_out
+        # A test killed at the deadline is only known to take the timeout
+        self.results.setdefault(gym_name, {})[report.nodeid] = {
+            "duration": self.timeout if timed_out else report.duration,
+            "timed_out": timed_out,
+        }
+
+    def pytest_sessionfinish(self, session):
+        for gym_name, results in self.results.items():
+            versions = self.versions[gym_name]
+            runtimes = record_runtimes(gym_name, results, versions)
+            if self.timeout is None:
+                continue
+            with _locked():
+                sections = read_skipfile(self.skipfile)
+                sections[gym_name] = (
+                    versions,
+                    [
+                        nodeid
+                        for nodeid, entry in runtimes.items()
+                        if exceeds_timeout(entry, self.timeout)
+                    ],
+                )
+                write_skipfile(self.skipfile, sections)
+
+    def _reason(self, entry, versions):
+        packages = ", ".join(
+            f"{name} {version or 'not installed'}" for name, version in versions.items()
+        )
+        if entry.get("timed_out"):
+            took = f"timed out after {entry['duration']:.0f}s"
+        else:
+            took = f"took {entry['duration']:.0f}s"
+        return f"Exceeds the {self.timeout:g}s timeout ({took} with {packages})"
+
+
+def _runtimes_file():
+    return Configuration.get_cache_dir("runtimes") + "runtimes.json"
+
+
+@contextlib.contextmanager
+def _locked():
+    """Serialize updates of the runtime records and skip list files"""
+    with open(_runtimes_file() + ".lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        yield
+
+
+def _read_json(filename):
+    try:
+        with open(filename) as fd:
+            return json.load(fd)
+    except (FileNotFoundError, ValueError):
+        return {}
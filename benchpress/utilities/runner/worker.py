@@ -0,0 +1,64 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Entry point of the processes started by the parallel runner
+
+    python -m benchpress.utilities.runner.worker [--collect FILE] PYTEST_ARGS
+
+The process pins itself to the CPUs named in its environment before pytest
+(and with it any SDK) is imported, then runs pytest.  With `--collect` the
+selected tests and their runtime features are written to FILE as JSON
+instead of being run.
+"""
+
+import json
+import sys
+
+from benchpress.utilities.runner.placement import pin_from_env
+
+
+class _CollectPlugin:
+    """Write the node ids, gym and runtime features of the selected tests to
+    a file"""
+
+    def __init__(self, filename):
+        self.filename = filename
+
+    def pytest_collection_finish(self, session):
+        from benchpress.utilities.runner.predict import runtime_features
+        from benchpress.utilities.runner.skiplist import gym_name_from_path
+
+        tests = [
+            {
+                "nodeid": item.nodeid,
+                "gym": gym_name_from_path(item.path),
+                **runtime_features(item),
+            }
+            for item in session.items
+        ]
+        with open(self.filename, "w") as fd:
+            json.dump(tests, fd)
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    pin_from_env()
+    import pytest
+
+    plugins = []
+    if argv[:1] == ["--collect"]:
+        plugins.append(_CollectPlugin(argv[1]))
+        argv = ["--collect-only", "-q"] + argv[2:]
+    return pytest.main(argv, plugins=plugins)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
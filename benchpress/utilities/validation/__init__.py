@@ -1,3 +1,14 @@
 """Circuit validation"""
 
 from .validation import circuit_validator
+from .topology import AdjacencyBitmap, get_adjacency, validate_circuit_arrays
+from .equivalence import (
+    EquivalenceResult,
+    check_clifford_equivalence,
+    check_equivalence,
+    circuit_equivalence,
+    clifford_circuit,
+    validate_equivalence,
+)
+from .clifford import CliffordTableau
+from .mps import MatrixProductState
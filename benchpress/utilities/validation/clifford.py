@@ -0,0 +1,309 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Bit-packed stabilizer tableau simulation of Clifford circuits"""
+
+import numpy as np
+
+_PAULIS = np.array(
+    [
+        [[1, 0], [0, 1]],
+        [[0, 1], [1, 0]],
+        [[1, 0], [0, -1]],
+        [[0, -1j], [1j, 0]],
+    ],
+    dtype=complex,
+)
+
+# Conjugation tables of one- and two-qubit unitaries keyed on their bytes
+_TABLES = {}
+
+
+class CliffordTableau:
+    """Images of the Pauli generators under a Clifford circuit
+
+    Row q holds U X_q U^dagger and row n + q holds U Z_q U^dagger as x and z
+    bits per qubit and a sign bit, with x = z = 1 standing for Y.  The bits
+    are packed along the rows, 64 to a word, so that a gate only touches the
+    columns of the qubits it acts on: O(n / 64) word operations per gate.
+    """
+
+    def __init__(self, num_qubits):
+        """Create the tableau of the identity
+
+        Parameters:
+            num_qubits (int): Number of qubits
+        """
+        self.num_qubits = num_qubits
+        self._rows = 2 * num_qubits
+        qubits = np.arange(num_qubits)
+        x_bits = np.zeros((num_qubits, self._rows), dtype=bool)
+        z_bits = np.zeros((num_qubits, self._rows), dtype=bool)
+        x_bits[qubits, qubits] = True
+        z_bits[qubits, num_qubits + qubits] = True
+        self._x = _pack(x_bits)
+        self._z = _pack(z_bits)
+        self._r = np.zeros(self._x.shape[1], dtype=np.uint64)
+
+    def apply(self, matrix, qubits):
+        """Apply a one- or two-qubit Clifford gate
+
+        Parameters:
+            matrix (ndarray): Unitary in Qiskit's little-endian order
+            qubits (list): Qubits acted on
+
+        Raises:
+            ValueError: The gate is not a Clifford
+        """
+        images, signs, kernel = clifford_table(matrix)
+        if kernel is not None:
+            kernel(self, *qubits)
+        else:
+            self._apply_table(images, signs, qubits)
+
+    def rows(self):
+        """Return the unpacked tableau
+
+        Returns:
+            tuple: (2n, n) x bits, (2n, n) z bits and (2n,) sign bits
+        """
+        return (
+            _unpack(self._x, self._rows).T,
+            _unpack(self._z, self._rows).T,
+            _unpack(self._r[None, :], self._rows)[0],
+        )
+
+    def implements_permutation(self, initial_layout, final_layout):
+        """Return whether the tableau moves qubits without acting on them
+
+        Every qubit `initial_layout[i]` must be carried to `final_layout[i]`
+        unchanged.  Qubits outside `initial_layout` are taken to start in
+        |0>, so they only need to end in |0> on the qubits outside
+        `final_layout`: logical images may pick up Z's there.
+
+        Parameters:
+            initial_layout (list): Qubit each input qubit starts on
+            final_layout (list): Qubit each input qubit ends on
+
+        Returns:
+            bool: True if the tableau is such a permutation
+        """
+        num_qubits = self.num_qubits
+        x_rows, z_rows, signs = self.rows()
+        start_ancillas = np.ones(num_qubits, dtype=bool)
+        start_ancillas[initial_layout] = False
+        end_ancillas = np.ones(num_qubits, dtype=bool)
+        end_ancillas[final_layout] = False
+        initial_layout = np.asarray(initial_layout, dtype=np.int64)
+        final_layout = np.asarray(final_layout, dtype=np.int64)
+        logical = np.arange(initial_layout.shape[0])
+
+        x_images = x_rows[initial_layout]
+        z_images = z_rows[num_qubits + initial_layout]
+        ancillas = num_qubits + np.flatnonzero(start_ancillas)
+        checked = np.concatenate(
+            [initial_layout, num_qubits + initial_layout, ancillas]
+        )
+        if signs[checked].any():
+            return False
+
+        expected_x = np.zeros_like(x_images)
+        expected_x[logical, final_layout] = True
+        expected_z = np.zeros_like(z_images)
+        expected_z[logical, final_layout] = True
+        # Z's on qubits that end in |0> are stabilizers and can be ignored
+        free = end_ancillas[None, :]
+        return bool(
+            np.array_equal(x_images, expected_x)
+            and not (z_rows[initial_layout] & ~free).any()
+            and not x_rows[num_qubits + initial_layout].any()
+            and np.array_equal(z_images & ~free, expected_z)
+            and not x_rows[ancillas].any()
+            and not (z_rows[ancillas] & ~free).any()
+        )
+
+    def _h(self, qubit):
+        x, z = self._x[qubit], self._z[qubit]
+        self._r ^= x & z
+        self._x[qubit], self._z[qubit] = z.copy(), x.copy()
+
+    def _s(self, qubit):
+        x = self._x[qubit]
+        self._r ^= x & self._z[qubit]
+        self._z[qubit] ^= x
+
+    def _sdg(self, qubit):
+        x = self._x[qubit]
+        self._r ^= x & ~self._z[qubit]
+        self._z[qubit] ^= x
+
+    def _pauli_x(self, qubit):
+        self._r ^= self._z[qubit]
+
+    def _pauli_y(self, qubit):
+        self._r ^= self._x[qubit] ^ self._z[qubit]
+
+    def _pauli_z(self, qubit):
+        self._r ^= self._x[qubit]
+
+    def _cx(self, control, target):
+        x_c, z_c = self._x[control], self._z[control]
+        x_t, z_t = self._x[target], self._z[target]
+        self._r ^= x_c & z_t & ~(x_t ^ z_c)
+        x_t ^= x_c
+        z_c ^= z_t
+
+    def _cz(self, qubit0, qubit1):
+        x_0, z_0 = self._x[qubit0], self._z[qubit0]
+        x_1, z_1 = self._x[qubit1], self._z[qubit1]
+        self._r ^= x_0 & x_1 & (z_0 ^ z_1)
+        z_0 ^= x_1
+        z_1 ^= x_0
+
+    def _swap(self, qubit0, qubit1):
+        self._x[[qubit0, qubit1]] = self._x[[qubit1, qubit0]]
+        self._z[[qubit0, qubit1]] = self._z[[qubit1, qubit0]]
+
+    def _identity(self, *qubits):
+        pass
+
+    def _apply_table(self, images, signs, qubits):
+        """Apply a gate by its conjugation table
+
+        Each row is split by the Pauli it has on the gate's qubits; that
+        Pauli is replaced with its image and the sign flipped where the
+        image is negative.
+        """
+        width = len(qubits)
+        x_cols = [self._x[qubit] for qubit in qubits]
+        z_cols = [self._z[qubit] for qubit in qubits]
+        new_x = [np.zeros_like(self._r) for _ in qubits]
+        new_z = [np.zeros_like(self._r) for _ in qubits]
+        flip = np.zeros_like(self._r)
+        # Pattern 0 (identity) maps to itself and is the only pattern set in
+        # the padding bits, so it is skipped
+        for pattern in range(1, 4**width):
+            mask = None
+            for idx in range(width):
+                x = x_cols[idx] if pattern >> idx & 1 else ~x_cols[idx]
+                z = z_cols[idx] if pattern >> (width + idx) & 1 else ~z_cols[idx]
+                mask = x & z if mask is None else mask & x & z
+            image = int(images[pattern])
+            for idx in range(width):
+                if image >> idx & 1:
+                    new_x[idx] |= mask
+                if image >> (width + idx) & 1:
+                    new_z[idx] |= mask
+            if signs[pattern]:
+                flip |= mask
+        for idx, qubit in enumerate(qubits):
+            self._x[qubit] = new_x[idx]
+            self._z[qubit] = new_z[idx]
+        self._r ^= flip
+
+
+def clifford_table(matrix):
+    """Return the Pauli conjugation table of a one- or two-qubit Clifford
+
+    Paulis on k qubits are numbered by their x bits in the low k bits and
+    their z bits in the next k, qubit 0 lowest.
+
+    Parameters:
+        matrix (ndarray): Unitary in Qiskit's little-endian order
+
+    Returns:
+        tuple: Image number and sign bit of every Pauli, and the dedicated
+               tableau kernel of the gate or None
+
+    Raises:
+        ValueError: The matrix is not a Clifford
+    """
+    matrix = np.ascontiguousarray(matrix, dtype=complex)
+    key = matrix.tobytes()
+    table = _TABLES.get(key)
+    if table is None:
+        images, signs = _conjugation_table(matrix)
+        kernel = _KERNELS.get((matrix.shape[0], images.tobytes(), signs.tobytes()))
+        table = _TABLES[key] = (images, signs, kernel)
+    return table
+
+
+def _pauli_matrices(width):
+    """Matrices of every Pauli on `width` qubits in table order"""
+    out = []
+    for pattern in range(4**width):
+        matrix = np.ones((1, 1), dtype=complex)
+        for idx in range(width):
+            x = pattern >> idx & 1
+            z = pattern >> (width + idx) & 1
+            # Qubit 0 is the least significant, so it goes last
+            matrix = np.kron(_PAULIS[x + 2 * z], matrix)
+        out.append(matrix)
+    return np.array(out)
+
+
+def _conjugation_table(matrix):
+    dim = matrix.shape[0]
+    width = dim.bit_length() - 1
+    if dim not in (2, 4):
+        raise ValueError(f"Expected a one- or two-qubit gate, got dimension {dim}")
+    paulis = _pauli_matrices(width)
+    conjugated = matrix @ paulis @ matrix.conj().T
+    # Paulis are orthogonal under the trace inner product
+    overlaps = np.einsum("pij,qij->pq", conjugated, paulis.conj()) / dim
+    images = np.argmax(np.abs(overlaps), axis=1)
+    values = overlaps[np.arange(4**width), images]
+    if not np.allclose(np.abs(values), 1, atol=1e-8) or not np.allclose(
+        values.imag, 0, atol=1e-8
+    ):
+        raise ValueError("Gate is not a Clifford")
+    return images.astype(np.int64), values.real < 0
+
+
+def _pack(bits):
+    """Pack (columns, rows) bits into (columns, words) little-endian words"""
+    columns, rows = bits.shape
+    padded = np.zeros((columns, -(-rows // 64) * 64), dtype=bool)
+    padded[:, :rows] = bits
+    packed = np.packbits(padded, axis=1, bitorder="little")
+    return packed.view("<u8").astype(np.uint64)
+
+
+def _unpack(words, rows):
+    """Inverse of `_pack`"""
+    packed = np.ascontiguousarray(words.astype("<u8")).view(np.uint8)
+    return np.unpackbits(packed, axis=1, bitorder="little")[:, :rows].astype(bool)
+
+
+def _kernels():
+    sqrt2 = np.sqrt(2)
+    gates = [
+        (np.eye(2), CliffordTableau._identity),
+        (np.eye(4), CliffordTableau._identity),
+        (np.array([[1, 1], [1, -1]]) / sqrt2, CliffordTableau._h),
+        (np.diag([1, 1j]), CliffordTableau._s),
+        (np.diag([1, -1j]), CliffordTableau._sdg),
+        (_PAULIS[1], CliffordTableau._pauli_x),
+        (_PAULIS[3], CliffordTableau._pauli_y),
+        (_PAULIS[2], CliffordTableau._pauli_z),
+        # Control on the first (least significant) qubit
+        (np.eye(4)[[0, 3, 2, 1]], CliffordTableau._cx),
+        (np.diag([1, 1, 1, -1]), CliffordTableau._cz),
+        (np.eye(4)[[0, 2, 1, 3]], CliffordTableau._swap),
+    ]
+    out = {}
+    for matrix, kernel in gates:
+        images, signs = _conjugation_table(np.asarray(matrix, dtype=complex))
+        out[(matrix.shape[0], images.tobytes(), signs.tobytes())] = kernel
+    return out
+
+
+_KERNELS = _kernels()
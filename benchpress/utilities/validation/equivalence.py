@@ -0,0 +1,326 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Randomized equivalence checking of transpiled circuits against their inputs
+
+Dense unitaries stop at a handful of qubits.  Instead every trial prepares a
+random product state on the input qubits, runs the output circuit followed by
+the inverse of the input circuit as a matrix product state, and contracts the
+result against the starting product state.  Equivalent circuits return the
+state to where it started (up to the layout permutation and a global phase);
+a circuit that differs anywhere does so for almost every random product
+state.  The middle of the miter is as entangled as the circuit makes its
+inputs, so the bond dimension is capped and the check gives up, rather than
+guessing, when the cap or the time budget is hit.
+
+Clifford circuits skip all of that: their stabilizer tableaus are compared
+exactly, in time linear in the number of gates.
+"""
+
+import time
+import warnings
+
+import numpy as np
+
+from benchpress.config import Configuration
+from .clifford import CliffordTableau
+from .mps import MatrixProductState
+
+# Check transpiled outputs against their inputs in `circuit_validator`
+EQUIVALENCE_CHECK = Configuration.options["general"].get("equivalence_check", False)
+# Wall clock seconds allowed for all trials of one check
+EQUIVALENCE_TIME_BUDGET = Configuration.options["general"].get(
+    "equivalence_time_budget", 60
+)
+EQUIVALENCE_TRIALS = Configuration.options["general"].get("equivalence_trials", 3)
+EQUIVALENCE_MAX_BOND = Configuration.options["general"].get("equivalence_max_bond", 256)
+# Check Clifford inputs with the stabilizer tableau even when
+# `equivalence_check` is off, as the check is nearly free
+CLIFFORD_EQUIVALENCE_CHECK = Configuration.options["general"].get(
+    "clifford_equivalence_check", True
+)
+
+EQUIVALENT = "equivalent"
+NOT_EQUIVALENT = "not_equivalent"
+INCONCLUSIVE = "inconclusive"
+
+# Gates simulated between looks at the clock
+_CLOCK_INTERVAL = 64
+
+
+class EquivalenceResult:
+    """Outcome of an equivalence check
+
+    Attributes:
+        verdict (str): EQUIVALENT, NOT_EQUIVALENT or INCONCLUSIVE
+        trials (int): Number of random product states completed
+        fidelity (float): Smallest fidelity of a completed trial with its
+                          expected state, None if no trial completed
+        truncation_error (float): Largest fidelity lost to bond truncation
+        elapsed (float): Wall clock seconds spent
+        reason (str): Why the check was inconclusive, else None
+    """
+
+    def __init__(
+        self,
+        verdict,
+        trials=0,
+        fidelity=None,
+        truncation_error=0.0,
+        elapsed=0.0,
+        reason=None,
+    ):
+        self.verdict = verdict
+        self.trials = trials
+        self.fidelity = fidelity
+        self.truncation_error = truncation_error
+        self.elapsed = elapsed
+        self.reason = reason
+
+    def __repr__(self):
+        return (
+            f"EquivalenceResult(verdict={self.verdict!r}, trials={self.trials}, "
+            f"fidelity={self.fidelity}, truncation_error={self.truncation_error}, "
+            f"elapsed={self.elapsed:.3f}, reason={self.reason!r})"
+        )
+
+
+class _BudgetExceeded(Exception):
+    pass
+
+
+def check_equivalence(
+    input_ops,
+    output_ops,
+    num_qubits,
+    initial_layout,
+    final_layout,
+    trials=None,
+    time_budget=None,
+    max_bond=None,
+    tolerance=1e-6,
+    seed=None,
+    clifford_only=False,
+):
+    """Check that an output circuit implements an input circuit
+
+    Instructions are (matrix, qubits) pairs of one- or two-qubit unitaries,
+    matrices in Qiskit's little-endian order.  Physical qubits of the output
+    that hold no input qubit must start and end in |0>.  Circuits made of
+    Clifford gates are checked exactly with `check_clifford_equivalence`,
+    anything else by random product state simulation.
+
+    Parameters:
+        input_ops (list): Instructions of the input circuit on its own qubits
+        output_ops (list): Instructions of the output circuit on physical
+                           qubits
+        num_qubits (int): Number of qubits of the output circuit
+        initial_layout (list): Physical qubit each input qubit starts on
+        final_layout (list): Physical qubit each input qubit ends on
+        trials (int): Number of random product states, default
+                      `equivalence_trials`
+        time_budget (float): Seconds allowed for all trials, default
+                             `equivalence_time_budget`
+        max_bond (int): Largest bond dimension, default
+                        `equivalence_max_bond`
+        tolerance (float): Fidelity loss accepted as numerical noise
+        seed (int): Seed of the random product states
+        clifford_only (bool): Return INCONCLUSIVE rather than simulate
+                              circuits that are not Clifford
+
+    Returns:
+        EquivalenceResult: The outcome
+    """
+    try:
+        return check_clifford_equivalence(
+            input_ops, output_ops, num_qubits, initial_layout, final_layout
+        )
+    except ValueError as err:
+        if clifford_only:
+            return EquivalenceResult(INCONCLUSIVE, reason=str(err))
+    trials = EQUIVALENCE_TRIALS if trials is None else trials
+    time_budget = EQUIVALENCE_TIME_BUDGET if time_budget is None else time_budget
+    max_bond = EQUIVALENCE_MAX_BOND if max_bond is None else max_bond
+    start = time.perf_counter()
+    deadline = start + time_budget
+    rng = np.random.default_rng(seed)
+    # Undo the input circuit on the qubits its outputs were routed to
+    inverse_ops = [
+        (np.conj(matrix).T, [final_layout[qubit] for qubit in qubits])
+        for matrix, qubits in reversed(input_ops)
+    ]
+
+    result = EquivalenceResult(EQUIVALENT)
+    for _ in range(trials):
+        states = _random_states(rng, len(initial_layout))
+        prepared = np.zeros((num_qubits, 2), dtype=complex)
+        prepared[:, 0] = 1
+        expected = prepared.copy()
+        prepared[initial_layout] = states
+        expected[final_layout] = states
+
+        mps = MatrixProductState(prepared, max_bond=max_bond)
+        try:
+            _run(mps, output_ops, deadline)
+            _run(mps, inverse_ops, deadline)
+        except _BudgetExceeded:
+            result.verdict = INCONCLUSIVE
+            result.reason = f"time budget of {time_budget}s exceeded"
+            break
+        fidelity = abs(mps.overlap(expected)) ** 2
+        result.trials += 1
+        if result.fidelity is None or fidelity < result.fidelity:
+            result.fidelity = fidelity
+        result.truncation_error = max(result.truncation_error, mps.truncation_error)
+        # Truncation can only cost an equivalent circuit the fidelity it
+        # discarded, so anything worse is a genuine difference
+        if fidelity < 1 - tolerance - mps.truncation_error:
+            result.verdict = NOT_EQUIVALENT
+            break
+        if mps.truncation_error > tolerance:
+            result.verdict = INCONCLUSIVE
+            result.reason = f"bond dimension limit of {max_bond} reached"
+            break
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def check_clifford_equivalence(
+    input_ops, output_ops, num_qubits, initial_layout, final_layout
+):
+    """Check that an output Clifford circuit implements an input one
+
+    The output circuit followed by the inverse of the input circuit must
+    leave a stabilizer tableau that only permutes qubits as the layouts
+    say.  Arguments are as for `check_equivalence`.
+
+    Returns:
+        EquivalenceResult: EQUIVALENT or NOT_EQUIVALENT
+
+    Raises:
+        ValueError: A gate is not a Clifford
+    """
+    start = time.perf_counter()
+    tableau = CliffordTableau(num_qubits)
+    for matrix, qubits in output_ops:
+        tableau.apply(matrix, qubits)
+    for matrix, qubits in reversed(input_ops):
+        tableau.apply(np.conj(matrix).T, [final_layout[qubit] for qubit in qubits])
+    if tableau.implements_permutation(initial_layout, final_layout):
+        verdict = EQUIVALENT
+    else:
+        verdict = NOT_EQUIVALENT
+    return EquivalenceResult(verdict, trials=1, elapsed=time.perf_counter() - start)
+
+
+def clifford_circuit(circuit):
+    """Return whether a circuit of the current gym only has Clifford gates
+
+    Parameters:
+        circuit : Circuit instance of the gym's SDK
+
+    Returns:
+        bool: True for Clifford circuits, False where it cannot be told
+    """
+    gym_name = Configuration.gym_name
+    if gym_name in ["qiskit", "qiskit-ibm-transpiler"]:
+        from benchpress.qiskit_gym.utils.validation import qiskit_is_clifford
+
+        return qiskit_is_clifford(circuit)
+    if gym_name == "tket":
+        from benchpress.tket_gym.utils.validation import tket_is_clifford
+
+        return tket_is_clifford(circuit)
+    if gym_name == "bqskit":
+        from benchpress.bqskit_gym.utils.validation import bqskit_is_clifford
+
+        return bqskit_is_clifford(circuit)
+    return False
+
+
+def circuit_equivalence(input_circuit, output_circuit, layout=None, **kwargs):
+    """Check a transpiled circuit of the current gym against its input
+
+    Parameters:
+        input_circuit : Circuit given to the transpiler
+        output_circuit : Circuit returned by the transpiler
+        layout : Qubit maps the SDK returns apart from the circuit: the
+                 tket `CompilationUnit` or the BQSKit (initial, final)
+                 mappings
+        **kwargs: Options passed on to `check_equivalence`
+
+    Returns:
+        EquivalenceResult: The outcome, INCONCLUSIVE for circuits with
+                           non-unitary operations and for gyms without
+                           equivalence checking
+    """
+    gym_name = Configuration.gym_name
+    if gym_name in ["qiskit", "qiskit-ibm-transpiler"]:
+        from benchpress.qiskit_gym.utils.validation import qiskit_equivalence_problem
+
+        build_problem = qiskit_equivalence_problem
+    elif gym_name == "tket":
+        from benchpress.tket_gym.utils.validation import tket_equivalence_problem
+
+        build_problem = tket_equivalence_problem
+    elif gym_name == "bqskit":
+        from benchpress.bqskit_gym.utils.validation import bqskit_equivalence_problem
+
+        build_problem = bqskit_equivalence_problem
+    else:
+        return EquivalenceResult(
+            INCONCLUSIVE, reason=f"equivalence checking not supported for {gym_name}"
+        )
+    try:
+        problem = build_problem(input_circuit, output_circuit, layout=layout)
+    except ValueError as err:
+        return EquivalenceResult(INCONCLUSIVE, reason=str(err))
+    return check_equivalence(**problem, **kwargs)
+
+
+def validate_equivalence(input_circuit, output_circuit, layout=None, **kwargs):
+    """Raise if a transpiled circuit is shown to differ from its input
+
+    Parameters:
+        input_circuit : Circuit given to the transpiler
+        output_circuit : Circuit returned by the transpiler
+        layout : Qubit maps returned apart from the circuit, see
+                 `circuit_equivalence`
+        **kwargs: Options passed on to `check_equivalence`
+
+    Returns:
+        EquivalenceResult: The outcome
+    """
+    result = circuit_equivalence(input_circuit, output_circuit, layout, **kwargs)
+    if result.verdict == NOT_EQUIVALENT:
+        message = "Output circuit is not equivalent to the input circuit"
+        if result.fidelity is not None:
+            message += f" (fidelity {result.fidelity:.6f})"
+        raise Exception(message)
+    if result.verdict == INCONCLUSIVE:
+        warnings.warn(f"Equivalence check inconclusive: {result.reason}")
+    return result
+
+
+def _random_states(rng, num_qubits):
+    """Haar random single-qubit states"""
+    states = rng.normal(size=(num_qubits, 2)) + 1j * rng.normal(size=(num_qubits, 2))
+    return states / np.linalg.norm(states, axis=1, keepdims=True)
+
+
+def _run(mps, ops, deadline):
+    for index, (matrix, qubits) in enumerate(ops):
+        if not index % _CLOCK_INTERVAL and time.perf_counter() > deadline:
+            raise _BudgetExceeded
+        if len(qubits) == 1:
+            mps.apply_1q(matrix, qubits[0])
+        else:
+            mps.apply_2q(matrix, qubits[0], qubits[1])
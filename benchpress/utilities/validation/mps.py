@@ -0,0 +1,162 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Matrix product state simulation of circuits of one- and two-qubit gates"""
+
+import numpy as np
+
+SWAP = np.eye(4, dtype=complex)[[0, 2, 1, 3]].reshape(2, 2, 2, 2)
+
+
+class MatrixProductState:
+    """A pure state of qubits as a chain of site tensors kept in mixed
+    canonical form
+
+    Qubits are not tied to sites: two-qubit gates move one of their qubits
+    next to the other with swaps and leave it there, so the qubit held by
+    each site changes as gates are applied.
+
+    Attributes:
+        num_qubits (int): Number of qubits
+        max_bond (int): Largest bond dimension kept after a truncation
+        cutoff (float): Discarded weight allowed per truncation without
+                        reaching the bond limit
+        truncation_error (float): Upper bound on one minus the fidelity of
+                                  the simulated state with the exact one
+    """
+
+    def __init__(self, states, max_bond=256, cutoff=1e-12):
+        """Create a product state
+
+        Parameters:
+            states (array_like): (num_qubits, 2) single-qubit state of each
+                                 qubit
+            max_bond (int): Largest bond dimension to keep
+            cutoff (float): Discarded weight allowed per truncation
+        """
+        states = np.asarray(states, dtype=complex)
+        self.num_qubits = states.shape[0]
+        self.max_bond = max_bond
+        self.cutoff = cutoff
+        self.truncation_error = 0.0
+        self._tensors = [state.reshape(1, 2, 1).copy() for state in states]
+        self._site = list(range(self.num_qubits))
+        self._qubit = list(range(self.num_qubits))
+        self._center = 0
+        self._fidelity = 1.0
+
+    def bond_dimension(self):
+        """Return the largest bond dimension of the chain"""
+        return max(tensor.shape[2] for tensor in self._tensors)
+
+    def apply_1q(self, matrix, qubit):
+        """Apply a single-qubit gate
+
+        Parameters:
+            matrix (ndarray): 2x2 unitary
+            qubit (int): Qubit acted on
+        """
+        site = self._site[qubit]
+        self._tensors[site] = np.einsum("ji,aib->ajb", matrix, self._tensors[site])
+
+    def apply_2q(self, matrix, qubit0, qubit1):
+        """Apply a two-qubit gate
+
+        Parameters:
+            matrix (ndarray): 4x4 unitary, `qubit0` the least significant
+                              bit as in Qiskit
+            qubit0 (int): First qubit acted on
+            qubit1 (int): Second qubit acted on
+        """
+        # [out1, out0, in1, in0] -> [out0, out1, in0, in1]
+        gate = np.asarray(matrix).reshape(2, 2, 2, 2).transpose(1, 0, 3, 2)
+        site0 = self._site[qubit0]
+        site1 = self._site[qubit1]
+        # Walk qubit1 towards qubit0 until the two sit on neighbouring sites
+        step = 1 if site1 < site0 else -1
+        while abs(site0 - site1) > 1:
+            left = min(site1, site1 + step)
+            self._apply_sites(SWAP, left)
+            self._swap_labels(left)
+            site1 += step
+        if site0 < site1:
+            self._apply_sites(gate, site0)
+        else:
+            self._apply_sites(gate.transpose(1, 0, 3, 2), site1)
+
+    def overlap(self, states):
+        """Return the inner product with a product state
+
+        Parameters:
+            states (array_like): (num_qubits, 2) single-qubit state of each
+                                 qubit
+
+        Returns:
+            complex: <states|self>
+        """
+        states = np.asarray(states, dtype=complex)
+        env = np.ones(1, dtype=complex)
+        for site, tensor in enumerate(self._tensors):
+            bra = states[self._qubit[site]].conj()
+            env = np.einsum("a,i,aib->b", env, bra, tensor)
+        return complex(env[0])
+
+    def _swap_labels(self, left):
+        qubit0, qubit1 = self._qubit[left], self._qubit[left + 1]
+        self._qubit[left], self._qubit[left + 1] = qubit1, qubit0
+        self._site[qubit0], self._site[qubit1] = left + 1, left
+
+    def _move_center(self, site):
+        """Orthogonalize every tensor but the one at `site`"""
+        tensors = self._tensors
+        while self._center < site:
+            k = self._center
+            left, phys, right = tensors[k].shape
+            q, r = np.linalg.qr(tensors[k].reshape(left * phys, right))
+            tensors[k] = q.reshape(left, phys, -1)
+            tensors[k + 1] = np.einsum("rb,bjc->rjc", r, tensors[k + 1])
+            self._center += 1
+        while self._center > site:
+            k = self._center
+            left, phys, right = tensors[k].shape
+            q, r = np.linalg.qr(tensors[k].reshape(left, phys * right).T)
+            tensors[k] = q.T.reshape(-1, phys, right)
+            tensors[k - 1] = np.einsum("aib,rb->air", tensors[k - 1], r)
+            self._center -= 1
+
+    def _apply_sites(self, gate, left):
+        """Apply a [out0, out1, in0, in1] gate to sites left and left + 1
+        and truncate the bond between them"""
+        self._move_center(left)
+        tensors = self._tensors
+        theta = np.einsum("aib,bjc->aijc", tensors[left], tensors[left + 1])
+        theta = np.einsum("xyij,aijc->axyc", gate, theta)
+        dim_left = theta.shape[0]
+        dim_right = theta.shape[3]
+        u, s, vh = np.linalg.svd(
+            theta.reshape(dim_left * 2, 2 * dim_right), full_matrices=False
+        )
+        weights = s**2
+        total = weights.sum()
+        # Smallest rank whose discarded weight is within the cutoff
+        tail = np.cumsum(weights[::-1])[::-1] / total
+        keep = max(1, int(np.count_nonzero(tail > self.cutoff)))
+        keep = min(keep, self.max_bond)
+        if keep < s.shape[0]:
+            kept = weights[:keep].sum() / total
+            self._fidelity *= kept
+            self.truncation_error = 1.0 - self._fidelity
+            u = u[:, :keep]
+            s = s[:keep] / np.sqrt(kept * total)
+            vh = vh[:keep]
+        tensors[left] = u.reshape(dim_left, 2, keep)
+        tensors[left + 1] = (s[:, None] * vh).reshape(keep, 2, dim_right)
+        self._center = left + 1
@@ -0,0 +1,122 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Vectorized gate set and topology validation"""
+
+import numpy as np
+
+# (backend, AdjacencyBitmap) pairs keyed on the backend's id; holding the
+# backend keeps the id from being reused
+_ADJACENCY = {}
+
+
+class AdjacencyBitmap:
+    """Coupling graph of a device as a packed bit matrix"""
+
+    def __init__(self, num_qubits, edges, symmetric=False):
+        """Create an AdjacencyBitmap
+
+        Parameters:
+            num_qubits (int): Number of qubits in the device
+            edges (array_like): (E, 2) allowed (control, target) pairs
+            symmetric (bool): Also allow every edge in the reverse direction
+        """
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        if symmetric:
+            edges = np.concatenate([edges, edges[:, ::-1]])
+        self.num_qubits = num_qubits
+        # Row q0 holds bit q1 & 7 of byte q1 >> 3 for every edge (q0, q1)
+        self._bits = np.zeros((num_qubits, (num_qubits + 7) // 8), dtype=np.uint8)
+        np.bitwise_or.at(
+            self._bits,
+            (edges[:, 0], edges[:, 1] >> 3),
+            (1 << (edges[:, 1] & 7)).astype(np.uint8),
+        )
+
+    def contains(self, pairs):
+        """Return a boolean mask of the pairs that are device edges
+
+        Parameters:
+            pairs (array_like): (N, 2) qubit pairs
+
+        Returns:
+            ndarray: True for pairs on an edge of the device
+        """
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        q0 = pairs[:, 0]
+        q1 = pairs[:, 1]
+        out = (pairs >= 0).all(axis=1) & (pairs < self.num_qubits).all(axis=1)
+        q0 = q0[out]
+        q1 = q1[out]
+        out[out] = ((self._bits[q0, q1 >> 3] >> (q1 & 7)) & 1).astype(bool)
+        return out
+
+
+def get_adjacency(backend, edge_source):
+    """Return the adjacency bitmap of a backend, building it at most once
+    per backend object
+
+    Parameters:
+        backend: Target backend of any SDK
+        edge_source (callable): Function of the backend returning
+                                (num_qubits, edges, symmetric)
+
+    Returns:
+        AdjacencyBitmap: The bitmap
+    """
+    key = id(backend)
+    if key not in _ADJACENCY:
+        _ADJACENCY[key] = (backend, AdjacencyBitmap(*edge_source(backend)))
+    return _ADJACENCY[key][1]
+
+
+def validate_gate_set(names, basis_gates):
+    """Raise if operations are outside a basis set
+
+    Parameters:
+        names (iterable): Operation names in the circuit
+        basis_gates (iterable): Allowed operation names
+    """
+    diff_set = set(names).difference(basis_gates)
+    if diff_set:
+        raise Exception(f"Circuit has gates outside backend basis set {diff_set}")
+
+
+def validate_edges(pairs, adjacency):
+    """Raise if any qubit pair is not an edge of the device
+
+    Parameters:
+        pairs (array_like): (N, 2) qubit pairs of 2Q gates
+        adjacency (AdjacencyBitmap): Device coupling graph
+    """
+    pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+    invalid = ~adjacency.contains(pairs)
+    if invalid.any():
+        edge = tuple(pairs[np.argmax(invalid)].tolist())
+        raise Exception(f"2Q gate edge {edge} not in backend topology")
+
+
+def validate_circuit_arrays(arrays, basis_gates, two_qubit_gate, adjacency):
+    """Validate the gate set and 2Q edges of a circuit
+
+    Parameters:
+        arrays (CircuitArrays): The circuit
+        basis_gates (iterable): Allowed operation names
+        two_qubit_gate (str): Name of the 2Q gate whose edges are checked
+        adjacency (AdjacencyBitmap): Device coupling graph
+
+    Returns:
+        bool: True, errors are raised
+    """
+    validate_gate_set(arrays.names, basis_gates)
+    mask = arrays.mask(two_qubit_gate) & (arrays.widths == 2)
+    validate_edges(arrays.qubits[mask], adjacency)
+    return True
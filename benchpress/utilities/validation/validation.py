@@ -12,15 +12,28 @@
 """Basic circuit validation"""
 
 from benchpress.config import Configuration
+from .equivalence import (
+    CLIFFORD_EQUIVALENCE_CHECK,
+    EQUIVALENCE_CHECK,
+    clifford_circuit,
+    validate_equivalence,
+)
 
 
-def circuit_validator(circuit, backend):
+def circuit_validator(circuit, backend, input_circuit=None, layout=None):
     """Validate a circuit matches the gate set and
     topology of the target backend
 
+    With `equivalence_check` enabled the circuit is also checked to
+    implement the circuit it was transpiled from; Clifford circuits are
+    checked unless `clifford_equivalence_check` is disabled.
+
     Parameters:
         circuit : Input circuit
         backend : Target backend
+        input_circuit : Circuit before transpilation, if any
+        layout : Qubit maps the SDK returns apart from the circuit, see
+                 `circuit_equivalence`
     """
     gym_name = Configuration.gym_name
     if gym_name in ["qiskit", "qiskit-ibm-transpiler"]:
@@ -47,4 +60,9 @@ def circuit_validator(circuit, backend):
         qpanda_circuit_validation(circuit, backend)
     else:
         raise ValueError(f"Unknown gym name {gym_name}")
+    if input_circuit is not None:
+        if EQUIVALENCE_CHECK:
+            validate_equivalence(input_circuit, circuit, layout)
+        elif CLIFFORD_EQUIVALENCE_CHECK and clifford_circuit(input_circuit):
+            validate_equivalence(input_circuit, circuit, layout, clifford_only=True)
     return True
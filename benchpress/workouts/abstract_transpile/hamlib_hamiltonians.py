@@ -11,23 +11,17 @@
 # that they have been altered from the originals.
 """Test transpilation against a device"""
 import copy
-import json
 
 import pytest
-from qiskit.quantum_info import SparsePauliOp
 
 from benchpress.config import Configuration
+from benchpress.utilities.io import hamlib_records
 
 TOPOLOGY_NAMES = Configuration.options["general"]["abstract_topologies"]
 
 
 def hamlib_parameters():
-    directory = Configuration.get_hamiltonian_dir("hamlib")
-    ham_records = json.load(open(directory + "100_representative.json", "r"))
-    for h in ham_records:
-        terms = h.pop("ham_hamlib_hamiltonian_terms")
-        coefficients = h.pop("ham_hamlib_hamiltonian_coefficients")
-        h["ham_hamlib_hamiltonian"] = SparsePauliOp(terms, coefficients)
+    ham_records = hamlib_records()
 
     hams_and_topo = []
     test_ids = []
@@ -11,5 +11,5 @@
 # that they have been altered from the originals.
 
 from .device_transpile_100Q import WorkoutDeviceTranspile100Q
-from .feynman import WorkoutDeviceFeynman
-from .hamlib_hamiltonians import WorkoutDeviceHamlibHamiltonians
+from .feynman import WorkoutDeviceFeynman, feynman_parameters
+from .hamlib_hamiltonians import WorkoutDeviceHamlibHamiltonians, hamlib_parameters
@@ -12,6 +12,29 @@
 """Test transpilation against a device"""
 import pytest
 
+from benchpress.config import Configuration
+from benchpress.utilities.io import get_manifest
+
+
+def feynman_parameters():
+    """Feynman circuit file names to parametrize over
+
+    Each file carries a `circuit` mark with its manifest statistics so that
+    oversized cases can be deselected at collection time without parsing.
+    """
+    manifest = get_manifest(Configuration.get_qasm_dir("feynman"))
+    return [
+        pytest.param(
+            filename,
+            marks=pytest.mark.circuit(
+                num_qubits=entry["num_qubits"],
+                size=entry["size"],
+                gate_count_2q=entry["gate_count_2q"],
+            ),
+        )
+        for filename, entry in manifest.items()
+    ]
+
 
 @pytest.mark.benchmark(group="Transpile - Device")
 class WorkoutDeviceFeynman:
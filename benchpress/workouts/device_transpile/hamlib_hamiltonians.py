@@ -10,8 +10,23 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 """Test transpilation against a device"""
+import copy
+
 import pytest
 
+from benchpress.utilities.io import hamlib_records
+
+
+def hamlib_parameters():
+    """HamLib records and test ids to parametrize device tests over
+
+    Records only hold metadata; the operator is built by the test that
+    runs it, see `HamiltonianRecord.operator`.
+    """
+    ham_records = [copy.copy(ham) for ham in hamlib_records()]
+    test_ids = ["ham_" + ham["ham_instance"][1:-1] for ham in ham_records]
+    return ham_records, test_ids
+
 
 @pytest.mark.benchmark(group="Transpile - Device")
 class WorkoutDeviceHamlibHamiltonians:
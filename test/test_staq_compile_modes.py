@@ -0,0 +1,43 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Check that the staq compile modes agree
+
+Run with `pytest test/test_staq_compile_modes.py` after changing the pass
+sequence of `_pystaq_compile`, or when upgrading pystaq or staq.
+"""
+
+import shutil
+
+import pytest
+
+pytest.importorskip("pystaq")
+
+
+@pytest.mark.skipif(shutil.which("staq") is None, reason="staq executable not found")
+def test_compile_modes_agree():
+    """The 'pystaq' and 'subprocess' modes compile a summit circuit the same"""
+    from benchpress.config import Configuration
+    from benchpress.staq_gym.utils.compile import staq_compile
+    from benchpress.staq_gym.utils.staq_backend_utils import (
+        get_staq_bench_backend,
+        staq_device_file,
+    )
+    from benchpress.utilities.io import uncompressed_qasm_file
+
+    backend_name = Configuration.options["general"]["backend_name"]
+    device = staq_device_file(get_staq_bench_backend(backend_name))
+    input_qasm_file = uncompressed_qasm_file(
+        Configuration.get_qasm_dir("qft") + "qft_N100.qasm"
+    )
+    pystaq_qasm = staq_compile(input_qasm_file, device, mode="pystaq")
+    subprocess_qasm = staq_compile(input_qasm_file, device, mode="subprocess")
+    assert pystaq_qasm.strip() == subprocess_qasm.strip()